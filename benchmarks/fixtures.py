@@ -0,0 +1,206 @@
+import honeycomb_io.testing
+import pandas as pd
+import numpy as np
+import datetime
+import json
+import random
+import uuid
+
+START = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+SAMPLE_INTERVAL = datetime.timedelta(milliseconds=100)
+NUM_DEVICES = 20
+NUM_KEYPOINTS = 17
+
+def generate_ids(num_ids, seed=0):
+    rng = random.Random(seed)
+    return [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(num_ids)]
+
+def generate_devices(num_devices=NUM_DEVICES, seed=0):
+    rng = random.Random(seed)
+    device_ids = generate_ids(num_devices, seed=seed)
+    return [
+        {
+            'device_id': device_id,
+            'part_number': 'UWBTAG-PART',
+            'serial_number': '{:012x}'.format(rng.getrandbits(48)),
+            'tag_id': str(index),
+            'name': 'uwbtag-{}'.format(index),
+            'mac_address': ':'.join(['{:02x}'.format(rng.getrandbits(8)) for _ in range(6)])
+        }
+        for index, device_id in enumerate(device_ids)
+    ]
+
+def generate_timestamp_strings(num_rows, num_devices=NUM_DEVICES):
+    timestamps = pd.date_range(
+        start=START,
+        periods=num_rows // num_devices + 1,
+        freq=pd.Timedelta(SAMPLE_INTERVAL)
+    ).strftime('%Y-%m-%dT%H:%M:%S.%fZ').tolist()
+    return [timestamps[row_index // num_devices] for row_index in range(num_rows)]
+
+def generate_datetimes(num_rows, num_devices=NUM_DEVICES):
+    timestamps = pd.date_range(
+        start=START,
+        periods=num_rows // num_devices + 1,
+        freq=pd.Timedelta(SAMPLE_INTERVAL)
+    ).to_pydatetime().tolist()
+    return [timestamps[row_index // num_devices] for row_index in range(num_rows)]
+
+# Raw observations as produced by the CUWB network socket listener
+def generate_raw_cuwb_data(num_rows, data_type, num_devices=NUM_DEVICES, seed=0):
+    rng = random.Random(seed)
+    devices = generate_devices(num_devices, seed=seed)
+    timestamps = generate_timestamp_strings(num_rows, num_devices)
+    raw_data = [
+        honeycomb_io.testing.synthetic_raw_uwb_row(
+            rng=rng,
+            row_type=data_type,
+            timestamp=timestamps[row_index],
+            serial_number=devices[row_index % num_devices]['serial_number'],
+            network_time=row_index
+        )
+        for row_index in range(num_rows)
+    ]
+    device_id_lookup = {device['serial_number']: device['device_id'] for device in devices}
+    return raw_data, device_id_lookup
+
+# Position and IMU records as returned by the Honeycomb search endpoints
+def generate_fetched_position_data(num_rows, num_devices=NUM_DEVICES, seed=0):
+    rng = random.Random(seed)
+    devices = generate_devices(num_devices, seed=seed)
+    timestamps = generate_timestamp_strings(num_rows, num_devices)
+    position_ids = generate_ids(num_rows, seed=seed + 1)
+    coordinate_space = {'space_id': generate_ids(1, seed=seed + 2)[0]}
+    return [
+        {
+            'position_id': position_ids[row_index],
+            'timestamp': timestamps[row_index],
+            'socket_read_time': timestamps[row_index],
+            'network_time': str(row_index),
+            'coordinate_space': coordinate_space,
+            'object': devices[row_index % num_devices],
+            'coordinates': [rng.uniform(0, 10), rng.uniform(0, 10), rng.uniform(0, 2)],
+            'quality': rng.randrange(100, 1000),
+            'anchor_count': rng.randrange(3, 8)
+        }
+        for row_index in range(num_rows)
+    ]
+
+def generate_fetched_imu_data(num_rows, id_field_name, num_devices=NUM_DEVICES, seed=0):
+    rng = random.Random(seed)
+    devices = generate_devices(num_devices, seed=seed)
+    timestamps = generate_timestamp_strings(num_rows, num_devices)
+    data_ids = generate_ids(num_rows, seed=seed + 1)
+    return [
+        {
+            id_field_name: data_ids[row_index],
+            'timestamp': timestamps[row_index],
+            'socket_read_time': timestamps[row_index],
+            'network_time': str(row_index),
+            'device': devices[row_index % num_devices],
+            'data': [rng.uniform(-2, 2), rng.uniform(-2, 2), rng.uniform(-2, 2)]
+        }
+        for row_index in range(num_rows)
+    ]
+
+def generate_assignments(num_assignments, num_environments=10, seed=0):
+    rng = random.Random(seed)
+    environments = [
+        {'environment_id': environment_id, 'name': 'environment-{}'.format(index)}
+        for index, environment_id in enumerate(generate_ids(num_environments, seed=seed))
+    ]
+    assignment_ids = generate_ids(num_assignments, seed=seed + 1)
+    assignments = list()
+    for assignment_index, assignment_id in enumerate(assignment_ids):
+        start = START + datetime.timedelta(days=rng.randrange(0, 365))
+        end = start + datetime.timedelta(days=rng.randrange(1, 90)) if rng.random() < 0.5 else None
+        assignments.append({
+            'assignment_id': assignment_id,
+            'environment': environments[assignment_index % num_environments],
+            'start': start.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
+            'end': end.strftime('%Y-%m-%dT%H:%M:%S.%fZ') if end is not None else None
+        })
+    return assignments, environments[0]['environment_id']
+
+# Time-indexed device data with a few assignment periods per device, as used
+# by the CUWB processing pipeline
+def generate_assignment_lookup_data(num_rows, num_devices=NUM_DEVICES, assignments_per_device=4, seed=0):
+    devices = generate_devices(num_devices, seed=seed)
+    timestamps = pd.to_datetime(generate_timestamp_strings(num_rows, num_devices), utc=True)
+    df = pd.DataFrame({
+        'device_id': [devices[row_index % num_devices]['device_id'] for row_index in range(num_rows)],
+        'x': np.random.default_rng(seed).uniform(0, 10, num_rows)
+    }, index=timestamps)
+    boundaries = pd.date_range(
+        start=timestamps.min(),
+        end=timestamps.max() + pd.Timedelta(seconds=1),
+        periods=assignments_per_device + 1
+    )
+    assignment_ids = iter(generate_ids(num_devices*assignments_per_device, seed=seed + 1))
+    assignments_dict = {
+        device['device_id']: [
+            {
+                'assignment_id': next(assignment_ids),
+                'start': boundaries[period_index],
+                'end': boundaries[period_index + 1] if period_index < assignments_per_device - 1 else None
+            }
+            for period_index in range(assignments_per_device)
+        ]
+        for device in devices
+    }
+    return df, assignments_dict
+
+def generate_poses_3d(num_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    keypoint_coordinates = rng.uniform(0, 5, size=(num_rows, NUM_KEYPOINTS, 3))
+    keypoint_coordinates[rng.uniform(size=(num_rows, NUM_KEYPOINTS)) < 0.1] = np.nan
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start=START, periods=num_rows, freq=pd.Timedelta(SAMPLE_INTERVAL)),
+        'keypoint_coordinates_3d': list(keypoint_coordinates),
+        'pose_2d_ids': [generate_ids(2, seed=row_index) for row_index in range(min(num_rows, 100))]*(num_rows // 100) +
+            [generate_ids(2, seed=row_index) for row_index in range(num_rows % 100)]
+    })
+
+# Accepts mutations without sending them anywhere, so that write benchmarks
+# measure only the work done before the network round trip (including the
+# JSON encoding of each chunk)
+class NullHoneycombClient:
+    def bulk_mutation(
+        self,
+        request_name,
+        arguments,
+        return_object,
+        chunk_size=100
+    ):
+        num_mutations = max([
+            len(argument_info['value'])
+            for argument_info in arguments.values()
+            if isinstance(argument_info['value'], list)
+        ] + [1])
+        return [{return_object[0]: str(index)} for index in range(num_mutations)]
+
+    def compound_request(
+        self,
+        parent_request_type,
+        parent_request_name,
+        child_request_list
+    ):
+        json.dumps([child_request['arguments'] for child_request in child_request_list])
+        return {
+            'return_object_{}'.format(index): {child_request['return_object'][0]: str(index)}
+            for index, child_request in enumerate(child_request_list)
+        }
+
+def seed_stand_in(server, num_rows, seed=0):
+    return server.honeycomb.seed(
+        num_uwb_tags=NUM_DEVICES,
+        num_position_rows=num_rows,
+        num_imu_rows=0,
+        num_uwb_datapoints=max(num_rows // 10000, 1),
+        uwb_rows_per_datapoint=min(num_rows, 10000),
+        num_pose_2d_rows=0,
+        num_material_interactions=0,
+        start=START,
+        sample_interval=SAMPLE_INTERVAL,
+        seed=seed
+    )
@@ -0,0 +1,409 @@
+import fixtures
+import honeycomb_io
+import honeycomb_io.testing
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+DEFAULT_REPEAT = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+DEFAULT_MAX_SECONDS = 60.0
+
+# Each benchmark builds its inputs in setup (untimed), then times run on
+# those inputs. Benchmarks which move data through the stand-in server are
+# capped in size because the stand-in holds everything in memory
+class Benchmark:
+    def __init__(
+        self,
+        name,
+        setup,
+        run,
+        teardown=None,
+        max_size=None,
+        sizes=None
+    ):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.teardown = teardown
+        self.max_size = max_size
+        self.sizes = sizes
+
+BENCHMARKS = list()
+
+def register_benchmark(
+    name,
+    setup,
+    run,
+    teardown=None,
+    max_size=None,
+    sizes=None
+):
+    BENCHMARKS.append(Benchmark(
+        name=name,
+        setup=setup,
+        run=run,
+        teardown=teardown,
+        max_size=max_size,
+        sizes=sizes
+    ))
+
+# UWB parsers
+for data_type, parser in [
+    ('position', lambda raw_data, device_id_lookup: honeycomb_io.uwb_data.parse_raw_position_data(
+        raw_position_data=raw_data,
+        device_id_lookup=device_id_lookup,
+        coordinate_space_id='benchmark-coordinate-space'
+    )),
+    ('accelerometer', lambda raw_data, device_id_lookup: honeycomb_io.uwb_data.parse_raw_accelerometer_data(
+        raw_accelerometer_data=raw_data,
+        device_id_lookup=device_id_lookup
+    )),
+    ('gyroscope', lambda raw_data, device_id_lookup: honeycomb_io.uwb_data.parse_raw_gyroscope_data(
+        raw_gyroscope_data=raw_data,
+        device_id_lookup=device_id_lookup
+    )),
+    ('magnetometer', lambda raw_data, device_id_lookup: honeycomb_io.uwb_data.parse_raw_magnetometer_data(
+        raw_magnetometer_data=raw_data,
+        device_id_lookup=device_id_lookup
+    ))
+]:
+    register_benchmark(
+        name='parse_raw_{}_data'.format(data_type),
+        setup=lambda size, data_type=data_type: fixtures.generate_raw_cuwb_data(size, data_type),
+        run=lambda inputs, parser=parser: parser(*inputs)
+    )
+    register_benchmark(
+        name='parse_raw_cuwb_{}_data_columns'.format(data_type),
+        setup=lambda size, data_type=data_type: fixtures.generate_raw_cuwb_data(size, data_type),
+        run=lambda inputs, data_type=data_type: honeycomb_io.uwb_data.parse_raw_cuwb_data_columns(
+            raw_data=inputs[0],
+            data_type=data_type,
+            device_id_lookup=inputs[1],
+            coordinate_space_id='benchmark-coordinate-space',
+            output_format='columns'
+        )
+    )
+    register_benchmark(
+        name='generate_cuwb_{}_dataframe_from_parsed_data_list'.format(data_type),
+        setup=lambda size, data_type=data_type, parser=parser: parser(*fixtures.generate_raw_cuwb_data(size, data_type)),
+        run=lambda parsed_data, data_type=data_type: honeycomb_io.uwb_data.generate_cuwb_dataframe_from_parsed_data_list(
+            data=parsed_data,
+            data_type=data_type
+        )
+    )
+
+# Dataframe builders for fetched data
+register_benchmark(
+    name='generate_cuwb_position_dataframe',
+    setup=lambda size: fixtures.generate_fetched_position_data(size),
+    run=lambda data: honeycomb_io.uwb_data.generate_cuwb_position_dataframe(data)
+)
+for data_type in ['accelerometer', 'gyroscope', 'magnetometer']:
+    register_benchmark(
+        name='generate_cuwb_{}_dataframe'.format(data_type),
+        setup=lambda size, data_type=data_type: fixtures.generate_fetched_imu_data(
+            size,
+            id_field_name='{}_data_id'.format(data_type)
+        ),
+        run=lambda data, data_type=data_type: getattr(
+            honeycomb_io.uwb_data,
+            'generate_cuwb_{}_dataframe'.format(data_type)
+        )(data)
+    )
+register_benchmark(
+    name='generate_device_dataframe',
+    setup=lambda size: fixtures.generate_devices(size),
+    run=lambda devices: honeycomb_io.devices.generate_device_dataframe(devices)
+)
+
+# Datetime conversion
+register_benchmark(
+    name='to_honeycomb_datetime',
+    setup=lambda size: fixtures.generate_datetimes(size),
+    run=lambda datetimes: [honeycomb_io.utils.to_honeycomb_datetime(timestamp) for timestamp in datetimes]
+)
+register_benchmark(
+    name='to_honeycomb_datetimes',
+    setup=lambda size: fixtures.generate_datetimes(size),
+    run=lambda datetimes: honeycomb_io.utils.to_honeycomb_datetimes(datetimes)
+)
+register_benchmark(
+    name='from_honeycomb_datetimes',
+    setup=lambda size: fixtures.generate_timestamp_strings(size),
+    run=lambda timestamps: honeycomb_io.utils.from_honeycomb_datetimes(timestamps)
+)
+
+# Assignment handling
+register_benchmark(
+    name='filter_assignments',
+    setup=lambda size: fixtures.generate_assignments(size),
+    run=lambda inputs: honeycomb_io.environments.filter_assignments(
+        assignments=inputs[0],
+        environment_id=inputs[1],
+        start=fixtures.START + datetime.timedelta(days=90),
+        end=fixtures.START + datetime.timedelta(days=180)
+    )
+)
+register_benchmark(
+    name='add_assignment_ids',
+    setup=lambda size: fixtures.generate_assignment_lookup_data(size),
+    run=lambda inputs: honeycomb_io.uwb_data.add_assignment_ids(
+        df=inputs[0],
+        assignments_dict=inputs[1]
+    )
+)
+
+# Pose writes, excluding the network round trip
+register_benchmark(
+    name='write_3d_pose_data_serialization',
+    setup=lambda size: fixtures.generate_poses_3d(size),
+    run=lambda poses_3d_df: honeycomb_io.poses.write_3d_pose_data(
+        poses_3d_df=poses_3d_df,
+        coordinate_space_id='benchmark-coordinate-space',
+        pose_model_id='benchmark-pose-model',
+        source_id='benchmark-source',
+        source_type='GENERATED',
+        client=fixtures.NullHoneycombClient()
+    )
+)
+
+# Package import time, measured in a fresh interpreter. Importing the package
+# (or a single lightweight function) must not pull in boto3
+IMPORT_STATEMENTS = {
+    'import_honeycomb_io': 'import honeycomb_io',
+    'import_fetch_environment_id': 'from honeycomb_io import fetch_environment_id'
+}
+
+def run_import(statement):
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            '{}; import sys; sys.exit(\'boto3\' in sys.modules)'.format(statement)
+        ],
+        check=True
+    )
+
+for name, statement in IMPORT_STATEMENTS.items():
+    register_benchmark(
+        name=name,
+        setup=lambda size, statement=statement: statement,
+        run=run_import,
+        sizes=[1]
+    )
+
+# End-to-end fetches against the stand-in server
+def setup_stand_in(size):
+    server = honeycomb_io.testing.StandInHoneycombServer().start()
+    server.set_environment_variables()
+    environments = fixtures.seed_stand_in(server, size)
+    return {
+        'server': server,
+        'client': server.generate_client(),
+        'environment_name': list(environments.keys())[0],
+        'environment_id': list(environments.values())[0],
+        'size': size
+    }
+
+def teardown_stand_in(inputs):
+    inputs['server'].stop()
+
+def fetch_all_cuwb_position_data(inputs):
+    return honeycomb_io.uwb_data.fetch_cuwb_position_data(
+        start=fixtures.START,
+        end=fixtures.START + (inputs['size'] // fixtures.NUM_DEVICES + 1)*fixtures.SAMPLE_INTERVAL,
+        environment_id=inputs['environment_id'],
+        output_format='dataframe',
+        client=inputs['client']
+    )
+
+def fetch_all_uwb_data(inputs):
+    data_ids = [
+        datapoint['data_id']
+        for datapoint in honeycomb_io.core.fetch_all_objects(
+            object_name='Datapoint',
+            return_data=['data_id'],
+            client=inputs['client']
+        )
+    ]
+    return [
+        honeycomb_io.uwb_data.fetch_uwb_data_data_id(
+            data_id=data_id,
+            client=inputs['client']
+        )
+        for data_id in data_ids
+    ]
+
+register_benchmark(
+    name='fetch_cuwb_position_data',
+    setup=setup_stand_in,
+    run=fetch_all_cuwb_position_data,
+    teardown=teardown_stand_in,
+    max_size=100000
+)
+register_benchmark(
+    name='fetch_uwb_data_data_id',
+    setup=setup_stand_in,
+    run=fetch_all_uwb_data,
+    teardown=teardown_stand_in,
+    max_size=100000
+)
+
+# Slow benchmarks at large sizes stop repeating once the time budget is spent
+def run_benchmark(
+    benchmark,
+    size,
+    repeat=DEFAULT_REPEAT,
+    max_seconds=DEFAULT_MAX_SECONDS
+):
+    inputs = benchmark.setup(size)
+    try:
+        durations = list()
+        while len(durations) < repeat and (len(durations) == 0 or sum(durations) < max_seconds):
+            gc.collect()
+            start_time = time.perf_counter()
+            benchmark.run(inputs)
+            durations.append(time.perf_counter() - start_time)
+    finally:
+        if benchmark.teardown is not None:
+            benchmark.teardown(inputs)
+    del inputs
+    gc.collect()
+    return {
+        'benchmark': benchmark.name,
+        'size': size,
+        'repeat': len(durations),
+        'min_seconds': min(durations),
+        'median_seconds': statistics.median(durations),
+        'rows_per_second': size/min(durations) if min(durations) > 0 else None
+    }
+
+def run_benchmarks(
+    sizes=DEFAULT_SIZES,
+    benchmark_names=None,
+    repeat=DEFAULT_REPEAT,
+    max_seconds=DEFAULT_MAX_SECONDS,
+    max_stand_in_size=None
+):
+    results = list()
+    for benchmark in BENCHMARKS:
+        if benchmark_names is not None and not any([name in benchmark.name for name in benchmark_names]):
+            continue
+        max_size = max_stand_in_size if benchmark.max_size is not None and max_stand_in_size is not None else benchmark.max_size
+        for size in (benchmark.sizes if benchmark.sizes is not None else sizes):
+            if max_size is not None and size > max_size:
+                logger.info('Skipping {} at {} rows (maximum {})'.format(benchmark.name, size, max_size))
+                continue
+            logger.info('Running {} at {} rows'.format(benchmark.name, size))
+            result = run_benchmark(
+                benchmark=benchmark,
+                size=size,
+                repeat=repeat,
+                max_seconds=max_seconds
+            )
+            logger.info('{} at {} rows: {:.3f} s (median {:.3f} s)'.format(
+                benchmark.name,
+                size,
+                result['min_seconds'],
+                result['median_seconds']
+            ))
+            results.append(result)
+    return {
+        'metadata': {
+            'honeycomb_io_version': honeycomb_io.__version__,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
+        },
+        'results': results
+    }
+
+# Compares minimum times against a previous results file and returns the
+# benchmarks which slowed down by more than the threshold
+def compare_results(
+    results,
+    baseline,
+    threshold=DEFAULT_REGRESSION_THRESHOLD
+):
+    baseline_lookup = {
+        (result['benchmark'], result['size']): result
+        for result in baseline['results']
+    }
+    regressions = list()
+    for result in results['results']:
+        baseline_result = baseline_lookup.get((result['benchmark'], result['size']))
+        if baseline_result is None or baseline_result['min_seconds'] <= 0:
+            continue
+        ratio = result['min_seconds']/baseline_result['min_seconds']
+        result['baseline_min_seconds'] = baseline_result['min_seconds']
+        result['ratio_to_baseline'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(result)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the hot paths of honeycomb_io on synthetic data')
+    parser.add_argument('--sizes', default=','.join([str(size) for size in DEFAULT_SIZES]), help='comma-separated fixture sizes (rows)')
+    parser.add_argument('--filter', action='append', help='only run benchmarks whose names contain this string (may be repeated)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='timed runs per benchmark and size')
+    parser.add_argument('--max-seconds', type=float, default=DEFAULT_MAX_SECONDS, help='stop repeating a benchmark once its timed runs exceed this many seconds')
+    parser.add_argument('--max-stand-in-size', type=int, help='override the size cap for stand-in server benchmarks')
+    parser.add_argument('--output', help='path for the JSON results file')
+    parser.add_argument('--compare', help='path to a previous JSON results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD, help='slowdown ratio above which a result counts as a regression')
+    parser.add_argument('--list', action='store_true', help='list benchmark names and exit')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    # Library logging inside the timed loops would dominate the smaller runs
+    logging.getLogger('honeycomb_io').setLevel(logging.WARNING)
+    logging.getLogger('minimal_honeycomb').setLevel(logging.WARNING)
+    logging.getLogger('gqlpycgen').setLevel(logging.WARNING)
+    if args.list:
+        for benchmark in BENCHMARKS:
+            print(benchmark.name)
+        return 0
+    results = run_benchmarks(
+        sizes=[int(size) for size in args.sizes.split(',')],
+        benchmark_names=args.filter,
+        repeat=args.repeat,
+        max_seconds=args.max_seconds,
+        max_stand_in_size=args.max_stand_in_size
+    )
+    regressions = list()
+    if args.compare is not None:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        regressions = compare_results(
+            results=results,
+            baseline=baseline,
+            threshold=args.threshold
+        )
+        for regression in regressions:
+            logger.warning('Regression in {} at {} rows: {:.3f} s vs {:.3f} s baseline'.format(
+                regression['benchmark'],
+                regression['size'],
+                regression['min_seconds'],
+                regression['baseline_min_seconds']
+            ))
+    output = json.dumps(results, indent=2)
+    if args.output is not None:
+        with open(args.output, 'w') as fp:
+            fp.write(output)
+        logger.info('Wrote results to {}'.format(args.output))
+    else:
+        print(output)
+    return 1 if len(regressions) > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,18 +1,35 @@
-from .core import *
-from .schema import *
-from .utils import *
-from .environments import *
-from .coordinate_spaces import *
-from .devices import *
-from .cameras import *
-from .inference_executions import *
-from .persons import *
-from .trays import *
-from .materials import *
-from .uwb_data import *
-from .poses import *
-from .datapoints import *
-from .interactions import *
-from .exceptions import *
+import importlib
+
+from honeycomb_io._attribute_index import SUBMODULES as _SUBMODULES
+from honeycomb_io._attribute_index import SUBMODULE_ATTRIBUTES as _SUBMODULE_ATTRIBUTES
 
 __version__ = '2.1.2'
+
+# Submodules are imported on first attribute access rather than at package
+# import, so that short-lived scripts only pay for the submodules (and the
+# pandas/boto3/etc. imports behind them) that they actually use. Names are
+# resolved as the previous star imports resolved them: when several
+# submodules define a name, the one later in the submodule list wins. The
+# index of names defined by each submodule (_attribute_index.py) is generated
+# from their sources: run 'python honeycomb_io/_generate_attribute_index.py'
+# after adding or removing public names
+_ATTRIBUTE_SUBMODULES = {
+    attribute_name: submodule_name
+    for submodule_name in _SUBMODULES
+    for attribute_name in _SUBMODULE_ATTRIBUTES[submodule_name]
+}
+
+__all__ = list(_ATTRIBUTE_SUBMODULES.keys())
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module('.{}'.format(name), __name__)
+    if name not in _ATTRIBUTE_SUBMODULES:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    submodule = importlib.import_module('.{}'.format(_ATTRIBUTE_SUBMODULES[name]), __name__)
+    value = getattr(submodule, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_SUBMODULES) | set(__all__))
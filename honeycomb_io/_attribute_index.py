@@ -0,0 +1,357 @@
+# Generated by 'python honeycomb_io/_generate_attribute_index.py'. Do not edit.
+# Submodules (in star-import precedence order) and the public names defined by
+# each, used by honeycomb_io.__getattr__ to import only the submodule that
+# defines a requested name
+
+SUBMODULES = [
+    'core',
+    'schema',
+    'utils',
+    'cache',
+    'introspection',
+    'environments',
+    'coordinate_spaces',
+    'devices',
+    'cameras',
+    'inference_executions',
+    'persons',
+    'trays',
+    'materials',
+    'uwb_data',
+    'poses',
+    'datapoints',
+    'interactions',
+    'exceptions'
+]
+
+SUBMODULE_ATTRIBUTES = {
+    'core': [
+        'LIST_OPERATORS',
+        'DEFAULT_MAX_QUERY_LIST_VALUES',
+        'DEFAULT_QUERY_LIST_SHARD_WORKERS',
+        'DEFAULT_TIME_WINDOW_WORKERS',
+        'TIME_WINDOW_PROBE_FRACTION',
+        'DEFAULT_TARGET_CHUNK_LATENCY_SECONDS',
+        'DEFAULT_MAX_CHUNK_PAYLOAD_BYTES',
+        'AdaptiveChunkSize',
+        'resolve_chunk_size',
+        'create_objects',
+        'update_objects',
+        'search_objects',
+        'fetch_all_objects',
+        'cached_bulk_query',
+        'bulk_query',
+        'bulk_mutation',
+        'send_bulk_mutation',
+        'mutation_fingerprint',
+        'fingerprint_value',
+        'load_mutation_journal',
+        'finish_mutation_journal',
+        'append_mutation_journal',
+        'mutation_argument_structure',
+        'mutation_child_requests',
+        'search_query_list_shards',
+        'merge_shard_results',
+        'search_objects_by_time_window',
+        'sort_value',
+        'split_query_list',
+        'split_query_list_by_values',
+        'split_query_list_by_size',
+        'split_query_arguments_by_size',
+        'split_query_list_by_time',
+        'find_time_range',
+        'time_window_boundaries',
+        'split_query_list_at_boundaries',
+        'iter_search_objects',
+        'iter_fetch_all_objects',
+        'iter_bulk_query',
+        'query_fingerprint',
+        'load_query_journal',
+        'write_query_journal_state',
+        'append_query_journal',
+        'iter_page_dataframes',
+        'QUERY_TEMPLATE_CACHE_SIZE',
+        'QueryTemplate',
+        'flatten_paths',
+        'query_template',
+        'clear_query_templates',
+        'template_request',
+        'fetch_latest_object',
+        'fetch_latest_objects',
+        'delete_objects',
+        'generate_client',
+        'fetch_registered_client',
+        'client_registry_stats',
+        'clear_client_registry',
+        'register_request_hook',
+        'unregister_request_hook',
+        'clear_request_hooks',
+        'request_context',
+        'current_chunk_index',
+        'instrument_client',
+        'InstrumentedGraphQLClient',
+        'emit_request_event',
+        'parse_request_name',
+        'response_row_count',
+        'DEFAULT_LATENCY_BUCKETS',
+        'RequestStatsAggregator'
+    ],
+    'schema': [
+        'SCHEMA',
+        'introspected_endpoint_name',
+        'introspected_input_argument',
+        'introspected_id_field_name',
+        'create_endpoint_name',
+        'create_endpoint_argument_name',
+        'create_endpoint_argument_type',
+        'update_endpoint_name',
+        'update_endpoint_argument_name',
+        'update_endpoint_argument_type',
+        'fetch_all_endpoint_name',
+        'search_endpoint_name',
+        'delete_endpoint_name',
+        'id_field_name'
+    ],
+    'utils': [
+        'DATAFRAME_RECORDS_BATCH_SIZE',
+        'parse_data_sequence',
+        'DataFrameRecords',
+        'parse_data_id_sequence',
+        'from_honeycomb_datetime',
+        'to_honeycomb_datetime',
+        'HONEYCOMB_DATETIME_FORMAT',
+        'HONEYCOMB_DATETIME_RE',
+        'to_honeycomb_datetimes',
+        'from_honeycomb_datetimes',
+        'extract_honeycomb_id',
+        'minutes_elapsed'
+    ],
+    'cache': [
+        'DEFAULT_TTLS',
+        'DEFAULT_MAX_ENTRIES',
+        'DEFAULT_DATAPOINT_CACHE_MAX_BYTES',
+        'MemoryCacheBackend',
+        'DiskCacheBackend',
+        'enable_cache',
+        'disable_cache',
+        'invalidate_cache',
+        'cache_stats',
+        'cache_key',
+        'normalize_query',
+        'fetch_cached',
+        'store_cached',
+        'DatapointCache',
+        'enable_datapoint_cache',
+        'disable_datapoint_cache',
+        'clear_datapoint_cache',
+        'datapoint_cache_key',
+        'fetch_cached_datapoint',
+        'store_cached_datapoint'
+    ],
+    'introspection': [
+        'SCHEMA_CACHE_VERSION',
+        'DEFAULT_SCHEMA_MAX_AGE',
+        'INTROSPECTION_QUERY',
+        'IntrospectedSchema',
+        'named_type',
+        'type_string',
+        'enable_schema_introspection',
+        'disable_schema_introspection',
+        'introspected_schema',
+        'client_uri',
+        'fetch_schema',
+        'default_schema_cache_path',
+        'load_schema_cache',
+        'write_schema_cache',
+        'validate_return_data'
+    ],
+    'environments': [
+        'fetch_all_environments',
+        'generate_environment_dataframe',
+        'fetch_environment_id',
+        'fetch_environment_by_name',
+        'assign_objects_to_environment',
+        'fetch_device_assignments',
+        'get_current_assignment',
+        'filter_assignments'
+    ],
+    'coordinate_spaces': [
+        'fetch_all_coordinate_spaces',
+        'generate_coordinate_space_dataframe'
+    ],
+    'devices': [
+        'fetch_all_devices',
+        'fetch_device_ids',
+        'fetch_devices',
+        'generate_device_dataframe',
+        'fetch_device_assignments_by_device_id',
+        'generate_device_assignment_dataframe',
+        'fetch_device_entity_assignments_by_device_id',
+        'generate_device_entity_assignment_dataframe',
+        'fetch_entity_info',
+        'fetch_device_positions',
+        'fetch_device_position',
+        'write_position_data'
+    ],
+    'cameras': [
+        'DEFAULT_CAMERA_DEVICE_TYPES',
+        'write_intrinsic_calibration_data',
+        'write_extrinsic_calibration_data',
+        'fetch_camera_status',
+        'fetch_camera_info',
+        'fetch_latest_video_datapoints',
+        'generate_video_datapoint_dataframe',
+        'fetch_camera_ids_from_environment',
+        'fetch_camera_assignment_ids_from_environment',
+        'fetch_camera_assignment_ids_from_camera_properties',
+        'fetch_camera_ids_from_camera_properties',
+        'fetch_camera_names',
+        'fetch_camera_calibrations',
+        'fetch_intrinsic_calibrations',
+        'fetch_extrinsic_calibrations',
+        'fetch_camera_device_id_lookup',
+        'fetch_camera_device_ids',
+        'extract_assignment'
+    ],
+    'inference_executions': [
+        'fetch_inference_ids',
+        'create_inference_execution',
+        'delete_inference_execution'
+    ],
+    'persons': [
+        'fetch_all_persons',
+        'fetch_persons',
+        'generate_person_dataframe',
+        'fetch_person_info'
+    ],
+    'trays': [
+        'fetch_all_trays',
+        'fetch_trays',
+        'generate_tray_dataframe',
+        'fetch_tray_ids',
+        'fetch_tray_material_assignments_by_tray_id',
+        'generate_tray_material_assignment_dataframe'
+    ],
+    'materials': [
+        'fetch_all_materials',
+        'fetch_materials',
+        'generate_material_dataframe',
+        'fetch_material_names',
+        'fetch_material_assignments'
+    ],
+    'uwb_data': [
+        'POSITION_SCALE_FACTOR',
+        'ACCELEROMETER_BYTE_SIZE',
+        'GYROSCOPE_BYTE_SIZE',
+        'MAGNETOMETER_BYTE_SIZE',
+        'CUWB_DATA_MAX_INT',
+        'SUPPORTED_CUWB_DATA_TYPES',
+        'BULK_IMPORT_FILE_FORMATS',
+        'OBJECT_NAMES',
+        'fetch_cuwb_data_datapoints',
+        'iter_cuwb_data_datapoints',
+        'fetch_cuwb_data_datapoint',
+        'parse_cuwb_data_datapoint',
+        'generate_cuwb_dataframe_from_parsed_data_list',
+        'generate_cuwb_position_dataframe_from_parsed_data_list',
+        'generate_cuwb_accelerometer_dataframe_from_parsed_data_list',
+        'generate_cuwb_gyroscope_dataframe_from_parsed_data_list',
+        'generate_cuwb_magnetometer_dataframe_from_parsed_data_list',
+        'raw_cuwb_data_lists_to_parsed',
+        'raw_cuwb_data_to_parsed',
+        'write_raw_cuwb_data_lists',
+        'write_raw_cuwb_data',
+        'write_cuwb_data',
+        'write_cuwb_position_data',
+        'write_cuwb_accelerometer_data',
+        'write_cuwb_gyroscope_data',
+        'write_cuwb_magnetometer_data',
+        'delete_cuwb_data',
+        'parse_raw_cuwb_data',
+        'parse_raw_position_data',
+        'parse_raw_accelerometer_data',
+        'parse_raw_gyroscope_data',
+        'parse_raw_magnetometer_data',
+        'parse_raw_cuwb_data_columns',
+        'raw_cuwb_data_column',
+        'parsed_columns_to_records',
+        'extract_serial_numbers',
+        'fetch_uwb_device_id_lookup',
+        'fetch_coordinate_space_id',
+        'fetch_cuwb_position_data',
+        'generate_cuwb_position_dataframe',
+        'fetch_cuwb_accelerometer_data',
+        'generate_cuwb_accelerometer_dataframe',
+        'fetch_cuwb_gyroscope_data',
+        'generate_cuwb_gyroscope_dataframe',
+        'fetch_cuwb_magnetometer_data',
+        'generate_cuwb_magnetometer_dataframe',
+        'fetch_tag_status',
+        'fetch_latest_cuwb_position_data',
+        'fetch_latest_cuwb_accelerometer_data',
+        'fetch_latest_cuwb_gyroscope_data',
+        'fetch_latest_cuwb_magnetometer_data',
+        'add_device_assignment_info',
+        'add_device_entity_assignment_info',
+        'add_tray_material_assignment_info',
+        'fetch_tag_info',
+        'fetch_raw_cuwb_data',
+        'fetch_cuwb_tag_device_data',
+        'fetch_cuwb_tag_assignments',
+        'add_environment_assignment_info',
+        'add_entity_assignment_info',
+        'add_assignment_ids',
+        'fetch_material_tray_devices_assignments',
+        'scan_cuwb_data',
+        'fetch_cuwb_data_ids_by_time_span',
+        'create_bulk_import_files_day',
+        'create_bulk_import_files',
+        'create_bulk_import_file_data_id',
+        'cuwb_columns_to_bytes',
+        'write_bulk_import_file_bytes',
+        'fetch_datapoint_file_data',
+        'decode_wrapped_jsonl',
+        'fetch_data_lists_data_id',
+        'fetch_uwb_data_data_id',
+        'extract_position_data',
+        'fetch_uwb_data_ids',
+        'fetch_person_tag_info',
+        'add_person_tag_info'
+    ],
+    'poses': [
+        'fetch_2d_pose_data',
+        'search_2d_poses',
+        'fetch_3d_pose_data',
+        'search_3d_poses',
+        'fetch_3d_pose_track_data',
+        'search_pose_tracks_3d',
+        'fetch_pose_model_id',
+        'fetch_all_pose_models',
+        'generate_pose_model_dataframe',
+        'fetch_pose_model',
+        'fetch_pose_model_by_pose_model_id',
+        'fetch_inference_ids_reconstruct_3d_poses',
+        'write_3d_pose_data',
+        'delete_3d_pose_data_by_inference_id',
+        'fetch_pose_3d_ids',
+        'delete_3d_pose_data_by_pose_ids',
+        'write_pose_tracks_3d'
+    ],
+    'datapoints': [
+        'search_datapoints',
+        'iter_search_datapoints'
+    ],
+    'interactions': [
+        'fetch_material_interactions',
+        'generate_material_interaction_dataframe'
+    ],
+    'exceptions': [
+        'HoneycombError',
+        'HoneycombWriteError',
+        'HoneycombWriteErrorRetry',
+        'HoneycombWriteErrorNoRetry',
+        'HoneycombWriteErrorNoRetryCleanupFailed',
+        'HoneycombPartialWriteError',
+        'HoneycombDeleteError'
+    ]
+}
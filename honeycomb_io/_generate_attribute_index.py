@@ -0,0 +1,99 @@
+import ast
+import os
+import sys
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+ATTRIBUTE_INDEX_PATH = os.path.join(PACKAGE_DIRECTORY, '_attribute_index.py')
+
+ATTRIBUTE_INDEX_HEADER = '''# Generated by 'python honeycomb_io/_generate_attribute_index.py'. Do not edit.
+# Submodules (in star-import precedence order) and the public names defined by
+# each, used by honeycomb_io.__getattr__ to import only the submodule that
+# defines a requested name
+'''
+
+# When several submodules define a name, the one later in this list wins (as
+# it did when the package star-imported them in this order)
+SUBMODULES = [
+    'core',
+    'schema',
+    'utils',
+    'cache',
+    'introspection',
+    'environments',
+    'coordinate_spaces',
+    'devices',
+    'cameras',
+    'inference_executions',
+    'persons',
+    'trays',
+    'materials',
+    'uwb_data',
+    'poses',
+    'datapoints',
+    'interactions',
+    'exceptions'
+]
+
+# Public names of a submodule: its __all__ if it defines one, otherwise the
+# functions, classes and variables it defines at top level (not the names it
+# imports), excluding private names and the module logger. The source is
+# parsed rather than imported, so that the index can be built without the
+# submodules' dependencies
+def public_names(submodule_name):
+    path = os.path.join(PACKAGE_DIRECTORY, '{}.py'.format(submodule_name))
+    with open(path) as fp:
+        tree = ast.parse(fp.read(), filename=path)
+    names = list()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    if target.id == '__all__':
+                        return list(ast.literal_eval(node.value))
+                    names.append(target.id)
+    return [
+        name
+        for name in dict.fromkeys(names)
+        if not name.startswith('_') and name != 'logger'
+    ]
+
+def generate_attribute_index(submodule_names):
+    return {
+        submodule_name: public_names(submodule_name)
+        for submodule_name in submodule_names
+    }
+
+def attribute_index_source(submodule_names=SUBMODULES):
+    lines = [ATTRIBUTE_INDEX_HEADER, 'SUBMODULES = [']
+    lines.append(',\n'.join(['    {!r}'.format(submodule_name) for submodule_name in submodule_names]))
+    lines.extend([']', '', 'SUBMODULE_ATTRIBUTES = {'])
+    attribute_index = generate_attribute_index(submodule_names)
+    submodule_sources = list()
+    for submodule_name, names in attribute_index.items():
+        submodule_sources.append('    {!r}: [\n{}\n    ]'.format(
+            submodule_name,
+            ',\n'.join(['        {!r}'.format(name) for name in names])
+        ))
+    lines.append(',\n'.join(submodule_sources))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+# Run as a script (rather than with -m) so that the index can be regenerated
+# even when the current one is missing or broken
+def main():
+    source = attribute_index_source()
+    if '--check' in sys.argv[1:]:
+        with open(ATTRIBUTE_INDEX_PATH) as fp:
+            if fp.read() != source:
+                sys.exit('{} is out of date. Run \'python honeycomb_io/_generate_attribute_index.py\''.format(
+                    ATTRIBUTE_INDEX_PATH
+                ))
+        return
+    with open(ATTRIBUTE_INDEX_PATH, 'w') as fp:
+        fp.write(source)
+
+if __name__ == '__main__':
+    main()
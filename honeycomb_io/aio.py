@@ -0,0 +1,839 @@
+import honeycomb_io.cache
+import honeycomb_io.schema
+import honeycomb_io.utils
+import minimal_honeycomb
+import gqlpycgen.utils
+import aiohttp
+import asyncio
+import datetime
+import hashlib
+import math
+import os
+import time
+import weakref
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_HTTP_REQUEST_TIMEOUT = 30
+NUM_REQUEST_ATTEMPTS = 4
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+_max_concurrency = DEFAULT_MAX_CONCURRENCY
+_client_registry = weakref.WeakKeyDictionary()
+_shutdown_hooks = weakref.WeakKeyDictionary()
+
+def set_max_concurrency(max_concurrency):
+    global _max_concurrency
+    if max_concurrency is None or max_concurrency < 1:
+        raise ValueError('Maximum concurrency must be a positive integer')
+    _max_concurrency = max_concurrency
+
+# Coroutines are taken from the iterable only as earlier ones finish, so a
+# generator which builds them lazily never has more than max_concurrency alive.
+# Results are returned in order
+async def gather_with_concurrency(
+    coroutines,
+    max_concurrency=None
+):
+    if max_concurrency is None:
+        max_concurrency = _max_concurrency
+    results = dict()
+    tasks = set()
+    async def run(index, coroutine):
+        results[index] = await coroutine
+    try:
+        for index, coroutine in enumerate(coroutines):
+            if len(tasks) >= max_concurrency:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            tasks.add(asyncio.ensure_future(run(index, coroutine)))
+        if len(tasks) > 0:
+            await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return [results[index] for index in range(len(results))]
+
+class AsyncHoneycombClient:
+    def __init__(
+        self,
+        uri=None,
+        token_uri=None,
+        audience=None,
+        client_id=None,
+        client_secret=None,
+        max_concurrency=None,
+        timeout=DEFAULT_HTTP_REQUEST_TIMEOUT
+    ):
+        if uri is None:
+            uri = os.getenv('HONEYCOMB_URI')
+            if uri is None:
+                raise ValueError('Honeycomb URI not specified and environment variable HONEYCOMB_URI not set')
+        if token_uri is None:
+            token_uri = os.getenv('HONEYCOMB_TOKEN_URI')
+            if token_uri is None:
+                raise ValueError('Honeycomb token URI not specified and environment variable HONEYCOMB_TOKEN_URI not set')
+        if audience is None:
+            audience = os.getenv('HONEYCOMB_AUDIENCE')
+            if audience is None:
+                raise ValueError('Honeycomb audience not specified and environment variable HONEYCOMB_AUDIENCE not set')
+        if client_id is None:
+            client_id = os.getenv('HONEYCOMB_CLIENT_ID')
+            if client_id is None:
+                raise ValueError('Honeycomb client ID not specified and environment variable HONEYCOMB_CLIENT_ID not set')
+        if client_secret is None:
+            client_secret = os.getenv('HONEYCOMB_CLIENT_SECRET')
+            if client_secret is None:
+                raise ValueError('Honeycomb client secret not specified and environment variable HONEYCOMB_CLIENT_SECRET not set')
+        if max_concurrency is None:
+            max_concurrency = _max_concurrency
+        self.uri = uri
+        self.token_uri = token_uri
+        self.audience = audience
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = None
+        self.access_token = None
+        self.access_token_expiration = None
+        self.token_lock = asyncio.Lock()
+
+    # Document strings are built exactly as the synchronous client builds them
+    request_string = minimal_honeycomb.MinimalHoneycombClient.request_string
+    compound_request_string = minimal_honeycomb.MinimalHoneycombClient.compound_request_string
+    request_string_formatter = minimal_honeycomb.MinimalHoneycombClient.request_string_formatter
+
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            # Request bodies are serialized as the synchronous client serializes
+            # them (e.g., datetimes in Honeycomb format)
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                json_serialize=gqlpycgen.utils.json_dumps
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def get_access_token(self):
+        async with self.token_lock:
+            if self.access_token is None or time.time() >= self.access_token_expiration:
+                session = await self.get_session()
+                async with session.post(
+                    self.token_uri,
+                    data={
+                        'audience': self.audience,
+                        'grant_type': 'client_credentials',
+                        'client_id': self.client_id,
+                        'client_secret': self.client_secret
+                    }
+                ) as response:
+                    auth_response = await response.json(content_type=None)
+                access_token = auth_response.get('access_token')
+                if access_token is None:
+                    raise ValueError('Invalid client credentials')
+                self.access_token = access_token
+                self.access_token_expiration = (
+                    time.time() +
+                    auth_response.get('expires_in', TOKEN_REFRESH_MARGIN_SECONDS) -
+                    TOKEN_REFRESH_MARGIN_SECONDS
+                )
+            return self.access_token
+
+    async def execute(
+        self,
+        query,
+        variables=None
+    ):
+        session = await self.get_session()
+        for attempt_index in range(NUM_REQUEST_ATTEMPTS):
+            access_token = await self.get_access_token()
+            try:
+                async with self.semaphore:
+                    async with session.post(
+                        self.uri,
+                        json={
+                            'query': query,
+                            'variables': variables or {}
+                        },
+                        headers={
+                            'Authorization': 'Bearer {}'.format(access_token)
+                        }
+                    ) as response:
+                        response.raise_for_status()
+                        result = await response.json(content_type=None)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt_index == NUM_REQUEST_ATTEMPTS - 1:
+                    raise
+                logger.warning('Request to Honeycomb failed. Retrying')
+                await asyncio.sleep(0.1*2**attempt_index)
+        # As in the synchronous client, GraphQL errors are returned in place of
+        # the data (so request() reports them as an unexpected response)
+        if 'errors' in result:
+            return result.get('errors')
+        return result.get('data')
+
+    async def request(
+        self,
+        request_type,
+        request_name,
+        arguments,
+        return_object
+    ):
+        if request_name == 'createDatapoint':
+            raise ValueError('File uploads are not supported by the asynchronous client')
+        request_string = self.request_string(
+            request_type,
+            request_name,
+            arguments,
+            return_object
+        )
+        if arguments is not None:
+            variables = {argument_name: argument_info['value'] for argument_name, argument_info in arguments.items()}
+        else:
+            variables = None
+        response = await self.execute(request_string, variables)
+        try:
+            return_value = response[request_name]
+        except:
+            raise ValueError('Received unexpected response from Honeycomb: {}'.format(response))
+        return return_value
+
+    async def compound_request(
+        self,
+        parent_request_type,
+        parent_request_name,
+        child_request_list
+    ):
+        request_string = self.compound_request_string(
+            parent_request_type,
+            parent_request_name,
+            child_request_list
+        )
+        variables = dict()
+        for child_request_index, child_request in enumerate(child_request_list):
+            if child_request['name'] == 'createDatapoint':
+                raise ValueError('File uploads are not supported by the asynchronous client')
+            if child_request['arguments'] is None:
+                continue
+            for argument_name, argument_info in child_request['arguments'].items():
+                variables['{}_{}'.format(argument_name, child_request_index)] = argument_info['value']
+        response = await self.execute(request_string, variables)
+        return response
+
+    async def bulk_query(
+        self,
+        request_name,
+        arguments=None,
+        return_data=None,
+        id_field_name=None,
+        chunk_size=100,
+        sort_arguments=None
+    ):
+        if arguments is None:
+            arguments = dict()
+        if 'page' in arguments.keys():
+            raise ValueError('Specifying pagination parameters is redundant. Use chunk_size and sort_arguments')
+        cursor = None
+        data_list = list()
+        data_ids = set()
+        while True:
+            result = await self.request(
+                request_type='query',
+                request_name=request_name,
+                arguments={
+                    **arguments,
+                    'page': {
+                        'type': 'PaginationInput',
+                        'value': {
+                            'max': chunk_size,
+                            'cursor': cursor,
+                            'sort': sort_arguments
+                        }
+                    }
+                },
+                return_object=[
+                    {'data': return_data},
+                    {'page_info': [
+                        'count',
+                        'cursor'
+                    ]}
+                ]
+            )
+            try:
+                returned_data = result['data']
+                count = result['page_info']['count']
+                cursor = result['page_info']['cursor']
+            except:
+                raise ValueError('Received unexpected result from Honeycomb: {}'.format(result))
+            if len(returned_data) != count:
+                raise ValueError('Honeycomb reported count as {} but received {} data points'.format(
+                    count,
+                    len(returned_data)
+                ))
+            if len(returned_data) == 0:
+                break
+            for datum in returned_data:
+                if id_field_name not in datum:
+                    raise ValueError('Returned datum does not contain field {}'.format(id_field_name))
+                if datum[id_field_name] not in data_ids:
+                    data_ids.add(datum[id_field_name])
+                    data_list.append(datum)
+            if cursor is None:
+                break
+        return data_list
+
+    async def bulk_mutation(
+        self,
+        request_name,
+        arguments,
+        return_object,
+        chunk_size=100
+    ):
+        num_mutations = 1
+        argument_is_list = dict()
+        for argument_name, argument_info in arguments.items():
+            if isinstance(argument_info['value'], (list, tuple)):
+                argument_is_list[argument_name] = True
+                if num_mutations != 1 and len(argument_info['value']) != num_mutations:
+                    raise ValueError('All argument values that are not singletons must be the same length')
+                num_mutations = len(argument_info['value'])
+            else:
+                argument_is_list[argument_name] = False
+        num_chunks = math.ceil(num_mutations/chunk_size)
+        logger.info('Requesting {} mutations using endpoint {} in {} chunks'.format(
+            num_mutations,
+            request_name,
+            num_chunks
+        ))
+        def chunk_child_request_list(chunk_index):
+            child_request_list = list()
+            for mutation_index in range(chunk_index*chunk_size, min((chunk_index + 1)*chunk_size, num_mutations)):
+                child_arguments = dict()
+                for argument_name, is_list in argument_is_list.items():
+                    child_arguments[argument_name] = {
+                        'type': arguments[argument_name]['type'],
+                        'value': arguments[argument_name]['value'][mutation_index] if is_list else arguments[argument_name]['value']
+                    }
+                child_request_list.append({
+                    'name': request_name,
+                    'arguments': child_arguments,
+                    'return_object_name': 'return_object',
+                    'return_object': return_object
+                })
+            return child_request_list
+        # Chunk requests are built as the window of requests in flight moves
+        def generate_chunk_requests():
+            for chunk_index in range(num_chunks):
+                yield self.compound_request(
+                    parent_request_type='mutation',
+                    parent_request_name=request_name,
+                    child_request_list=chunk_child_request_list(chunk_index)
+                )
+        chunk_results = await gather_with_concurrency(
+            generate_chunk_requests(),
+            max_concurrency=self.max_concurrency
+        )
+        result_list = list()
+        for chunk_result in chunk_results:
+            result_list.extend(list(chunk_result.values()))
+        return result_list
+
+def generate_client(
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if client is not None:
+        return client
+    if uri is None:
+        uri = os.getenv('HONEYCOMB_URI')
+    if audience is None:
+        audience = os.getenv('HONEYCOMB_AUDIENCE')
+    if client_id is None:
+        client_id = os.getenv('HONEYCOMB_CLIENT_ID')
+    if token_uri is None:
+        token_uri = os.getenv('HONEYCOMB_TOKEN_URI')
+    if client_secret is None:
+        client_secret = os.getenv('HONEYCOMB_CLIENT_SECRET')
+    # Sessions and semaphores belong to a single event loop, so clients are
+    # shared per loop and closed when the loop shuts down
+    loop = asyncio.get_running_loop()
+    for registered_loop in list(_client_registry.keys()):
+        if registered_loop.is_closed():
+            _client_registry.pop(registered_loop, None)
+            _shutdown_hooks.pop(registered_loop, None)
+    if loop not in _client_registry:
+        _client_registry[loop] = dict()
+    if loop not in _shutdown_hooks:
+        _shutdown_hooks[loop] = close_clients_on_shutdown()
+        loop.create_task(_shutdown_hooks[loop].__anext__())
+    loop_clients = _client_registry[loop]
+    # Keyed on the secret's hash, so a changed secret gets a new client
+    # without the secret itself being kept in the key
+    registry_key = (
+        uri,
+        token_uri,
+        audience,
+        client_id,
+        hashlib.sha256(str(client_secret).encode('utf-8')).hexdigest()
+    )
+    client = loop_clients.get(registry_key)
+    if client is None:
+        client = AsyncHoneycombClient(
+            uri=uri,
+            token_uri=token_uri,
+            audience=audience,
+            client_id=client_id,
+            client_secret=client_secret
+        )
+        loop_clients[registry_key] = client
+    return client
+
+async def close_clients():
+    loop_clients = _client_registry.pop(asyncio.get_running_loop(), dict())
+    for client in loop_clients.values():
+        await client.close()
+
+# The event loop finalizes suspended async generators when it shuts down
+# (asyncio.run() does this before closing the loop), which closes the loop's
+# clients
+async def close_clients_on_shutdown():
+    try:
+        yield
+    finally:
+        await close_clients()
+
+async def create_objects(
+    object_name=None,
+    data=None,
+    request_name=None,
+    argument_name=None,
+    argument_type=None,
+    id_field_name=None,
+    chunk_size=100,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if data is None:
+        logger.warn('No data supplied')
+        ids = list()
+        return ids
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.create_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if argument_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either argument name or object name')
+        argument_name = honeycomb_io.schema.create_endpoint_argument_name(object_name=object_name, client=client, uri=uri)
+    if argument_type is None:
+        if object_name is None:
+            raise ValueError('Must specify either argument type or object name')
+        argument_type = honeycomb_io.schema.create_endpoint_argument_type(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    data_list = honeycomb_io.utils.parse_data_sequence(data=data)
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    # Cached results for the object type may be stale after any mutation
+    try:
+        result = await client.bulk_mutation(
+            request_name=request_name,
+            arguments={
+                argument_name: {
+                    'type': argument_type,
+                    'value': data_list
+                }
+            },
+            return_object=[
+                id_field_name
+            ],
+            chunk_size=chunk_size
+        )
+    finally:
+        honeycomb_io.cache.invalidate_cache(object_type=object_name)
+    ids = [datum.get(id_field_name) for datum in result]
+    return ids
+
+async def update_objects(
+    object_name=None,
+    data=None,
+    request_name=None,
+    argument_name=None,
+    argument_type=None,
+    id_field_name=None,
+    chunk_size=100,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if data is None:
+        logger.warn('No data supplied')
+        updated_data = list()
+        return updated_data
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.update_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if argument_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either argument name or object name')
+        argument_name = honeycomb_io.schema.update_endpoint_argument_name(object_name=object_name, client=client, uri=uri)
+    if argument_type is None:
+        if object_name is None:
+            raise ValueError('Must specify either argument type or object name')
+        argument_type = honeycomb_io.schema.update_endpoint_argument_type(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    data_list = honeycomb_io.utils.parse_data_sequence(data=data)
+    ids = list()
+    data_fields = set()
+    for datum in data_list:
+        data_fields = data_fields.union(datum.keys())
+        if id_field_name not in datum.keys():
+            raise ValueError('Every update data object must contain ID field \'{}\''.format(
+                id_field_name
+            ))
+        ids.append(datum.pop(id_field_name))
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    try:
+        updated_data = await client.bulk_mutation(
+            request_name=request_name,
+            arguments={
+                id_field_name: {
+                    'type': 'ID!',
+                    'value': ids
+                },
+                argument_name: {
+                    'type': argument_type,
+                    'value': data_list
+                }
+            },
+            return_object=list(data_fields),
+            chunk_size=chunk_size
+        )
+    finally:
+        honeycomb_io.cache.invalidate_cache(object_type=object_name)
+    return updated_data
+
+async def search_objects(
+    object_name=None,
+    query_list=None,
+    return_data=None,
+    request_name=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if query_list is None:
+        logger.warn('No query specified')
+        data = list()
+        return data
+    if return_data is None:
+        logger.warn('No return data specified')
+        data = list()
+        return data
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result = await client.bulk_query(
+        request_name=request_name,
+        arguments={
+            'query': {
+                'type': 'QueryExpression!',
+                'value': {
+                    'operator': 'AND',
+                    'children': query_list
+                }
+            }
+        },
+        return_data=return_data,
+        id_field_name=id_field_name,
+        chunk_size=chunk_size,
+        sort_arguments=sort_arguments
+    )
+    return result
+
+async def fetch_all_objects(
+    object_name=None,
+    return_data=None,
+    request_name=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if return_data is None:
+        logger.warn('No return data specified')
+        data = list()
+        return data
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.fetch_all_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result = await client.bulk_query(
+        request_name=request_name,
+        arguments=None,
+        return_data=return_data,
+        id_field_name=id_field_name,
+        chunk_size=chunk_size,
+        sort_arguments=sort_arguments
+    )
+    return result
+
+async def fetch_latest_object(
+    object_name=None,
+    query_list=None,
+    return_data=None,
+    request_name=None,
+    id_field_name=None,
+    timestamp_field='timestamp',
+    time_limit_hours=24,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if query_list is None:
+        logger.warn('No query specified')
+        data = list()
+        return data
+    if return_data is None:
+        logger.warn('No return data specified')
+        data = list()
+        return data
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if timestamp_field not in return_data:
+        raise ValueError('Timestamp field \'{}\' must be included in return data specification'.format(
+            timestamp_field
+        ))
+    time_limit = honeycomb_io.utils.to_honeycomb_datetime(
+        datetime.datetime.now(tz=datetime.timezone.utc) -
+        datetime.timedelta(hours=time_limit_hours)
+    )
+    query_list = list(query_list) + [
+        {'field': timestamp_field, 'operator': 'GTE', 'value': time_limit}
+    ]
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result = await client.request(
+        request_type='query',
+        request_name=request_name,
+        arguments={
+            'query': {
+                'type': 'QueryExpression!',
+                'value': {
+                    'operator': 'AND',
+                    'children': query_list
+                }
+            },
+            'page': {
+                'type': 'PaginationInput',
+                'value': {
+                    'max': 1,
+                    'sort': {
+                        'field': timestamp_field,
+                        'direction': 'DESC'
+                    }
+                }
+            }
+        },
+        return_object=[
+            {'data': return_data}
+        ]
+    )
+    if not isinstance(result, dict) or not isinstance(result.get('data'), list):
+        raise ValueError('Received unexpected result from Honyecomb: {}'.format(
+            result
+        ))
+    data = result.get('data')
+    if len(data) == 0:
+        logger.warning('No objects returned for endpoint {} and search query list {}'.format(
+            request_name,
+            query_list
+        ))
+        return None
+    return data[0]
+
+async def delete_objects(
+    object_name=None,
+    ids=None,
+    request_name=None,
+    id_field_name=None,
+    chunk_size=100,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if ids is None:
+        logger.warn('No IDs specified')
+        status = None
+        return status
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.delete_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    data_id_list = honeycomb_io.utils.parse_data_id_sequence(ids=ids)
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    try:
+        status = await client.bulk_mutation(
+            request_name=request_name,
+            arguments={
+                id_field_name: {
+                    'type': 'ID',
+                    'value': data_id_list
+                }
+            },
+            return_object=[
+                'status',
+                'error'
+            ],
+            chunk_size=chunk_size
+        )
+    finally:
+        honeycomb_io.cache.invalidate_cache(object_type=object_name)
+    return status
+
+async def fetch_latest_objects_by_query_lists(
+    query_lists,
+    object_name=None,
+    return_data=None,
+    request_name=None,
+    timestamp_field='timestamp',
+    time_limit_hours=24,
+    max_concurrency=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    data = await gather_with_concurrency(
+        [
+            fetch_latest_object(
+                object_name=object_name,
+                query_list=query_list,
+                return_data=return_data,
+                request_name=request_name,
+                timestamp_field=timestamp_field,
+                time_limit_hours=time_limit_hours,
+                client=client
+            )
+            for query_list in query_lists
+        ],
+        max_concurrency=max_concurrency
+    )
+    return data
@@ -0,0 +1,368 @@
+import collections
+import copy
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Time-to-live (in seconds) for each cached object type. Object types without
+# a TTL are never cached
+DEFAULT_TTLS = {
+    'Environment': 3600,
+    'Device': 3600,
+    'CoordinateSpace': 3600,
+    'PoseModel': 3600,
+    'Person': 3600,
+    'Tray': 3600,
+    'Material': 3600
+}
+
+DEFAULT_MAX_ENTRIES = 1024
+
+DEFAULT_DATAPOINT_CACHE_MAX_BYTES = 10*1024**3
+
+class MemoryCacheBackend:
+    def __init__(
+        self,
+        max_entries=DEFAULT_MAX_ENTRIES
+    ):
+        self.max_entries = max_entries
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expiration, value = entry
+            if time.time() >= expiration:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return copy.deepcopy(value)
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.entries[key] = (time.time() + ttl, copy.deepcopy(value))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete_prefix(self, prefix):
+        with self.lock:
+            for key in [key for key in self.entries.keys() if key.startswith(prefix)]:
+                del self.entries[key]
+
+class DiskCacheBackend:
+    def __init__(
+        self,
+        directory,
+        max_entries=DEFAULT_MAX_ENTRIES
+    ):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    # Entries are stored as JSON (never pickle), since the cache directory may
+    # be shared and unpickling runs arbitrary code
+    def path(self, key):
+        return os.path.join(self.directory, '{}.json'.format(key))
+
+    def get(self, key):
+        path = self.path(key)
+        with self.lock:
+            try:
+                with open(path) as fp:
+                    expiration, value = json.load(fp)
+            except FileNotFoundError:
+                return None
+            except Exception:
+                logger.warning('Failed to read cache file {}. Discarding'.format(path))
+                os.remove(path)
+                return None
+            if time.time() >= expiration:
+                os.remove(path)
+                return None
+            # File modification times track recency of use for LRU eviction
+            os.utime(path)
+            return value
+
+    def set(self, key, value, ttl):
+        path = self.path(key)
+        with self.lock:
+            temporary_path = '{}.{}.tmp'.format(path, threading.get_ident())
+            with open(temporary_path, 'w') as fp:
+                json.dump([time.time() + ttl, value], fp)
+            os.replace(temporary_path, path)
+            paths = [
+                os.path.join(self.directory, filename)
+                for filename in os.listdir(self.directory)
+                if filename.endswith('.json')
+            ]
+            if len(paths) > self.max_entries:
+                paths.sort(key=os.path.getmtime)
+                for evicted_path in paths[:len(paths) - self.max_entries]:
+                    os.remove(evicted_path)
+
+    def delete_prefix(self, prefix):
+        with self.lock:
+            for filename in os.listdir(self.directory):
+                if filename.startswith(prefix) and filename.endswith('.json'):
+                    os.remove(os.path.join(self.directory, filename))
+
+_cache_backend = None
+_cache_ttls = dict(DEFAULT_TTLS)
+_cache_stats = {
+    'hits': 0,
+    'misses': 0,
+    'datapoint_hits': 0,
+    'datapoint_misses': 0
+}
+_cache_stats_lock = threading.Lock()
+
+def enable_cache(
+    backend=None,
+    ttls=None
+):
+    global _cache_backend
+    if backend is None:
+        backend = MemoryCacheBackend()
+    _cache_backend = backend
+    if ttls is not None:
+        _cache_ttls.update(ttls)
+
+def disable_cache():
+    global _cache_backend
+    _cache_backend = None
+
+def invalidate_cache(object_type=None):
+    if _cache_backend is None:
+        return
+    if object_type is None:
+        _cache_backend.delete_prefix('')
+    else:
+        _cache_backend.delete_prefix('{}-'.format(object_type))
+
+def cache_stats():
+    with _cache_stats_lock:
+        stats = dict(_cache_stats)
+    return stats
+
+def cache_key(
+    object_type,
+    request_name,
+    arguments=None,
+    return_data=None,
+    sort_arguments=None,
+    client=None
+):
+    if _cache_backend is None or _cache_ttls.get(object_type) is None:
+        return None
+    key_data = {
+        'uri': getattr(getattr(client, 'client', None), 'uri', None),
+        'request_name': request_name,
+        'arguments': normalize_query(arguments),
+        'return_data': return_data,
+        'sort_arguments': sort_arguments
+    }
+    key_hash = hashlib.sha256(
+        json.dumps(key_data, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    return '{}-{}'.format(object_type, key_hash)
+
+# Predicate order within AND/OR expressions and value order within IN lists
+# don't change query results, so they are sorted out of the cache key
+def normalize_query(query):
+    if isinstance(query, dict):
+        normalized_query = {key: normalize_query(value) for key, value in query.items()}
+        if isinstance(normalized_query.get('values'), list):
+            normalized_query['values'] = sorted(normalized_query['values'], key=str)
+        return normalized_query
+    if isinstance(query, (list, tuple)):
+        normalized_list = [normalize_query(item) for item in query]
+        if all(isinstance(item, dict) for item in normalized_list):
+            normalized_list = sorted(
+                normalized_list,
+                key=lambda item: json.dumps(item, sort_keys=True, default=str)
+            )
+        return normalized_list
+    return query
+
+def fetch_cached(key):
+    if key is None or _cache_backend is None:
+        return None
+    value = _cache_backend.get(key)
+    with _cache_stats_lock:
+        if value is None:
+            _cache_stats['misses'] += 1
+        else:
+            _cache_stats['hits'] += 1
+    return value
+
+def store_cached(
+    object_type,
+    key,
+    value
+):
+    if key is None or _cache_backend is None:
+        return
+    ttl = _cache_ttls.get(object_type)
+    if ttl is None:
+        return
+    _cache_backend.set(key, value, ttl)
+
+# Datapoint files are immutable once written, so their payloads are cached
+# (compressed) without a TTL, under a hash of the Honeycomb URI and data ID.
+# The least recently used files are evicted when the total size of the cache
+# exceeds max_bytes
+class DatapointCache:
+    def __init__(
+        self,
+        directory=None,
+        max_bytes=DEFAULT_DATAPOINT_CACHE_MAX_BYTES
+    ):
+        if directory is None:
+            directory = os.getenv(
+                'HONEYCOMB_DATAPOINT_CACHE_DIRECTORY',
+                os.path.join(os.path.expanduser('~'), '.cache', 'honeycomb_io', 'datapoints')
+            )
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, '{}.json.gz'.format(key))
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as fp:
+                value = json.loads(gzip.decompress(fp.read()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning('Failed to read datapoint cache file {}. Discarding'.format(path))
+            with self.lock:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def set(self, key, value):
+        path = self.path(key)
+        compressed_value = gzip.compress(json.dumps(value).encode('utf-8'))
+        if len(compressed_value) > self.max_bytes:
+            logger.warning('Datapoint payload ({} bytes compressed) is larger than the cache. Not caching'.format(
+                len(compressed_value)
+            ))
+            return
+        temporary_path = '{}.{}.tmp'.format(path, threading.get_ident())
+        with open(temporary_path, 'wb') as fp:
+            fp.write(compressed_value)
+        with self.lock:
+            os.replace(temporary_path, path)
+            self.evict()
+
+    def evict(self):
+        files = list()
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json.gz'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, filename))
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, filename))
+        total_bytes = sum([size for mtime, size, filename in files])
+        for mtime, size, filename in sorted(files):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, filename))
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+    def size(self):
+        return sum([
+            os.path.getsize(os.path.join(self.directory, filename))
+            for filename in os.listdir(self.directory)
+            if filename.endswith('.json.gz')
+        ])
+
+    def clear(self):
+        with self.lock:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.json.gz'):
+                    os.remove(os.path.join(self.directory, filename))
+
+_datapoint_cache = None
+
+def enable_datapoint_cache(
+    directory=None,
+    max_bytes=DEFAULT_DATAPOINT_CACHE_MAX_BYTES
+):
+    global _datapoint_cache
+    _datapoint_cache = DatapointCache(
+        directory=directory,
+        max_bytes=max_bytes
+    )
+    return _datapoint_cache
+
+def disable_datapoint_cache():
+    global _datapoint_cache
+    _datapoint_cache = None
+
+def clear_datapoint_cache():
+    if _datapoint_cache is None:
+        return
+    _datapoint_cache.clear()
+
+def datapoint_cache_key(
+    data_id,
+    client=None
+):
+    if _datapoint_cache is None:
+        return None
+    key_data = {
+        'uri': getattr(getattr(client, 'client', None), 'uri', None),
+        'data_id': data_id
+    }
+    return hashlib.sha256(
+        json.dumps(key_data, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+def fetch_cached_datapoint(key):
+    datapoint_cache = _datapoint_cache
+    if key is None or datapoint_cache is None:
+        return None
+    value = datapoint_cache.get(key)
+    with _cache_stats_lock:
+        if value is None:
+            _cache_stats['datapoint_misses'] += 1
+        else:
+            _cache_stats['datapoint_hits'] += 1
+    return value
+
+def store_cached_datapoint(
+    key,
+    value
+):
+    datapoint_cache = _datapoint_cache
+    if key is None or datapoint_cache is None:
+        return
+    datapoint_cache.set(key, value)
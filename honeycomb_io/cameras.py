@@ -44,15 +44,15 @@ def write_intrinsic_calibration_data(
     intrinsic_calibration_data_df['camera_matrix'] = intrinsic_calibration_data_df['camera_matrix'].apply(lambda x: x.tolist())
     intrinsic_calibration_data_df['distortion_coefficients'] = intrinsic_calibration_data_df['distortion_coefficients'].apply(lambda x: x.tolist())
     records = intrinsic_calibration_data_df.to_dict(orient='records')
-    if client is None:
-        client = minimal_honeycomb.MinimalHoneycombClient(
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-    result=client.bulk_mutation(
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result=honeycomb_io.core.bulk_mutation(
         request_name='createIntrinsicCalibration',
         arguments={
             'intrinsicCalibration': {
@@ -62,7 +62,9 @@ def write_intrinsic_calibration_data(
         },
         return_object=[
             'intrinsic_calibration_id'
-        ]
+        ],
+        object_name='IntrinsicCalibration',
+        client=client
     )
     ids = None
     if len(result) > 0:
@@ -98,15 +100,15 @@ def write_extrinsic_calibration_data(
     extrinsic_calibration_data_df['rotation_vector'] = extrinsic_calibration_data_df['rotation_vector'].apply(lambda x: x.tolist())
     extrinsic_calibration_data_df['translation_vector'] = extrinsic_calibration_data_df['translation_vector'].apply(lambda x: x.tolist())
     records = extrinsic_calibration_data_df.to_dict(orient='records')
-    if client is None:
-        client = minimal_honeycomb.MinimalHoneycombClient(
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-    result=client.bulk_mutation(
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result=honeycomb_io.core.bulk_mutation(
         request_name='createExtrinsicCalibration',
         arguments={
             'extrinsicCalibration': {
@@ -116,7 +118,9 @@ def write_extrinsic_calibration_data(
         },
         return_object=[
             'extrinsic_calibration_id'
-        ]
+        ],
+        object_name='ExtrinsicCalibration',
+        client=client
     )
     ids = None
     if len(result) > 0:
@@ -289,28 +293,22 @@ def fetch_latest_video_datapoints(
             'key'
         ]}
     ]
-    data = list()
-    for assignment_id in assignment_ids:
-        query_list=[
-            {'field': 'source', 'operator': 'EQ', 'value': assignment_id}
-        ]
-        datum=honeycomb_io.core.fetch_latest_object(
-            object_name='Datapoint',
-            query_list=query_list,
-            return_data=return_data,
-            request_name=None,
-            id_field_name=None,
-            timestamp_field='timestamp',
-            chunk_size=chunk_size,
-            client=client,
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        if datum is not None:
-            data.append(datum)
+    latest_data = honeycomb_io.core.fetch_latest_objects(
+        group_field='source',
+        group_values=assignment_ids,
+        object_name='Datapoint',
+        return_data=return_data,
+        request_name=None,
+        timestamp_field='timestamp',
+        batch_size=chunk_size,
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    data = [datum for datum in latest_data.values() if datum is not None]
     if output_format=='list':
         return data
     elif output_format == 'dataframe':
@@ -553,15 +551,15 @@ def fetch_camera_assignment_ids_from_camera_properties(
             'values': camera_serial_numbers
         })
     logger.info('Fetching camera assignments for cameras with specified properties')
-    if client is None:
-        client = minimal_honeycomb.MinimalHoneycombClient(
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-    result = client.bulk_query(
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result = honeycomb_io.core.bulk_query(
         request_name='searchDevices',
         arguments={
             'query': {
@@ -581,7 +579,8 @@ def fetch_camera_assignment_ids_from_camera_properties(
             ]}
         ],
         id_field_name='device_id',
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        client=client
     )
     assignments = list()
     for datum in result:
@@ -651,7 +650,7 @@ def fetch_camera_ids_from_camera_properties(
             client_id=client_id,
             client_secret=client_secret
         )
-        result = client.bulk_query(
+        result = honeycomb_io.core.bulk_query(
             request_name='searchDevices',
             arguments={
                 'query': {
@@ -665,7 +664,8 @@ def fetch_camera_ids_from_camera_properties(
             return_data=[
                 'device_id'
             ],
-            id_field_name='device_id'
+            id_field_name='device_id',
+            client=client
         )
         if len(result) == 0:
             raise ValueError('No devices match specified device types/part numbers/names/serial numbers')
@@ -697,7 +697,7 @@ def fetch_camera_names(
         client_secret=client_secret
     )
     logger.info('Fetching camera names for specified camera device IDs')
-    result = client.bulk_query(
+    result = honeycomb_io.core.bulk_query(
         request_name='searchDevices',
         arguments={
             'query': {
@@ -714,7 +714,8 @@ def fetch_camera_names(
             'name'
         ],
         id_field_name = 'device_id',
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        client=client
     )
     camera_names = {device.get('device_id'): device.get('name') for device in result}
     logger.info('Fetched {} camera names'.format(len(camera_names)))
@@ -798,7 +799,7 @@ def fetch_intrinsic_calibrations(
         client_secret=client_secret
     )
     logger.info('Fetching intrinsic calibrations for specified camera device IDs and time span')
-    result = client.bulk_query(
+    result = honeycomb_io.core.bulk_query(
         request_name='searchIntrinsicCalibrations',
         arguments={
             'query': {
@@ -823,7 +824,8 @@ def fetch_intrinsic_calibrations(
             'image_height'
         ],
         id_field_name = 'intrinsic_calibration_id',
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        client=client
     )
     logger.info('Fetched {} intrinsic calibrations for specified camera IDs'.format(len(result)))
     filtered_result = minimal_honeycomb.filter_assignments(
@@ -868,7 +870,7 @@ def fetch_extrinsic_calibrations(
         client_secret=client_secret
     )
     logger.info('Fetching extrinsic calibrations for specified camera device IDs and time span')
-    result = client.bulk_query(
+    result = honeycomb_io.core.bulk_query(
         request_name='searchExtrinsicCalibrations',
         arguments={
             'query': {
@@ -894,7 +896,8 @@ def fetch_extrinsic_calibrations(
             'rotation_vector'
         ],
         id_field_name = 'extrinsic_calibration_id',
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        client=client
     )
     logger.info('Fetched {} extrinsic calibrations for specified camera IDs'.format(len(result)))
     filtered_result = minimal_honeycomb.filter_assignments(
@@ -942,7 +945,7 @@ def fetch_camera_device_id_lookup(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_query(
+    result = honeycomb_io.core.bulk_query(
         request_name='searchAssignments',
         arguments={
             'query': {
@@ -961,7 +964,8 @@ def fetch_camera_device_id_lookup(
                 ]}
             ]}
         ],
-        id_field_name='assignment_id'
+        id_field_name='assignment_id',
+        client=client
     )
     camera_device_id_lookup = dict()
     for datum in result:
@@ -1064,7 +1068,7 @@ def fetch_camera_device_ids(
     end_time,
     camera_device_types=DEFAULT_CAMERA_DEVICE_TYPES
 ):
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type='query',
         request_name='findEnvironments',
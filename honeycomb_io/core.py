@@ -1,12 +1,118 @@
+import honeycomb_io.cache
+import honeycomb_io.exceptions
+import honeycomb_io.introspection
 import honeycomb_io.schema
 import honeycomb_io.utils
 import minimal_honeycomb
+import pandas as pd
 import inflection
+import collections
+import concurrent.futures
+import contextlib
+import copy
 import datetime
+import hashlib
+import json
+import math
+import os
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+LIST_OPERATORS = ['IN', 'CONTAINED_BY']
+
+# Queries whose IN/CONTAINED_BY value lists are longer than
+# max_query_list_values are split into shards which are fetched concurrently
+# and merged. Sharding is off unless a limit is specified
+DEFAULT_MAX_QUERY_LIST_VALUES = None
+DEFAULT_QUERY_LIST_SHARD_WORKERS = 4
+
+DEFAULT_TIME_WINDOW_WORKERS = 4
+TIME_WINDOW_PROBE_FRACTION = 0.01
+
+DEFAULT_TARGET_CHUNK_LATENCY_SECONDS = 2.0
+DEFAULT_MAX_CHUNK_PAYLOAD_BYTES = 8*1024*1024
+
+class AdaptiveChunkSize:
+    def __init__(
+        self,
+        initial_chunk_size=100,
+        target_latency=DEFAULT_TARGET_CHUNK_LATENCY_SECONDS,
+        min_chunk_size=1,
+        max_chunk_size=10000,
+        max_payload_bytes=DEFAULT_MAX_CHUNK_PAYLOAD_BYTES,
+        max_growth_factor=2.0,
+        backoff_factor=0.5,
+        max_consecutive_failures=4
+    ):
+        self.chunk_size = initial_chunk_size
+        self.target_latency = target_latency
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.max_payload_bytes = max_payload_bytes
+        self.max_growth_factor = max_growth_factor
+        self.backoff_factor = backoff_factor
+        self.max_consecutive_failures = max_consecutive_failures
+        self.consecutive_failures = 0
+        self.history = list()
+        self.lock = threading.Lock()
+
+    def update(
+        self,
+        num_items,
+        latency,
+        payload_bytes
+    ):
+        with self.lock:
+            self.consecutive_failures = 0
+            self.history.append({
+                'chunk_size': self.chunk_size,
+                'num_items': num_items,
+                'latency': latency,
+                'payload_bytes': payload_bytes
+            })
+            # A short final chunk says little about throughput at full size
+            if num_items == 0 or num_items < self.chunk_size/2:
+                return self.chunk_size
+            ideal_chunk_size = self.target_latency*num_items/max(latency, 1e-6)
+            ideal_chunk_size = min(ideal_chunk_size, self.chunk_size*self.max_growth_factor)
+            ideal_chunk_size = max(ideal_chunk_size, self.chunk_size/self.max_growth_factor)
+            ideal_chunk_size = min(ideal_chunk_size, self.max_payload_bytes*num_items/max(payload_bytes, 1))
+            chunk_size = int(min(max(ideal_chunk_size, self.min_chunk_size), self.max_chunk_size))
+            if chunk_size != self.chunk_size:
+                logger.debug('Adjusting chunk size from {} to {} ({} items took {:.3f} seconds, {} bytes)'.format(
+                    self.chunk_size,
+                    chunk_size,
+                    num_items,
+                    latency,
+                    payload_bytes
+                ))
+                self.chunk_size = chunk_size
+            return self.chunk_size
+
+    def back_off(self, error):
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures > self.max_consecutive_failures or self.chunk_size <= self.min_chunk_size:
+                return False
+            # Don't grow back to a size that has already failed
+            self.max_chunk_size = max(min(self.max_chunk_size, self.chunk_size - 1), self.min_chunk_size)
+            chunk_size = max(int(self.chunk_size*self.backoff_factor), self.min_chunk_size)
+            logger.warning('Request failed with chunk size {} ({}). Retrying with chunk size {}'.format(
+                self.chunk_size,
+                error,
+                chunk_size
+            ))
+            self.chunk_size = chunk_size
+            return True
+
+def resolve_chunk_size(chunk_size):
+    if chunk_size == 'auto':
+        return AdaptiveChunkSize()
+    return chunk_size
+
 def create_objects(
     object_name=None,
     data=None,
@@ -15,6 +121,8 @@ def create_objects(
     argument_type=None,
     id_field_name=None,
     chunk_size=100,
+    max_in_flight=None,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -29,20 +137,20 @@ def create_objects(
     if request_name is None:
         if object_name is None:
             raise ValueError('Must specify either request name or object name')
-        request_name = honeycomb_io.schema.create_endpoint_name(object_name=object_name)
+        request_name = honeycomb_io.schema.create_endpoint_name(object_name=object_name, client=client, uri=uri)
     if argument_name is None:
         if object_name is None:
             raise ValueError('Must specify either argument name or object name')
-        argument_name = honeycomb_io.schema.create_endpoint_argument_name(object_name=object_name)
+        argument_name = honeycomb_io.schema.create_endpoint_argument_name(object_name=object_name, client=client, uri=uri)
     if argument_type is None:
         if object_name is None:
             raise ValueError('Must specify either argument type or object name')
-        argument_type = honeycomb_io.schema.create_endpoint_argument_type(object_name=object_name)
+        argument_type = honeycomb_io.schema.create_endpoint_argument_type(object_name=object_name, client=client, uri=uri)
     if id_field_name is None:
         if object_name is None:
             raise ValueError('Must specify either ID field name or object name')
-        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name)
-    data_list = honeycomb_io.utils.parse_data_sequence(data=data)
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    data_list = honeycomb_io.utils.parse_data_sequence(data=data, lazy=True)
     client = generate_client(
         client=client,
         uri=uri,
@@ -51,19 +159,29 @@ def create_objects(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_mutation(
-        request_name=request_name,
-        arguments = {
-            argument_name: {
-                'type': argument_type,
-                'value': data_list
-            }
-        },
-        return_object = [
-            id_field_name
-        ],
-        chunk_size=chunk_size
-    )
+    try:
+        result = bulk_mutation(
+            request_name=request_name,
+            arguments = {
+                argument_name: {
+                    'type': argument_type,
+                    'value': data_list
+                }
+            },
+            return_object = [
+                id_field_name
+            ],
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+            checkpoint_path=checkpoint_path,
+            object_name=object_name,
+            client=client
+        )
+    except honeycomb_io.exceptions.HoneycombPartialWriteError as error:
+        raise honeycomb_io.exceptions.HoneycombPartialWriteError(
+            str(error),
+            results=[datum.get(id_field_name) if datum is not None else None for datum in error.results]
+        ) from error
     if not isinstance(result, list):
         raise ValueError('Received unexpected result from Honyecomb: {}'.format(
             result
@@ -79,6 +197,7 @@ def update_objects(
     argument_type=None,
     id_field_name=None,
     chunk_size=100,
+    max_in_flight=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -93,30 +212,38 @@ def update_objects(
     if request_name is None:
         if object_name is None:
             raise ValueError('Must specify either request name or object name')
-        request_name = honeycomb_io.schema.update_endpoint_name(object_name=object_name)
+        request_name = honeycomb_io.schema.update_endpoint_name(object_name=object_name, client=client, uri=uri)
     if argument_name is None:
         if object_name is None:
             raise ValueError('Must specify either argument name or object name')
-        argument_name = honeycomb_io.schema.update_endpoint_argument_name(object_name=object_name)
+        argument_name = honeycomb_io.schema.update_endpoint_argument_name(object_name=object_name, client=client, uri=uri)
     if argument_type is None:
         if object_name is None:
             raise ValueError('Must specify either argument type or object name')
-        argument_type = honeycomb_io.schema.update_endpoint_argument_type(object_name=object_name)
+        argument_type = honeycomb_io.schema.update_endpoint_argument_type(object_name=object_name, client=client, uri=uri)
     if id_field_name is None:
         if object_name is None:
             raise ValueError('Must specify either ID field name or object name')
-        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name)
-    data_list = honeycomb_io.utils.parse_data_sequence(data=data)
-    ids = list()
-    data_fields = set()
-    for datum in data_list:
-        data_fields = data_fields.union(datum.keys())
-        if id_field_name not in datum.keys():
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    data_list = honeycomb_io.utils.parse_data_sequence(data=data, lazy=True)
+    if isinstance(data_list, honeycomb_io.utils.DataFrameRecords):
+        if id_field_name not in data_list.columns:
             raise ValueError('Every update data object must contain ID field \'{}\''.format(
                 id_field_name
             ))
-        ids.append(datum.pop(id_field_name))
-    data_fields = list(data_fields)
+        ids = data_list.pop(id_field_name)
+        data_fields = list(data_list.columns)
+    else:
+        ids = list()
+        data_fields = set()
+        for datum in data_list:
+            data_fields = data_fields.union(datum.keys())
+            if id_field_name not in datum.keys():
+                raise ValueError('Every update data object must contain ID field \'{}\''.format(
+                    id_field_name
+                ))
+            ids.append(datum.pop(id_field_name))
+        data_fields = list(data_fields)
     client = generate_client(
         client=client,
         uri=uri,
@@ -125,7 +252,7 @@ def update_objects(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_mutation(
+    result = bulk_mutation(
         request_name=request_name,
         arguments = {
             id_field_name: {
@@ -138,7 +265,10 @@ def update_objects(
             }
         },
         return_object=data_fields,
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+        object_name=object_name,
+        client=client
     )
     if not isinstance(result, list):
         raise ValueError('Received unexpected result from Honyecomb: {}'.format(
@@ -155,6 +285,10 @@ def search_objects(
     id_field_name=None,
     sort_arguments=None,
     chunk_size=100,
+    max_workers=None,
+    max_query_list_values=DEFAULT_MAX_QUERY_LIST_VALUES,
+    checkpoint_path=None,
+    cursor_callback=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -173,11 +307,11 @@ def search_objects(
     if request_name is None:
         if object_name is None:
             raise ValueError('Must specify either request name or object name')
-        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name)
+        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name, client=client, uri=uri)
     if id_field_name is None:
         if object_name is None:
             raise ValueError('Must specify either ID field name or object name')
-        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name)
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
     client = generate_client(
         client=client,
         uri=uri,
@@ -186,7 +320,43 @@ def search_objects(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_query(
+    honeycomb_io.introspection.validate_return_data(
+        object_name=object_name,
+        return_data=return_data,
+        client=client
+    )
+    cache_key = honeycomb_io.cache.cache_key(
+        object_type=object_name,
+        request_name=request_name,
+        arguments=query_list,
+        return_data=return_data,
+        sort_arguments=sort_arguments,
+        client=client
+    )
+    result = honeycomb_io.cache.fetch_cached(cache_key)
+    if result is not None:
+        return result
+    if max_workers is not None and max_workers > 1 and cursor_callback is None:
+        shard_query_lists = split_query_list(
+            query_list=query_list,
+            num_shards=max_workers
+        )
+        if len(shard_query_lists) > 1:
+            result = search_query_list_shards(
+                request_name=request_name,
+                shard_query_lists=shard_query_lists,
+                return_data=return_data,
+                id_field_name=id_field_name,
+                sort_arguments=sort_arguments,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                max_query_list_values=max_query_list_values,
+                checkpoint_path=checkpoint_path,
+                client=client
+            )
+            honeycomb_io.cache.store_cached(object_name, cache_key, result)
+            return result
+    result = bulk_query(
         request_name=request_name,
         arguments={
             'query': {
@@ -200,12 +370,18 @@ def search_objects(
         return_data=return_data,
         id_field_name=id_field_name,
         chunk_size=chunk_size,
-        sort_arguments=sort_arguments
+        sort_arguments=sort_arguments,
+        max_query_list_values=max_query_list_values,
+        max_workers=max_workers,
+        checkpoint_path=checkpoint_path,
+        cursor_callback=cursor_callback,
+        client=client
     )
     if not isinstance(result, list):
         raise ValueError('Received unexpected result from Honyecomb: {}'.format(
             result
         ))
+    honeycomb_io.cache.store_cached(object_name, cache_key, result)
     return result
 
 def fetch_all_objects(
@@ -215,6 +391,9 @@ def fetch_all_objects(
     id_field_name=None,
     sort_arguments=None,
     chunk_size=100,
+    max_workers=None,
+    checkpoint_path=None,
+    cursor_callback=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -229,11 +408,11 @@ def fetch_all_objects(
     if request_name is None:
         if object_name is None:
             raise ValueError('Must specify either request name or object name')
-        request_name = honeycomb_io.schema.fetch_all_endpoint_name(object_name=object_name)
+        request_name = honeycomb_io.schema.fetch_all_endpoint_name(object_name=object_name, client=client, uri=uri)
     if id_field_name is None:
         if object_name is None:
             raise ValueError('Must specify either ID field name or object name')
-        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name)
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
     client = generate_client(
         client=client,
         uri=uri,
@@ -242,20 +421,1504 @@ def fetch_all_objects(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_query(
+    honeycomb_io.introspection.validate_return_data(
+        object_name=object_name,
+        return_data=return_data,
+        client=client
+    )
+    cache_key = honeycomb_io.cache.cache_key(
+        object_type=object_name,
+        request_name=request_name,
+        arguments=None,
+        return_data=return_data,
+        sort_arguments=sort_arguments,
+        client=client
+    )
+    result = honeycomb_io.cache.fetch_cached(cache_key)
+    if result is not None:
+        return result
+    # The fetch-all endpoints take no query, so there are no key or time ranges
+    # to split across workers
+    if max_workers is not None and max_workers > 1:
+        logger.info('Fetch-all requests can\'t be split into shards. Fetching serially')
+    result = bulk_query(
         request_name=request_name,
         arguments=None,
         return_data=return_data,
         id_field_name=id_field_name,
         chunk_size=chunk_size,
-        sort_arguments=sort_arguments
+        sort_arguments=sort_arguments,
+        checkpoint_path=checkpoint_path,
+        cursor_callback=cursor_callback,
+        client=client
     )
     if not isinstance(result, list):
         raise ValueError('Received unexpected result from Honyecomb: {}'.format(
             result
         ))
+    honeycomb_io.cache.store_cached(object_name, cache_key, result)
     return result
 
+def cached_bulk_query(
+    object_type,
+    request_name,
+    arguments=None,
+    return_data=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    client=None
+):
+    cache_key = honeycomb_io.cache.cache_key(
+        object_type=object_type,
+        request_name=request_name,
+        arguments=arguments,
+        return_data=return_data,
+        sort_arguments=sort_arguments,
+        client=client
+    )
+    result = honeycomb_io.cache.fetch_cached(cache_key)
+    if result is not None:
+        return result
+    result = bulk_query(
+        request_name=request_name,
+        arguments=arguments,
+        return_data=return_data,
+        id_field_name=id_field_name,
+        chunk_size=chunk_size,
+        sort_arguments=sort_arguments,
+        client=client
+    )
+    if not isinstance(result, list):
+        raise ValueError('Received unexpected result from Honyecomb: {}'.format(
+            result
+        ))
+    honeycomb_io.cache.store_cached(object_type, cache_key, result)
+    return result
+
+def bulk_query(
+    request_name,
+    arguments=None,
+    return_data=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    max_query_list_values=DEFAULT_MAX_QUERY_LIST_VALUES,
+    max_workers=None,
+    start_cursor=None,
+    checkpoint_path=None,
+    cursor_callback=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    shard_query_lists = None
+    # A cursor belongs to a single query, so it can't be split across shards
+    if start_cursor is None and cursor_callback is None:
+        shard_query_lists = split_query_arguments_by_size(
+            arguments=arguments,
+            max_values=max_query_list_values
+        )
+    if shard_query_lists is not None:
+        if max_workers is None:
+            max_workers = DEFAULT_QUERY_LIST_SHARD_WORKERS
+        return search_query_list_shards(
+            request_name=request_name,
+            shard_query_lists=shard_query_lists,
+            return_data=return_data,
+            id_field_name=id_field_name,
+            sort_arguments=sort_arguments,
+            chunk_size=chunk_size,
+            max_workers=min(max_workers, len(shard_query_lists)),
+            max_query_list_values=max_query_list_values,
+            checkpoint_path=checkpoint_path,
+            client=client
+        )
+    chunk_size = resolve_chunk_size(chunk_size)
+    result = list(iter_bulk_query(
+        request_name=request_name,
+        arguments=arguments,
+        return_data=return_data,
+        id_field_name=id_field_name,
+        sort_arguments=sort_arguments,
+        chunk_size=chunk_size,
+        start_cursor=start_cursor,
+        checkpoint_path=checkpoint_path,
+        journal_pages=True,
+        cursor_callback=cursor_callback,
+        client=client
+    ))
+    if isinstance(chunk_size, AdaptiveChunkSize):
+        logger.info('Adaptive chunk size for {} settled at {}'.format(
+            request_name,
+            chunk_size.chunk_size
+        ))
+    return result
+
+# Cached results for object_name (or, without it, all cached results) are
+# invalidated after any mutation, including one which fails partway
+def bulk_mutation(
+    request_name,
+    arguments,
+    return_object,
+    chunk_size=100,
+    max_in_flight=None,
+    checkpoint_path=None,
+    object_name=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    try:
+        return send_bulk_mutation(
+            request_name=request_name,
+            arguments=arguments,
+            return_object=return_object,
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+            checkpoint_path=checkpoint_path,
+            client=client
+        )
+    finally:
+        honeycomb_io.cache.invalidate_cache(object_type=object_name)
+
+def send_bulk_mutation(
+    request_name,
+    arguments,
+    return_object,
+    chunk_size,
+    max_in_flight,
+    checkpoint_path,
+    client
+):
+    chunk_size = resolve_chunk_size(chunk_size)
+    adaptive = isinstance(chunk_size, AdaptiveChunkSize)
+    if max_in_flight is None:
+        max_in_flight = 1
+    # Records generated from a DataFrame are built one chunk at a time below,
+    # rather than one record at a time by the client
+    lazy_records = any([
+        isinstance(argument_info['value'], honeycomb_io.utils.DataFrameRecords)
+        for argument_info in arguments.values()
+    ])
+    if not adaptive and not lazy_records and checkpoint_path is None and max_in_flight == 1:
+        with request_context():
+            return client.bulk_mutation(
+                request_name=request_name,
+                arguments=arguments,
+                return_object=return_object,
+                chunk_size=chunk_size
+            )
+    num_mutations, argument_is_list = mutation_argument_structure(arguments)
+    logger.info('Preparing to request {} mutations using endpoint {} with up to {} chunks in flight'.format(
+        num_mutations,
+        request_name,
+        max_in_flight
+    ))
+    completed_chunks = dict()
+    if checkpoint_path is not None:
+        completed_chunks = load_mutation_journal(
+            checkpoint_path=checkpoint_path,
+            fingerprint=mutation_fingerprint(
+                request_name=request_name,
+                arguments=arguments,
+                return_object=return_object
+            ),
+            num_mutations=num_mutations
+        )
+        if len(completed_chunks) > 0:
+            logger.info('Resuming from checkpoint {} with {} of {} mutations already complete'.format(
+                checkpoint_path,
+                sum([len(results) for results in completed_chunks.values()]),
+                num_mutations
+            ))
+    def send_chunk(chunk_index, mutation_index_start, mutation_index_end, child_request_list):
+        # With an adaptive chunk size, a failed chunk is resent in smaller pieces
+        results = list()
+        while True:
+            payload_bytes = len(json.dumps(
+                [child_request['arguments'] for child_request in child_request_list],
+                default=str
+            )) if adaptive else None
+            start_time = time.monotonic()
+            try:
+                with request_context(chunk_index=chunk_index):
+                    result = client.compound_request(
+                        parent_request_type='mutation',
+                        parent_request_name=request_name,
+                        child_request_list=child_request_list
+                    )
+                if not isinstance(result, dict):
+                    raise ValueError('Received unexpected result from Honeycomb: {}'.format(result))
+            except Exception as error:
+                if adaptive and chunk_size.back_off(error):
+                    child_request_list = child_request_list[:chunk_size.chunk_size]
+                    continue
+                raise
+            if adaptive:
+                chunk_size.update(
+                    num_items=len(child_request_list),
+                    latency=time.monotonic() - start_time,
+                    payload_bytes=payload_bytes
+                )
+            results.extend(result.values())
+            sent_index_end = mutation_index_start + len(results)
+            if sent_index_end >= mutation_index_end:
+                return results
+            child_request_list = mutation_child_requests(
+                request_name=request_name,
+                arguments=arguments,
+                argument_is_list=argument_is_list,
+                return_object=return_object,
+                mutation_index_start=sent_index_end,
+                mutation_index_end=min(
+                    sent_index_end + (chunk_size.chunk_size if adaptive else len(child_request_list)),
+                    mutation_index_end
+                )
+            )
+    chunk_results = dict(completed_chunks)
+    failure = None
+    in_flight = collections.deque()
+    mutation_index_start = 0
+    chunk_index = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        while len(in_flight) > 0 or (failure is None and mutation_index_start < num_mutations):
+            # Build and send further chunks while earlier responses are outstanding
+            while failure is None and mutation_index_start < num_mutations and len(in_flight) < max_in_flight:
+                if mutation_index_start in completed_chunks:
+                    mutation_index_start += len(completed_chunks[mutation_index_start])
+                    continue
+                mutation_index_end = min(
+                    [mutation_index_start + (chunk_size.chunk_size if adaptive else chunk_size), num_mutations] +
+                    [index for index in completed_chunks.keys() if index > mutation_index_start]
+                )
+                logger.info('Sending chunk {} ({} mutations)'.format(
+                    chunk_index,
+                    mutation_index_end - mutation_index_start
+                ))
+                child_request_list = mutation_child_requests(
+                    request_name=request_name,
+                    arguments=arguments,
+                    argument_is_list=argument_is_list,
+                    return_object=return_object,
+                    mutation_index_start=mutation_index_start,
+                    mutation_index_end=mutation_index_end
+                )
+                in_flight.append((
+                    mutation_index_start,
+                    executor.submit(send_chunk, chunk_index, mutation_index_start, mutation_index_end, child_request_list)
+                ))
+                mutation_index_start = mutation_index_end
+                chunk_index += 1
+            if len(in_flight) == 0:
+                break
+            # Chunks already sent are still collected (and journaled) after an
+            # earlier chunk fails
+            chunk_start, future = in_flight.popleft()
+            try:
+                results = future.result()
+            except Exception as error:
+                if failure is None:
+                    failure = error
+                continue
+            chunk_results[chunk_start] = results
+            if checkpoint_path is not None:
+                append_mutation_journal(
+                    checkpoint_path=checkpoint_path,
+                    mutation_index_start=chunk_start,
+                    mutation_index_end=chunk_start + len(results),
+                    results=results
+                )
+    if adaptive:
+        logger.info('Adaptive chunk size for {} settled at {}'.format(
+            request_name,
+            chunk_size.chunk_size
+        ))
+    if failure is not None:
+        if checkpoint_path is None:
+            raise failure
+        results = [None]*num_mutations
+        for chunk_start, chunk_result_list in chunk_results.items():
+            results[chunk_start:chunk_start + len(chunk_result_list)] = chunk_result_list
+        raise honeycomb_io.exceptions.HoneycombPartialWriteError(
+            'Mutation failed after {} of {} mutations. Rerun with checkpoint {} to resume'.format(
+                sum([len(chunk_result_list) for chunk_result_list in chunk_results.values()]),
+                num_mutations,
+                checkpoint_path
+            ),
+            results=results
+        ) from failure
+    if checkpoint_path is not None:
+        finish_mutation_journal(checkpoint_path)
+    result_list = list()
+    for chunk_start in sorted(chunk_results.keys()):
+        result_list.extend(chunk_results[chunk_start])
+    return result_list
+
+def mutation_fingerprint(
+    request_name,
+    arguments,
+    return_object
+):
+    return hashlib.sha256(json.dumps(
+        {
+            'request_name': request_name,
+            'arguments': arguments,
+            'return_object': return_object
+        },
+        sort_keys=True,
+        default=fingerprint_value
+    ).encode('utf-8')).hexdigest()
+
+# Records generated from a DataFrame are hashed in batches rather than
+# serialized all at once
+def fingerprint_value(value):
+    if isinstance(value, honeycomb_io.utils.DataFrameRecords):
+        return value.sha256()
+    return str(value)
+
+# Journal is a JSON Lines file: a header identifying the mutation, followed by
+# one line per completed chunk and, once every chunk has completed, a line
+# marking the run as finished. Pipelined chunks can complete around a failed
+# one, so recorded chunks may leave gaps. Rerunning a finished mutation
+# returns the journaled results without writing anything, while a different
+# mutation starts the finished journal over. An unfinished journal can only
+# be resumed by the same mutation
+def load_mutation_journal(
+    checkpoint_path,
+    fingerprint,
+    num_mutations
+):
+    completed_chunks = dict()
+    valid_length = 0
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, 'rb') as fp:
+            header_line = fp.readline()
+            if header_line.endswith(b'\n'):
+                header = json.loads(header_line)
+                valid_length = fp.tell()
+                finished = False
+                for line in iter(fp.readline, b''):
+                    # A chunk record cut short by a crash was never acknowledged
+                    if not line.endswith(b'\n'):
+                        logger.warning('Discarding incomplete entry at end of checkpoint {}'.format(
+                            checkpoint_path
+                        ))
+                        break
+                    entry = json.loads(line)
+                    # The finished marker is rewritten when the run finishes again
+                    if entry.get('finished'):
+                        finished = True
+                        break
+                    completed_chunks[entry['start']] = entry['results']
+                    valid_length = fp.tell()
+                if header.get('fingerprint') != fingerprint:
+                    if not finished:
+                        raise honeycomb_io.exceptions.HoneycombWriteErrorNoRetry(
+                            'Checkpoint {} was written for a different mutation which has not finished. Delete it or use a different checkpoint path'.format(
+                                checkpoint_path
+                            )
+                        )
+                    logger.info('Checkpoint {} was written for a different, finished mutation. Starting it over'.format(
+                        checkpoint_path
+                    ))
+                    completed_chunks = dict()
+                    valid_length = 0
+                elif finished:
+                    logger.info('Checkpoint {} records this mutation as finished'.format(
+                        checkpoint_path
+                    ))
+    if valid_length == 0:
+        with open(checkpoint_path, 'w') as fp:
+            fp.write(json.dumps({
+                'fingerprint': fingerprint,
+                'num_mutations': num_mutations
+            }) + '\n')
+            fp.flush()
+            os.fsync(fp.fileno())
+    else:
+        os.truncate(checkpoint_path, valid_length)
+    return completed_chunks
+
+def finish_mutation_journal(checkpoint_path):
+    with open(checkpoint_path, 'a') as fp:
+        fp.write(json.dumps({'finished': True}) + '\n')
+        fp.flush()
+        os.fsync(fp.fileno())
+
+def append_mutation_journal(
+    checkpoint_path,
+    mutation_index_start,
+    mutation_index_end,
+    results
+):
+    with open(checkpoint_path, 'a') as fp:
+        fp.write(json.dumps({
+            'start': mutation_index_start,
+            'end': mutation_index_end,
+            'results': results
+        }) + '\n')
+        fp.flush()
+        os.fsync(fp.fileno())
+
+def mutation_argument_structure(arguments):
+    num_mutations = 1
+    argument_is_list = dict()
+    for argument_name, argument_info in arguments.items():
+        try:
+            num_argument_values = len(argument_info['value'])
+        except TypeError:
+            argument_is_list[argument_name] = False
+            continue
+        if not isinstance(argument_info['value'], (list, tuple, honeycomb_io.utils.DataFrameRecords)):
+            argument_is_list[argument_name] = False
+            continue
+        if num_mutations != 1 and num_argument_values != num_mutations:
+            raise ValueError('All argument values that are not singletons must be the same length')
+        argument_is_list[argument_name] = True
+        num_mutations = num_argument_values
+    return num_mutations, argument_is_list
+
+def mutation_child_requests(
+    request_name,
+    arguments,
+    argument_is_list,
+    return_object,
+    mutation_index_start,
+    mutation_index_end
+):
+    chunk_values = {
+        argument_name: arguments[argument_name]['value'][mutation_index_start:mutation_index_end]
+        for argument_name, is_list in argument_is_list.items()
+        if is_list
+    }
+    child_request_list = list()
+    for mutation_index in range(mutation_index_start, mutation_index_end):
+        child_arguments = dict()
+        for argument_name, is_list in argument_is_list.items():
+            if is_list:
+                value = chunk_values[argument_name][mutation_index - mutation_index_start]
+            else:
+                value = arguments[argument_name]['value']
+            child_arguments[argument_name] = {
+                'type': arguments[argument_name]['type'],
+                'value': value
+            }
+        child_request_list.append({
+            'name': request_name,
+            'arguments': child_arguments,
+            'return_object_name': 'return_object',
+            'return_object': return_object
+        })
+    return child_request_list
+
+def search_query_list_shards(
+    request_name,
+    shard_query_lists,
+    return_data,
+    id_field_name,
+    sort_arguments=None,
+    chunk_size=100,
+    max_workers=None,
+    max_query_list_values=DEFAULT_MAX_QUERY_LIST_VALUES,
+    checkpoint_path=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    logger.info('Fetching {} query shards from {} using {} workers'.format(
+        len(shard_query_lists),
+        request_name,
+        max_workers
+    ))
+    # Each shard keeps its own checkpoint alongside the specified one
+    def search_shard(shard_index, shard_query_list):
+        return bulk_query(
+            request_name=request_name,
+            arguments={
+                'query': {
+                    'type': 'QueryExpression!',
+                    'value': {
+                        'operator': 'AND',
+                        'children': shard_query_list
+                    }
+                }
+            },
+            return_data=return_data,
+            id_field_name=id_field_name,
+            chunk_size=chunk_size,
+            sort_arguments=sort_arguments,
+            max_query_list_values=max_query_list_values,
+            checkpoint_path='{}.shard-{}'.format(checkpoint_path, shard_index) if checkpoint_path is not None else None,
+            client=client
+        )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        shard_results = list(executor.map(search_shard, range(len(shard_query_lists)), shard_query_lists))
+    for shard_result in shard_results:
+        if not isinstance(shard_result, list):
+            raise ValueError('Received unexpected result from Honyecomb: {}'.format(
+                shard_result
+            ))
+    result = merge_shard_results(
+        shard_results=shard_results,
+        id_field_name=id_field_name,
+        sort_arguments=sort_arguments
+    )
+    return result
+
+def merge_shard_results(
+    shard_results,
+    id_field_name,
+    sort_arguments=None
+):
+    data = list()
+    data_ids = set()
+    for shard_result in shard_results:
+        for datum in shard_result:
+            datum_id = datum.get(id_field_name)
+            if datum_id in data_ids:
+                continue
+            data_ids.add(datum_id)
+            data.append(datum)
+    # Cursor pagination walks objects in ID order unless a sort is specified,
+    # so sorting on the ID (and then on any sort fields) reproduces the order
+    # of the serial fetch
+    data.sort(key=lambda datum: sort_value(datum.get(id_field_name)))
+    sort_fields = list()
+    if isinstance(sort_arguments, dict):
+        sort_fields = [sort_arguments]
+    elif isinstance(sort_arguments, list):
+        sort_fields = sort_arguments
+    for sort_field in reversed(sort_fields):
+        field = sort_field.get('field')
+        if len(data) > 0 and field not in data[0]:
+            logger.warning('Sort field \'{}\' not in return data. Merged shards will be in ID order'.format(
+                field
+            ))
+            continue
+        data.sort(
+            key=lambda datum: sort_value(datum.get(field)),
+            reverse=(sort_field.get('direction') == 'DESC')
+        )
+    return data
+
+# Splits the query's time range on timestamp_field into windows which are
+# fetched concurrently and merged in the order of a single search. Windows are
+# either window_size long, num_windows equal parts of the range, or (if only
+# target_rows_per_window is specified) sized from the row density of a short
+# first window. Without any of these (and max_workers), this is search_objects
+def search_objects_by_time_window(
+    object_name=None,
+    query_list=None,
+    return_data=None,
+    request_name=None,
+    id_field_name=None,
+    timestamp_field='timestamp',
+    window_size=None,
+    num_windows=None,
+    target_rows_per_window=None,
+    sort_arguments=None,
+    chunk_size=100,
+    max_workers=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    search_arguments = {
+        'object_name': object_name,
+        'return_data': return_data,
+        'request_name': request_name,
+        'id_field_name': id_field_name,
+        'sort_arguments': sort_arguments,
+        'chunk_size': chunk_size,
+        'client': client
+    }
+    windowed = (
+        window_size is not None or
+        num_windows is not None or
+        target_rows_per_window is not None or
+        (max_workers is not None and max_workers > 1)
+    )
+    time_range = None
+    if windowed and query_list is not None:
+        time_range = find_time_range(query_list, field=timestamp_field)
+        if time_range is None:
+            logger.warning('Query has no bounded range on \'{}\'. Fetching without time windows'.format(
+                timestamp_field
+            ))
+    if time_range is None:
+        return search_objects(
+            query_list=query_list,
+            max_workers=max_workers,
+            **search_arguments
+        )
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    if max_workers is None:
+        max_workers = DEFAULT_TIME_WINDOW_WORKERS
+    lower_index, upper_index, start, end = time_range
+    window_results = list()
+    if window_size is None and num_windows is None and target_rows_per_window is not None:
+        probe_end = start + (end - start)*TIME_WINDOW_PROBE_FRACTION
+        probe_query_list, query_list = split_query_list_at_boundaries(
+            query_list=query_list,
+            lower_index=lower_index,
+            upper_index=upper_index,
+            boundaries=[honeycomb_io.utils.to_honeycomb_datetime(probe_end)]
+        )
+        probe_result = search_objects(
+            query_list=probe_query_list,
+            **search_arguments
+        )
+        window_results.append(probe_result)
+        if len(probe_result) > 0:
+            window_size = (probe_end - start)*target_rows_per_window/len(probe_result)
+        else:
+            num_windows = max_workers
+        start = probe_end
+    elif window_size is None and num_windows is None:
+        num_windows = max_workers
+    boundaries = time_window_boundaries(
+        start=start,
+        end=end,
+        window_size=window_size,
+        num_windows=num_windows
+    )
+    window_query_lists = split_query_list_at_boundaries(
+        query_list=query_list,
+        lower_index=lower_index,
+        upper_index=upper_index,
+        boundaries=[honeycomb_io.utils.to_honeycomb_datetime(boundary) for boundary in boundaries]
+    )
+    logger.info('Fetching {} time windows from {} to {} using {} workers'.format(
+        len(window_query_lists),
+        honeycomb_io.utils.to_honeycomb_datetime(start),
+        honeycomb_io.utils.to_honeycomb_datetime(end),
+        max_workers
+    ))
+    def search_window(window_query_list):
+        return search_objects(
+            query_list=window_query_list,
+            **search_arguments
+        )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        window_results.extend(executor.map(search_window, window_query_lists))
+    # Merged like query shards, so the result is in the same order as a
+    # single search_objects call
+    data = merge_shard_results(
+        shard_results=window_results,
+        id_field_name=id_field_name,
+        sort_arguments=sort_arguments
+    )
+    return data
+
+# Sorts None last and numbers before strings (and values of any other type by
+# their string form), so that merging never compares values of different types
+def sort_value(value):
+    if value is None:
+        return (1, 0, '')
+    if isinstance(value, (int, float)):
+        return (0, 0, value)
+    if isinstance(value, str):
+        return (0, 1, value)
+    return (0, 2, str(value))
+
+def split_query_list(
+    query_list,
+    num_shards
+):
+    if num_shards is None or num_shards < 2:
+        return [query_list]
+    shard_query_lists = split_query_list_by_values(
+        query_list=query_list,
+        num_shards=num_shards
+    )
+    if shard_query_lists is None:
+        shard_query_lists = split_query_list_by_time(
+            query_list=query_list,
+            num_shards=num_shards
+        )
+    if shard_query_lists is None:
+        return [query_list]
+    return shard_query_lists
+
+def split_query_list_by_values(
+    query_list,
+    num_shards
+):
+    split_index = None
+    for query_index, query in enumerate(query_list):
+        if query.get('operator') not in LIST_OPERATORS or not isinstance(query.get('values'), (list, tuple)):
+            continue
+        if split_index is None or len(query['values']) > len(query_list[split_index]['values']):
+            split_index = query_index
+    if split_index is None:
+        return None
+    values = list(query_list[split_index]['values'])
+    num_shards = min(num_shards, len(values))
+    if num_shards < 2:
+        return None
+    shard_query_lists = list()
+    for shard_index in range(num_shards):
+        shard_values = values[
+            (shard_index*len(values))//num_shards:
+            ((shard_index + 1)*len(values))//num_shards
+        ]
+        shard_query_list = list(query_list)
+        shard_query_list[split_index] = {**query_list[split_index], 'values': shard_values}
+        shard_query_lists.append(shard_query_list)
+    return shard_query_lists
+
+# Splits every list predicate with more than max_values (distinct) values into
+# runs of at most max_values, so each shard query is one combination of runs
+def split_query_list_by_size(
+    query_list,
+    max_values=DEFAULT_MAX_QUERY_LIST_VALUES
+):
+    if max_values is None or max_values < 1:
+        return None
+    shard_query_lists = [list(query_list)]
+    for query_index, query in enumerate(query_list):
+        if query.get('operator') not in LIST_OPERATORS or not isinstance(query.get('values'), (list, tuple)):
+            continue
+        if len(query['values']) <= max_values:
+            continue
+        try:
+            values = list(dict.fromkeys(query['values']))
+        except TypeError:
+            values = list(query['values'])
+        if len(values) <= max_values:
+            for shard_query_list in shard_query_lists:
+                shard_query_list[query_index] = {**query, 'values': values}
+            continue
+        shard_query_lists = [
+            shard_query_list[:query_index] +
+            [{**query, 'values': values[value_index:(value_index + max_values)]}] +
+            shard_query_list[(query_index + 1):]
+            for shard_query_list in shard_query_lists
+            for value_index in range(0, len(values), max_values)
+        ]
+    if len(shard_query_lists) < 2:
+        return None
+    return shard_query_lists
+
+# Only search requests (whose sole argument is a query) can be sharded
+def split_query_arguments_by_size(
+    arguments,
+    max_values=DEFAULT_MAX_QUERY_LIST_VALUES
+):
+    if arguments is None or list(arguments.keys()) != ['query']:
+        return None
+    query = arguments['query'].get('value')
+    if not isinstance(query, dict):
+        return None
+    if query.get('operator') == 'AND' and isinstance(query.get('children'), list):
+        query_list = query['children']
+    else:
+        query_list = [query]
+    return split_query_list_by_size(
+        query_list=query_list,
+        max_values=max_values
+    )
+
+def split_query_list_by_time(
+    query_list,
+    num_shards
+):
+    time_range = find_time_range(query_list)
+    if time_range is None:
+        return None
+    lower_index, upper_index, start, end = time_range
+    boundaries = time_window_boundaries(
+        start=start,
+        end=end,
+        num_windows=num_shards
+    )
+    return split_query_list_at_boundaries(
+        query_list=query_list,
+        lower_index=lower_index,
+        upper_index=upper_index,
+        boundaries=[honeycomb_io.utils.to_honeycomb_datetime(boundary) for boundary in boundaries]
+    )
+
+# Returns the indices and values of the first pair of lower and upper bounds
+# on the same field (or on the specified field) which parse as a time range
+def find_time_range(
+    query_list,
+    field=None
+):
+    lower_bounds = dict()
+    upper_bounds = dict()
+    for query_index, query in enumerate(query_list):
+        if field is not None and query.get('field') != field:
+            continue
+        if query.get('operator') in ['GT', 'GTE']:
+            lower_bounds[query.get('field')] = query_index
+        if query.get('operator') in ['LT', 'LTE']:
+            upper_bounds[query.get('field')] = query_index
+    for bound_field, lower_index in lower_bounds.items():
+        upper_index = upper_bounds.get(bound_field)
+        if upper_index is None:
+            continue
+        try:
+            start = pd.to_datetime(query_list[lower_index]['value'], utc=True)
+            end = pd.to_datetime(query_list[upper_index]['value'], utc=True)
+        except:
+            continue
+        if pd.isnull(start) or pd.isnull(end) or end <= start:
+            continue
+        return lower_index, upper_index, start, end
+    return None
+
+def time_window_boundaries(
+    start,
+    end,
+    window_size=None,
+    num_windows=None
+):
+    if window_size is not None:
+        window_size = pd.Timedelta(window_size)
+        if window_size <= pd.Timedelta(0):
+            raise ValueError('Time window size must be positive')
+        num_windows = math.ceil((end - start)/window_size)
+        return [start + window_size*window_index for window_index in range(1, num_windows)]
+    if num_windows is None or num_windows < 1:
+        raise ValueError('Must specify either time window size or a positive number of time windows')
+    return [start + (end - start)*window_index/num_windows for window_index in range(1, num_windows)]
+
+def split_query_list_at_boundaries(
+    query_list,
+    lower_index,
+    upper_index,
+    boundaries
+):
+    lower_query = query_list[lower_index]
+    upper_query = query_list[upper_index]
+    field = lower_query.get('field')
+    num_shards = len(boundaries) + 1
+    shard_query_lists = list()
+    for shard_index in range(num_shards):
+        if shard_index == 0:
+            shard_lower_query = lower_query
+        else:
+            shard_lower_query = {'field': field, 'operator': 'GTE', 'value': boundaries[shard_index - 1]}
+        if shard_index == num_shards - 1:
+            shard_upper_query = upper_query
+        else:
+            shard_upper_query = {'field': field, 'operator': 'LT', 'value': boundaries[shard_index]}
+        shard_query_list = list()
+        for query_index, query in enumerate(query_list):
+            if query_index == lower_index:
+                query = shard_lower_query
+            elif query_index == upper_index:
+                query = shard_upper_query
+            shard_query_list.append(query)
+        shard_query_lists.append(shard_query_list)
+    return shard_query_lists
+
+def iter_search_objects(
+    object_name=None,
+    query_list=None,
+    return_data=None,
+    request_name=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    yield_pages=False,
+    start_cursor=None,
+    checkpoint_path=None,
+    cursor_callback=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if query_list is None:
+        logger.warn('No query specified')
+        return
+    if return_data is None:
+        logger.warn('No return data specified')
+        return
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    yield from iter_bulk_query(
+        request_name=request_name,
+        arguments={
+            'query': {
+                'type': 'QueryExpression!',
+                'value': {
+                    'operator': 'AND',
+                    'children': query_list
+                }
+            }
+        },
+        return_data=return_data,
+        id_field_name=id_field_name,
+        sort_arguments=sort_arguments,
+        chunk_size=chunk_size,
+        yield_pages=yield_pages,
+        start_cursor=start_cursor,
+        checkpoint_path=checkpoint_path,
+        cursor_callback=cursor_callback,
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+
+def iter_fetch_all_objects(
+    object_name=None,
+    return_data=None,
+    request_name=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    yield_pages=False,
+    start_cursor=None,
+    checkpoint_path=None,
+    cursor_callback=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if return_data is None:
+        logger.warn('No return data specified')
+        return
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.fetch_all_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if id_field_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either ID field name or object name')
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
+    yield from iter_bulk_query(
+        request_name=request_name,
+        arguments=None,
+        return_data=return_data,
+        id_field_name=id_field_name,
+        sort_arguments=sort_arguments,
+        chunk_size=chunk_size,
+        yield_pages=yield_pages,
+        start_cursor=start_cursor,
+        checkpoint_path=checkpoint_path,
+        cursor_callback=cursor_callback,
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+
+def iter_bulk_query(
+    request_name,
+    arguments=None,
+    return_data=None,
+    id_field_name=None,
+    sort_arguments=None,
+    chunk_size=100,
+    yield_pages=False,
+    start_cursor=None,
+    checkpoint_path=None,
+    journal_pages=False,
+    cursor_callback=None,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if arguments is None:
+        arguments = dict()
+    if 'page' in arguments.keys():
+        raise ValueError('Specifying pagination parameters is redundant. Use chunk_size and sort_arguments')
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    chunk_size = resolve_chunk_size(chunk_size)
+    adaptive = isinstance(chunk_size, AdaptiveChunkSize)
+    template = query_template(
+        request_type='query',
+        request_name=request_name,
+        argument_types={
+            **{
+                argument_name: argument_info['type']
+                for argument_name, argument_info in arguments.items()
+            },
+            'page': 'PaginationInput'
+        },
+        return_object=[
+            {'data': return_data},
+            {'page_info': [
+                'count',
+                'cursor'
+            ]}
+        ],
+        client=client,
+        item_return_object=return_data
+    )
+    argument_values = {
+        argument_name: argument_info['value']
+        for argument_name, argument_info in arguments.items()
+    }
+    cursor = start_cursor
+    data_ids = set()
+    request_index = 0
+    num_data_items_total = 0
+    complete = False
+    if checkpoint_path is not None:
+        fingerprint = query_fingerprint(
+            request_name=request_name,
+            arguments=arguments,
+            return_data=return_data,
+            id_field_name=id_field_name,
+            sort_arguments=sort_arguments,
+            start_cursor=start_cursor,
+            journal_pages=journal_pages
+        )
+        journal_state, replay_pages = load_query_journal(
+            checkpoint_path=checkpoint_path,
+            fingerprint=fingerprint
+        )
+        if journal_state is None:
+            write_query_journal_state(
+                checkpoint_path=checkpoint_path,
+                fingerprint=fingerprint,
+                page_index=0,
+                cursor=start_cursor
+            )
+        else:
+            cursor = journal_state['cursor']
+            request_index = journal_state['page']
+            logger.info('Resuming query {} from checkpoint {} at page {}'.format(
+                request_name,
+                checkpoint_path,
+                request_index
+            ))
+        # Pages fetched before the interruption but not yet consumed (with
+        # journal_pages, all pages fetched) are replayed from the journal
+        for replay_page in replay_pages:
+            page = replay_page['data']
+            data_ids.update([datum[id_field_name] for datum in page])
+            num_data_items_total += len(page)
+            if yield_pages:
+                if len(page) > 0:
+                    yield page
+            else:
+                yield from page
+            cursor = replay_page['cursor']
+            if cursor_callback is not None:
+                cursor_callback(cursor, replay_page['page'])
+            request_index = replay_page['page'] + 1
+        if len(replay_pages) > 0:
+            complete = cursor is None
+            if not complete and not journal_pages:
+                write_query_journal_state(
+                    checkpoint_path=checkpoint_path,
+                    fingerprint=fingerprint,
+                    page_index=request_index,
+                    cursor=cursor
+                )
+    while not complete:
+        result = None
+        start_time = time.monotonic()
+        try:
+            with request_context(chunk_index=request_index):
+                result = template.execute(
+                    variables={
+                        **argument_values,
+                        'page': {
+                            'max': chunk_size.chunk_size if adaptive else chunk_size,
+                            'cursor': cursor,
+                            'sort': sort_arguments
+                        }
+                    },
+                    client=client
+                )
+            returned_data = result['data']
+            count = result['page_info']['count']
+            next_cursor = result['page_info']['cursor']
+        except Exception as error:
+            # Cursor is unchanged, so a smaller retry picks up the same page
+            if adaptive and chunk_size.back_off(error):
+                continue
+            if isinstance(error, (KeyError, TypeError)):
+                raise ValueError('Received unexpected result from Honeycomb: {}'.format(result))
+            raise
+        if adaptive:
+            chunk_size.update(
+                num_items=len(returned_data),
+                latency=time.monotonic() - start_time,
+                payload_bytes=len(json.dumps(returned_data))
+            )
+        cursor = next_cursor
+        if len(returned_data) != count:
+            raise ValueError('Honeycomb reported count as {} but received {} data points'.format(
+                count,
+                len(returned_data)
+            ))
+        if len(returned_data) == 0:
+            break
+        page = list()
+        for datum in returned_data:
+            if id_field_name not in datum:
+                raise ValueError('Returned datum does not contain field {}'.format(id_field_name))
+            if datum[id_field_name] in data_ids:
+                continue
+            data_ids.add(datum[id_field_name])
+            page.append(datum)
+        logger.info('Query request {} returned {} data items containing {} new data items'.format(
+            request_index,
+            len(returned_data),
+            len(page)
+        ))
+        num_data_items_total += len(page)
+        if checkpoint_path is not None:
+            append_query_journal(
+                checkpoint_path=checkpoint_path,
+                page_index=request_index,
+                cursor=cursor,
+                data=page
+            )
+        if yield_pages:
+            if len(page) > 0:
+                yield page
+        else:
+            yield from page
+        # Called once the page has been consumed, so a caller which persists
+        # the cursor can pass it back as start_cursor to resume after this page
+        if cursor_callback is not None:
+            cursor_callback(cursor, request_index)
+        if cursor is None:
+            break
+        request_index += 1
+        if checkpoint_path is not None and not journal_pages:
+            write_query_journal_state(
+                checkpoint_path=checkpoint_path,
+                fingerprint=fingerprint,
+                page_index=request_index,
+                cursor=cursor
+            )
+    # A finished query is rerun from the start rather than replayed
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    logger.info('Bulk query returned {} data items total'.format(
+        num_data_items_total
+    ))
+
+def query_fingerprint(
+    request_name,
+    arguments,
+    return_data,
+    id_field_name,
+    sort_arguments,
+    start_cursor=None,
+    journal_pages=False
+):
+    return hashlib.sha256(json.dumps(
+        {
+            'request_name': request_name,
+            'arguments': arguments,
+            'return_data': return_data,
+            'id_field_name': id_field_name,
+            'sort_arguments': sort_arguments,
+            'start_cursor': start_cursor,
+            'journal_pages': journal_pages
+        },
+        sort_keys=True,
+        default=str
+    ).encode('utf-8')).hexdigest()
+
+# Journal is a JSON Lines file: a header identifying the query, a line with
+# the index and cursor of the next page to hand back, and a line for each page
+# fetched from there on with its (de-duplicated) data and the cursor following
+# it. Streaming callers rewrite the journal once each page is consumed, so it
+# holds at most the one page not yet handed back (and de-duplication against
+# earlier pages does not survive a resume). Callers which collect the whole
+# result (journal_pages) keep every page, since the pages handed back before
+# an interruption are lost with the caller's list. The journal is removed once
+# the query finishes
+def load_query_journal(
+    checkpoint_path,
+    fingerprint
+):
+    journal_state = None
+    replay_pages = list()
+    if not os.path.exists(checkpoint_path):
+        return journal_state, replay_pages
+    with open(checkpoint_path, 'rb') as fp:
+        lines = fp.read().split(b'\n')
+    # A line cut short by a crash (the last element, if not empty) was never
+    # acknowledged
+    if len(lines[-1]) > 0:
+        logger.warning('Discarding incomplete entry at end of checkpoint {}'.format(
+            checkpoint_path
+        ))
+    lines = lines[:-1]
+    if len(lines) < 2:
+        return journal_state, replay_pages
+    header = json.loads(lines[0])
+    if header.get('fingerprint') != fingerprint:
+        raise ValueError('Checkpoint {} was written for a different query'.format(
+            checkpoint_path
+        ))
+    journal_state = json.loads(lines[1])
+    for line in lines[2:]:
+        journal_page = json.loads(line)
+        if journal_page['page'] >= journal_state['page']:
+            replay_pages.append(journal_page)
+    return journal_state, replay_pages
+
+def write_query_journal_state(
+    checkpoint_path,
+    fingerprint,
+    page_index,
+    cursor
+):
+    temporary_path = '{}.{}.tmp'.format(checkpoint_path, threading.get_ident())
+    with open(temporary_path, 'w') as fp:
+        fp.write(json.dumps({'fingerprint': fingerprint}) + '\n')
+        fp.write(json.dumps({'page': page_index, 'cursor': cursor}) + '\n')
+        fp.flush()
+        os.fsync(fp.fileno())
+    os.replace(temporary_path, checkpoint_path)
+
+def append_query_journal(
+    checkpoint_path,
+    page_index,
+    cursor,
+    data
+):
+    with open(checkpoint_path, 'a') as fp:
+        fp.write(json.dumps({
+            'page': page_index,
+            'cursor': cursor,
+            'data': data
+        }) + '\n')
+        fp.flush()
+        os.fsync(fp.fileno())
+
+def iter_page_dataframes(
+    pages,
+    generate_dataframe=None
+):
+    for page in pages:
+        if generate_dataframe is None:
+            yield pd.DataFrame(page)
+        else:
+            yield generate_dataframe(page)
+
+# Query documents are generated once for each combination of request type,
+# request name, argument types, and return object, and reused for every
+# request with that shape (e.g., the pages of a bulk query or per-datapoint
+# fetches), so that repeated requests only pay for encoding their variables
+QUERY_TEMPLATE_CACHE_SIZE = 256
+
+class QueryTemplate:
+    def __init__(
+        self,
+        request_type,
+        request_name,
+        argument_types,
+        return_object,
+        client,
+        item_return_object=None
+    ):
+        self.request_type = request_type
+        self.request_name = request_name
+        self.argument_types = dict(argument_types)
+        self.return_object = return_object
+        self.document = client.request_string(
+            request_type=request_type,
+            request_name=request_name,
+            arguments={
+                argument_name: {'type': argument_type}
+                for argument_name, argument_type in self.argument_types.items()
+            } if len(self.argument_types) > 0 else None,
+            return_object=return_object
+        )
+        # Result items are flattened into one column per leaf field, named by
+        # its dotted path (as in pandas.json_normalize)
+        self.column_paths = flatten_paths(
+            item_return_object if item_return_object is not None else return_object
+        )
+        self.column_names = ['.'.join(path) for path in self.column_paths]
+
+    def execute(
+        self,
+        variables,
+        client
+    ):
+        response = client.client.execute(self.document, variables)
+        try:
+            return_value = response[self.request_name]
+        except:
+            raise ValueError('Received unexpected response from Honeycomb: {}'.format(response))
+        return return_value
+
+    def flatten(self, data):
+        columns = [list() for _ in self.column_paths]
+        for datum in data:
+            for path, column in zip(self.column_paths, columns):
+                value = datum
+                for field_name in path:
+                    if not isinstance(value, dict):
+                        value = None
+                        break
+                    value = value.get(field_name)
+                column.append(value)
+        return dict(zip(self.column_names, columns))
+
+    def dataframe(self, data):
+        return pd.DataFrame(self.flatten(data), columns=self.column_names)
+
+def flatten_paths(return_object, prefix=()):
+    paths = list()
+    for selection in return_object:
+        if isinstance(selection, dict):
+            for field_name, subselections in selection.items():
+                # Fields selected through inline fragments share the columns
+                # of the enclosing object
+                if field_name.startswith('...'):
+                    paths.extend(flatten_paths(subselections, prefix))
+                else:
+                    paths.extend(flatten_paths(subselections, prefix + (field_name,)))
+        else:
+            paths.append(prefix + (selection,))
+    return list(dict.fromkeys(paths))
+
+_query_templates = collections.OrderedDict()
+_query_templates_lock = threading.Lock()
+
+def query_template(
+    request_type,
+    request_name,
+    argument_types,
+    return_object,
+    client,
+    item_return_object=None
+):
+    template_key = json.dumps(
+        [request_type, request_name, argument_types, return_object, item_return_object],
+        sort_keys=True
+    )
+    with _query_templates_lock:
+        template = _query_templates.get(template_key)
+        if template is not None:
+            _query_templates.move_to_end(template_key)
+            return template
+    template = QueryTemplate(
+        request_type=request_type,
+        request_name=request_name,
+        argument_types=argument_types,
+        return_object=return_object,
+        client=client,
+        item_return_object=item_return_object
+    )
+    with _query_templates_lock:
+        _query_templates[template_key] = template
+        while len(_query_templates) > QUERY_TEMPLATE_CACHE_SIZE:
+            _query_templates.popitem(last=False)
+    return template
+
+def clear_query_templates():
+    with _query_templates_lock:
+        _query_templates.clear()
+
+# Same arguments and return value as client.request (without file uploads)
+def template_request(
+    request_type,
+    request_name,
+    arguments,
+    return_object,
+    client
+):
+    if arguments is None:
+        arguments = dict()
+    template = query_template(
+        request_type=request_type,
+        request_name=request_name,
+        argument_types={
+            argument_name: argument_info['type']
+            for argument_name, argument_info in arguments.items()
+        },
+        return_object=return_object,
+        client=client
+    )
+    return template.execute(
+        variables={
+            argument_name: argument_info['value']
+            for argument_name, argument_info in arguments.items()
+        } if len(arguments) > 0 else None,
+        client=client
+    )
+
 def fetch_latest_object(
     object_name=None,
     query_list=None,
@@ -283,11 +1946,11 @@ def fetch_latest_object(
     if request_name is None:
         if object_name is None:
             raise ValueError('Must specify either request name or object name')
-        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name)
+        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name, client=client, uri=uri)
     if id_field_name is None:
         if object_name is None:
             raise ValueError('Must specify either ID field name or object name')
-        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name)
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
     if timestamp_field not in return_data:
         raise ValueError('Timestamp field \'{}\' must be included in return data specification'.format(
             timestamp_field
@@ -347,12 +2010,129 @@ def fetch_latest_object(
         return None
     return data[0]
 
+def fetch_latest_objects(
+    group_field,
+    group_values,
+    object_name=None,
+    query_list=None,
+    return_data=None,
+    request_name=None,
+    timestamp_field='timestamp',
+    time_limit_hours=24,
+    batch_size=50,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if return_data is None:
+        logger.warn('No return data specified')
+        data = dict()
+        return data
+    if request_name is None:
+        if object_name is None:
+            raise ValueError('Must specify either request name or object name')
+        request_name = honeycomb_io.schema.search_endpoint_name(object_name=object_name, client=client, uri=uri)
+    if timestamp_field not in return_data:
+        raise ValueError('Timestamp field \'{}\' must be included in return data specification'.format(
+            timestamp_field
+        ))
+    if query_list is None:
+        query_list = list()
+    group_values = list(dict.fromkeys(group_values))
+    time_limit = honeycomb_io.utils.to_honeycomb_datetime(
+        datetime.datetime.now(tz=datetime.timezone.utc) -
+        datetime.timedelta(hours=time_limit_hours)
+    )
+    client = generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    # Each batch is a single document with one aliased search per group value
+    data = dict()
+    num_batches = math.ceil(len(group_values)/batch_size)
+    logger.info('Fetching latest {} objects for {} values of \'{}\' in {} requests'.format(
+        request_name,
+        len(group_values),
+        group_field,
+        num_batches
+    ))
+    for batch_index in range(num_batches):
+        batch_group_values = group_values[batch_index*batch_size:(batch_index + 1)*batch_size]
+        child_request_list = list()
+        for group_value in batch_group_values:
+            child_request_list.append({
+                'name': request_name,
+                'arguments': {
+                    'query': {
+                        'type': 'QueryExpression!',
+                        'value': {
+                            'operator': 'AND',
+                            'children': list(query_list) + [
+                                {'field': group_field, 'operator': 'EQ', 'value': group_value},
+                                {'field': timestamp_field, 'operator': 'GTE', 'value': time_limit}
+                            ]
+                        }
+                    },
+                    'page': {
+                        'type': 'PaginationInput',
+                        'value': {
+                            'max': 1,
+                            'sort': {
+                                'field': timestamp_field,
+                                'direction': 'DESC'
+                            }
+                        }
+                    }
+                },
+                'return_object_name': 'latest',
+                'return_object': [
+                    {'data': return_data}
+                ]
+            })
+        with request_context(chunk_index=batch_index):
+            result = client.compound_request(
+                parent_request_type='query',
+                parent_request_name=request_name,
+                child_request_list=child_request_list
+            )
+        if not isinstance(result, dict):
+            raise ValueError('Received unexpected result from Honyecomb: {}'.format(
+                result
+            ))
+        for child_request_index, group_value in enumerate(batch_group_values):
+            child_result = result.get('latest_{}'.format(child_request_index))
+            if not isinstance(child_result, dict) or not isinstance(child_result.get('data'), list):
+                raise ValueError('Received unexpected result from Honyecomb: {}'.format(
+                    child_result
+                ))
+            if len(child_result.get('data')) == 0:
+                data[group_value] = None
+            else:
+                data[group_value] = child_result.get('data')[0]
+    num_missing = len([datum for datum in data.values() if datum is None])
+    if num_missing > 0:
+        logger.warning('No objects returned from endpoint {} for {} of {} values of \'{}\''.format(
+            request_name,
+            num_missing,
+            len(group_values),
+            group_field
+        ))
+    return data
+
 def delete_objects(
     object_name=None,
     ids=None,
     request_name=None,
     id_field_name=None,
     chunk_size=100,
+    max_in_flight=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -367,11 +2147,11 @@ def delete_objects(
     if request_name is None:
         if object_name is None:
             raise ValueError('Must specify either request name or object name')
-        request_name = honeycomb_io.schema.delete_endpoint_name(object_name=object_name)
+        request_name = honeycomb_io.schema.delete_endpoint_name(object_name=object_name, client=client, uri=uri)
     if id_field_name is None:
         if object_name is None:
             raise ValueError('Must specify either ID field name or object name')
-        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name)
+        id_field_name = honeycomb_io.schema.id_field_name(object_name=object_name, client=client, uri=uri)
     data_id_list = honeycomb_io.utils.parse_data_id_sequence(ids=ids)
     client = generate_client(
         client=client,
@@ -381,7 +2161,7 @@ def delete_objects(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_mutation(
+    result = bulk_mutation(
         request_name=request_name,
         arguments = {
             id_field_name: {
@@ -393,7 +2173,10 @@ def delete_objects(
             'status',
             'error'
         ],
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+        object_name=object_name,
+        client=client
     )
     if not isinstance(result, list):
         raise ValueError('Received unexpected result from Honyecomb: {}'.format(
@@ -411,11 +2194,293 @@ def generate_client(
     client_secret=None
 ):
     if client is None:
-        client=minimal_honeycomb.MinimalHoneycombClient(
+        client = fetch_registered_client(
             uri=uri,
             token_uri=token_uri,
             audience=audience,
             client_id=client_id,
             client_secret=client_secret
         )
+    return instrument_client(client)
+
+# Clients are shared across calls so that each set of credentials fetches its
+# OAuth token once. The underlying GraphQL client caches the token and
+# refreshes it shortly before it expires. It sends each request with a fresh
+# requests.post() call, so HTTP connections are not pooled between requests.
+_client_registry = dict()
+_client_registry_lock = threading.Lock()
+_client_registry_stats = {
+    'hits': 0,
+    'misses': 0
+}
+
+def fetch_registered_client(
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    if uri is None:
+        uri = os.getenv('HONEYCOMB_URI')
+    if audience is None:
+        audience = os.getenv('HONEYCOMB_AUDIENCE')
+    if client_id is None:
+        client_id = os.getenv('HONEYCOMB_CLIENT_ID')
+    if token_uri is None:
+        token_uri = os.getenv('HONEYCOMB_TOKEN_URI')
+    if client_secret is None:
+        client_secret = os.getenv('HONEYCOMB_CLIENT_SECRET')
+    # The secret is only held in the key as a hash
+    registry_key = (
+        uri,
+        token_uri,
+        audience,
+        client_id,
+        hashlib.sha256(str(client_secret).encode('utf-8')).hexdigest()
+    )
+    with _client_registry_lock:
+        client = _client_registry.get(registry_key)
+        if client is not None:
+            _client_registry_stats['hits'] += 1
+            return client
+        _client_registry_stats['misses'] += 1
+        logger.info('Creating Honeycomb client for URI {}, audience {}, and client ID {}'.format(
+            uri,
+            audience,
+            client_id
+        ))
+        client = minimal_honeycomb.MinimalHoneycombClient(
+            uri=uri,
+            token_uri=token_uri,
+            audience=audience,
+            client_id=client_id,
+            client_secret=client_secret
+        )
+        _client_registry[registry_key] = client
     return client
+
+def client_registry_stats():
+    with _client_registry_lock:
+        stats = {
+            'clients': len(_client_registry),
+            'hits': _client_registry_stats['hits'],
+            'misses': _client_registry_stats['misses']
+        }
+    return stats
+
+def clear_client_registry():
+    with _client_registry_lock:
+        _client_registry.clear()
+        _client_registry_stats['hits'] = 0
+        _client_registry_stats['misses'] = 0
+
+# Every GraphQL round trip made through a client from generate_client()
+# reports an event to the registered request hooks. Each event is a dict with
+# keys request_type, request_name, variables_bytes, response_bytes, row_count,
+# latency, retries, chunk_index, and error
+_request_hooks = list()
+_request_hooks_lock = threading.Lock()
+_request_context = threading.local()
+
+def register_request_hook(hook):
+    with _request_hooks_lock:
+        if hook not in _request_hooks:
+            _request_hooks.append(hook)
+    return hook
+
+def unregister_request_hook(hook):
+    with _request_hooks_lock:
+        if hook in _request_hooks:
+            _request_hooks.remove(hook)
+
+def clear_request_hooks():
+    with _request_hooks_lock:
+        _request_hooks.clear()
+
+# Requests made within a context without an explicit chunk index are numbered
+# sequentially (e.g., the pages or chunks of a minimal_honeycomb bulk request)
+@contextlib.contextmanager
+def request_context(chunk_index=None):
+    previous_context = getattr(_request_context, 'context', None)
+    _request_context.context = {
+        'chunk_index': chunk_index,
+        'next_chunk_index': 0
+    }
+    try:
+        yield
+    finally:
+        _request_context.context = previous_context
+
+def current_chunk_index():
+    context = getattr(_request_context, 'context', None)
+    if context is None:
+        return None
+    if context['chunk_index'] is not None:
+        return context['chunk_index']
+    chunk_index = context['next_chunk_index']
+    context['next_chunk_index'] += 1
+    return chunk_index
+
+# Instruments a shallow copy of the client whose GraphQL client is wrapped, so
+# the caller's client object is never modified
+def instrument_client(client):
+    graphql_client = getattr(client, 'client', None)
+    if graphql_client is None or isinstance(graphql_client, InstrumentedGraphQLClient):
+        return client
+    instrumented_client = copy.copy(client)
+    instrumented_client.client = InstrumentedGraphQLClient(graphql_client)
+    return instrumented_client
+
+class InstrumentedGraphQLClient:
+    def __init__(self, graphql_client):
+        self.graphql_client = graphql_client
+
+    def __getattr__(self, name):
+        return getattr(self.graphql_client, name)
+
+    def execute(self, query, variables=None, files=None, **kwargs):
+        if len(_request_hooks) == 0:
+            return self.graphql_client.execute(query, variables, files, **kwargs)
+        chunk_index = current_chunk_index()
+        # Runs the client's own tenacity retry policy here so that attempts can
+        # be counted. Clients without one are called as they are, and their
+        # events report retries as None
+        execute = getattr(type(self.graphql_client), 'execute', None)
+        retrying = None
+        if (
+            'execute' not in vars(self.graphql_client) and
+            hasattr(getattr(execute, 'retry', None), 'copy') and
+            hasattr(execute, '__wrapped__')
+        ):
+            retrying = execute.retry.copy()
+        start_time = time.monotonic()
+        result = None
+        error = None
+        try:
+            if retrying is None:
+                result = self.graphql_client.execute(query, variables, files, **kwargs)
+            else:
+                result = retrying(execute.__wrapped__, self.graphql_client, query, variables, files, **kwargs)
+        except Exception as execute_error:
+            error = execute_error
+            raise
+        finally:
+            emit_request_event(
+                query=query,
+                variables=variables,
+                result=result,
+                latency=time.monotonic() - start_time,
+                retries=max(retrying.statistics.get('attempt_number', 1) - 1, 0) if retrying is not None else None,
+                chunk_index=chunk_index,
+                error=error
+            )
+        return result
+
+def emit_request_event(
+    query,
+    variables,
+    result,
+    latency,
+    retries,
+    chunk_index,
+    error
+):
+    request_type, request_name = parse_request_name(query)
+    # minimal_honeycomb returns the GraphQL error list in place of data
+    if error is None and isinstance(result, list):
+        error = result
+    event = {
+        'request_type': request_type,
+        'request_name': request_name,
+        'variables_bytes': len(json.dumps(variables, default=str)) if variables is not None else 0,
+        'response_bytes': len(json.dumps(result, default=str)) if result is not None else 0,
+        'row_count': response_row_count(result, request_name),
+        'latency': latency,
+        'retries': retries,
+        'chunk_index': chunk_index,
+        'error': repr(error) if error is not None else None
+    }
+    with _request_hooks_lock:
+        hooks = list(_request_hooks)
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception('Request hook {} failed'.format(hook))
+
+def parse_request_name(query):
+    tokens = query.replace('(', ' ').replace('{', ' ').split()
+    if len(tokens) < 2:
+        return None, None
+    return tokens[0], tokens[1]
+
+def response_row_count(result, request_name):
+    if not isinstance(result, dict):
+        return 0
+    # Compound requests return one aliased object per child request
+    if request_name not in result:
+        return len(result)
+    value = result[request_name]
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, dict) and isinstance(value.get('data'), list):
+        return len(value['data'])
+    return 1 if value is not None else 0
+
+DEFAULT_LATENCY_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+class RequestStatsAggregator:
+    def __init__(self, latency_buckets=DEFAULT_LATENCY_BUCKETS):
+        self.latency_buckets = list(latency_buckets)
+        self.events = list()
+        self.lock = threading.Lock()
+
+    def __call__(self, event):
+        with self.lock:
+            self.events.append(event)
+
+    def reset(self):
+        with self.lock:
+            self.events = list()
+
+    def dataframe(self):
+        with self.lock:
+            events = list(self.events)
+        return pd.DataFrame(events, columns=[
+            'request_type',
+            'request_name',
+            'variables_bytes',
+            'response_bytes',
+            'row_count',
+            'latency',
+            'retries',
+            'chunk_index',
+            'error'
+        ])
+
+    def summary(self):
+        df = self.dataframe()
+        df['failed'] = df['error'].notnull()
+        summary_df = df.groupby('request_name').agg(
+            num_requests=('latency', 'size'),
+            total_latency=('latency', 'sum'),
+            mean_latency=('latency', 'mean'),
+            median_latency=('latency', 'median'),
+            p95_latency=('latency', lambda latencies: latencies.quantile(0.95)),
+            max_latency=('latency', 'max'),
+            variables_bytes=('variables_bytes', 'sum'),
+            response_bytes=('response_bytes', 'sum'),
+            row_count=('row_count', 'sum'),
+            retries=('retries', 'sum'),
+            errors=('failed', 'sum')
+        )
+        return summary_df.sort_values('total_latency', ascending=False)
+
+    def latency_histogram(self):
+        df = self.dataframe()
+        bins = [0.0] + self.latency_buckets + [math.inf]
+        labels = ['<={}s'.format(bucket) for bucket in self.latency_buckets] + ['>{}s'.format(self.latency_buckets[-1])]
+        df['latency_bucket'] = pd.cut(df['latency'], bins=bins, labels=labels, include_lowest=True)
+        histogram_df = pd.crosstab(df['request_name'], df['latency_bucket'], dropna=False)
+        return histogram_df.reindex(columns=labels, fill_value=0)
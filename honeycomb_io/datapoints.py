@@ -1,3 +1,4 @@
+import honeycomb_io.core
 import minimal_honeycomb
 import logging
 
@@ -17,15 +18,15 @@ def search_datapoints(
     client_secret=None
 ):
     logger.info('Searching for datapoints that match the specified parameters')
-    if client is None:
-        client = minimal_honeycomb.MinimalHoneycombClient(
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-    result = client.bulk_query(
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result = honeycomb_io.core.bulk_query(
         request_name='searchDatapoints',
         arguments={
             'query': {
@@ -38,7 +39,36 @@ def search_datapoints(
         },
         return_data=return_data,
         id_field_name = 'data_id',
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        client=client
     )
     logger.info('Fetched {} datapoints'.format(len(result)))
     return result
+
+def iter_search_datapoints(
+    query_list,
+    return_data,
+    chunk_size=100,
+    yield_pages=False,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    logger.info('Streaming datapoints that match the specified parameters')
+    yield from honeycomb_io.core.iter_search_objects(
+        query_list=query_list,
+        return_data=return_data,
+        request_name='searchDatapoints',
+        id_field_name='data_id',
+        chunk_size=chunk_size,
+        yield_pages=yield_pages,
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
@@ -669,7 +669,7 @@ def generate_device_entity_assignment_dataframe(
 def fetch_entity_info():
     logger.info(
         'Fetching entity assignment info to extract tray and person names')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='entityAssignments',
@@ -732,7 +732,7 @@ def fetch_device_positions(
         client_id=client_id,
         client_secret=client_secret
     )
-    result=client.bulk_query(
+    result = honeycomb_io.core.bulk_query(
         request_name='searchAssignments',
         arguments={
             'query': {
@@ -774,7 +774,8 @@ def fetch_device_positions(
                 ]}
             ]}
         ],
-        id_field_name='assignment_id'
+        id_field_name='assignment_id',
+        client=client
     )
     logger.info('Fetched {} device assignments'.format(len(result)))
     device_assignments = minimal_honeycomb.filter_assignments(
@@ -910,15 +911,15 @@ def write_position_data(
     position_data_df['coordinate_space'] = coordinate_space_id
     position_data_df['coordinates'] = position_data_df['coordinates'].apply(lambda x: x.tolist())
     records = position_data_df.to_dict(orient='records')
-    if client is None:
-        client = minimal_honeycomb.MinimalHoneycombClient(
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-    result=client.bulk_mutation(
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result=honeycomb_io.core.bulk_mutation(
         request_name='assignToPosition',
         arguments={
             'positionAssignment': {
@@ -928,7 +929,9 @@ def write_position_data(
         },
         return_object=[
             'position_assignment_id'
-        ]
+        ],
+        object_name='PositionAssignment',
+        client=client
     )
     ids = None
     if len(result) > 0:
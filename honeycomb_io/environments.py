@@ -99,7 +99,8 @@ def fetch_environment_id(
             client_id=client_id,
             client_secret=client_secret
         )
-        result = client.bulk_query(
+        result = honeycomb_io.core.cached_bulk_query(
+            object_type='Environment',
             request_name='findEnvironments',
             arguments={
                 'name': {
@@ -110,7 +111,8 @@ def fetch_environment_id(
             return_data=[
                 'environment_id'
             ],
-            id_field_name='environment_id'
+            id_field_name='environment_id',
+            client=client
         )
         if len(result) == 0:
             raise ValueError('No environments match environment name {}'.format(
@@ -129,7 +131,7 @@ def fetch_environment_id(
 # process_cuwb_data.core (wf-process-cuwb-data)
 def fetch_environment_by_name(environment_name):
     logger.info('Fetching Environments data')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name="environments",
@@ -341,8 +343,26 @@ def filter_assignments(
     start=None,
     end=None
 ):
-    filtered_assignments = list(filter(
-        lambda assignment: (
+    # Assignment times are compared in one vectorized pass rather than
+    # converted one assignment at a time
+    end_matches = [True]*len(assignments)
+    if start is not None:
+        assignment_ends = honeycomb_io.utils.from_honeycomb_datetimes([
+            assignment.get('end') for assignment in assignments
+        ])
+        end_matches = (assignment_ends.isna() | (assignment_ends >= pd.to_datetime(start, utc=True))).tolist()
+    start_matches = [True]*len(assignments)
+    if end is not None:
+        assignment_starts = honeycomb_io.utils.from_honeycomb_datetimes([
+            assignment.get('start') for assignment in assignments
+        ])
+        start_matches = (assignment_starts <= pd.to_datetime(end, utc=True)).tolist()
+    filtered_assignments = [
+        assignment
+        for assignment, end_match, start_match in zip(assignments, end_matches, start_matches)
+        if (
+            end_match and
+            start_match and
             (
                 environment_id is None or
                 assignment.get('environment').get('environment_id') == environment_id
@@ -350,17 +370,7 @@ def filter_assignments(
             (
                 environment_name is None or
                 assignment.get('environment').get('name') == environment_name
-            ) and
-            (
-                start is None or
-                assignment.get('end') is None or
-                pd.to_datetime(assignment.get('end'), utc=True) >= pd.to_datetime(start, utc=True)
-            ) and
-            (
-                end is None or
-                pd.to_datetime(assignment.get('start'), utc=True) <= pd.to_datetime(end, utc=True)
             )
-        ),
-        assignments
-    ))
+        )
+    ]
     return filtered_assignments
@@ -14,5 +14,10 @@ class HoneycombWriteErrorNoRetry(HoneycombWriteError):
 class HoneycombWriteErrorNoRetryCleanupFailed(HoneycombWriteError):
     pass
 
+class HoneycombPartialWriteError(HoneycombWriteErrorRetry):
+    def __init__(self, message, results=None):
+        super().__init__(message)
+        self.results = results if results is not None else list()
+
 class HoneycombDeleteError(HoneycombError):
     pass
@@ -1,3 +1,4 @@
+import honeycomb_io.cache
 import honeycomb_io.core
 import honeycomb_io.utils
 import minimal_honeycomb
@@ -55,7 +56,7 @@ def fetch_inference_ids(
             client_id=client_id,
             client_secret=client_secret
         )
-        result = client.bulk_query(
+        result = honeycomb_io.core.bulk_query(
             request_name='searchInferenceExecutions',
             arguments={
                 'query': {
@@ -69,7 +70,8 @@ def fetch_inference_ids(
             return_data=[
                 'inference_id'
             ],
-            id_field_name='inference_id'
+            id_field_name='inference_id',
+            client=client
         )
         if len(result) == 0:
             raise ValueError('No inference executions match specified inference names/models/versions')
@@ -128,6 +130,7 @@ def create_inference_execution(
             'inference_id'
         ]
     )
+    honeycomb_io.cache.invalidate_cache(object_type='InferenceExecution')
     try:
         inference_id = result['inference_id']
     except:
@@ -163,5 +166,6 @@ def delete_inference_execution(
         },
         return_object=['status']
     )
+    honeycomb_io.cache.invalidate_cache(object_type='InferenceExecution')
     status = result.get('status')
     return status
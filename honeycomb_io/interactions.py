@@ -15,6 +15,9 @@ def fetch_material_interactions(
     material_ids=None,
     output_format='list',
     chunk_size=1000,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -62,11 +65,15 @@ def fetch_material_interactions(
         ]}
     ]
     logger.info('Fetching material interactions with specified material interaction characteristics')
-    material_interactions=honeycomb_io.core.search_objects(
+    material_interactions=honeycomb_io.core.search_objects_by_time_window(
         object_name='MaterialInteraction',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        timestamp_field='start',
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         client=client,
         uri=uri,
         token_uri=token_uri,
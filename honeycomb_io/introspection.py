@@ -0,0 +1,397 @@
+import honeycomb_io.core
+import datetime
+import hashlib
+import json
+import os
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump when the introspection query or the cache file layout changes, so that
+# older cache files are refetched rather than misread
+SCHEMA_CACHE_VERSION = 1
+
+DEFAULT_SCHEMA_MAX_AGE = datetime.timedelta(days=1)
+
+INTROSPECTION_QUERY = '''
+query IntrospectionQuery {
+  __schema {
+    queryType { name }
+    mutationType { name }
+    types {
+      kind
+      name
+      fields {
+        name
+        args { name type { ...TypeRef } }
+        type { ...TypeRef }
+      }
+      inputFields { name type { ...TypeRef } }
+      possibleTypes { name }
+    }
+  }
+}
+
+fragment TypeRef on __Type {
+  kind
+  name
+  ofType {
+    kind
+    name
+    ofType {
+      kind
+      name
+      ofType {
+        kind
+        name
+      }
+    }
+  }
+}
+'''
+
+class IntrospectedSchema:
+    def __init__(self, schema):
+        self.schema = schema
+        self.types = {type_info['name']: type_info for type_info in schema['types']}
+        self.query_fields = self.fields(schema['queryType']['name'])
+        mutation_type = schema.get('mutationType')
+        self.mutation_fields = self.fields(mutation_type['name']) if mutation_type is not None else dict()
+        self.endpoint_names = dict()
+
+    def fields(self, type_name):
+        type_info = self.types.get(type_name)
+        if type_info is None or type_info.get('fields') is None:
+            return dict()
+        return {field['name']: field for field in type_info['fields']}
+
+    def has_type(self, type_name):
+        return type_name in self.types
+
+    # Endpoints returning the object type itself (create, update), matching it
+    # through their ID argument (delete) or returning a list type whose data
+    # field holds it (search, fetch_all). The conventional name is preferred
+    # where there are several
+    def endpoint_name(
+        self,
+        object_name,
+        verb,
+        conventional_name=None
+    ):
+        key = (object_name, verb, conventional_name)
+        if key not in self.endpoint_names:
+            self.endpoint_names[key] = self.find_endpoint_name(object_name, verb, conventional_name)
+        return self.endpoint_names[key]
+
+    def find_endpoint_name(
+        self,
+        object_name,
+        verb,
+        conventional_name=None
+    ):
+        fields = self.mutation_fields if verb in ['create', 'update', 'delete'] else self.query_fields
+        candidates = sorted([
+            field_name
+            for field_name, field in fields.items()
+            if self.endpoint_returns(field, object_name, verb)
+        ])
+        if conventional_name in candidates:
+            return conventional_name
+        if verb == 'fetch_all':
+            # Unfiltered list endpoints take no query
+            candidates = [
+                candidate
+                for candidate in candidates
+                if 'query' not in self.endpoint_arguments(candidate) and not candidate.startswith('find')
+            ]
+            return candidates[0] if len(candidates) > 0 else None
+        for prefix in [verb] + (['assignTo'] if verb == 'create' else list()):
+            for candidate in candidates:
+                if candidate.startswith(prefix):
+                    return candidate
+        return None
+
+    def endpoint_returns(self, field, object_name, verb):
+        type_name = named_type(field['type'])
+        if verb == 'delete':
+            return field['name'].startswith('delete') and self.delete_target(field) == object_name
+        if verb in ['create', 'update']:
+            return type_name == object_name
+        return self.list_item_type(type_name) == object_name
+
+    # Delete endpoints return a status, so they are matched to the object type
+    # through their name and ID argument
+    def delete_target(self, field):
+        object_name = field['name'][len('delete'):]
+        if not self.has_type(object_name):
+            return None
+        id_field_name = self.id_field_name(object_name)
+        argument_names = [argument['name'] for argument in field.get('args', list())]
+        if id_field_name in argument_names:
+            return object_name
+        return None
+
+    def list_item_type(self, type_name):
+        data_field = self.fields(type_name).get('data')
+        if data_field is None:
+            return None
+        return named_type(data_field['type'])
+
+    def endpoint_arguments(self, endpoint_name):
+        field = self.mutation_fields.get(endpoint_name, self.query_fields.get(endpoint_name))
+        if field is None:
+            return dict()
+        return {argument['name']: argument for argument in field.get('args', list())}
+
+    # The argument carrying the object's data is the one with an input object
+    # type
+    def input_argument(self, endpoint_name):
+        for argument_name, argument in self.endpoint_arguments(endpoint_name).items():
+            type_info = self.types.get(named_type(argument['type']))
+            if type_info is not None and type_info['kind'] == 'INPUT_OBJECT':
+                return argument_name, type_string(argument['type'])
+        return None, None
+
+    def id_field_name(self, object_name, conventional_name=None):
+        fields = self.fields(object_name)
+        id_fields = [
+            field_name
+            for field_name, field in fields.items()
+            if field['type']['kind'] == 'NON_NULL' and named_type(field['type']) == 'ID'
+        ]
+        if conventional_name in id_fields:
+            return conventional_name
+        if len(id_fields) > 0:
+            return id_fields[0]
+        return None
+
+    def validate_return_data(self, object_name, return_data):
+        self.validate_selections(object_name, return_data, path=object_name)
+
+    def validate_selections(self, type_name, selections, path):
+        type_info = self.types.get(type_name)
+        if type_info is None:
+            raise ValueError('Type \'{}\' not found in Honeycomb schema'.format(type_name))
+        fields = self.fields(type_name)
+        for selection in selections:
+            if isinstance(selection, str):
+                field_name = selection
+                subselections = None
+            elif isinstance(selection, dict) and len(selection) == 1:
+                field_name, subselections = list(selection.items())[0]
+            else:
+                raise ValueError('Return data element at {} must be a field name or a single-key dict: {}'.format(
+                    path,
+                    selection
+                ))
+            if field_name.startswith('...'):
+                fragment_type_name = field_name[len('...'):].strip()
+                if not fragment_type_name.startswith('on '):
+                    raise ValueError('Unsupported fragment at {}: \'{}\''.format(path, field_name))
+                fragment_type_name = fragment_type_name[len('on '):].strip()
+                possible_type_names = [
+                    possible_type['name']
+                    for possible_type in (type_info.get('possibleTypes') or list())
+                ]
+                if fragment_type_name != type_name and fragment_type_name not in possible_type_names:
+                    raise ValueError('Type \'{}\' at {} cannot be \'{}\''.format(
+                        type_name,
+                        path,
+                        fragment_type_name
+                    ))
+                self.validate_selections(fragment_type_name, subselections or list(), path)
+                continue
+            if field_name == '__typename':
+                continue
+            if field_name not in fields:
+                raise ValueError('Field \'{}\' not found on type \'{}\' (at {})'.format(
+                    field_name,
+                    type_name,
+                    path
+                ))
+            field_type_name = named_type(fields[field_name]['type'])
+            field_type_kind = self.types.get(field_type_name, {}).get('kind')
+            if field_type_kind in ['OBJECT', 'INTERFACE', 'UNION']:
+                if not subselections:
+                    raise ValueError('Field \'{}\' on type \'{}\' (at {}) is an object and needs subfields'.format(
+                        field_name,
+                        type_name,
+                        path
+                    ))
+                self.validate_selections(field_type_name, subselections, '{}.{}'.format(path, field_name))
+            elif subselections:
+                raise ValueError('Field \'{}\' on type \'{}\' (at {}) is a scalar and cannot have subfields'.format(
+                    field_name,
+                    type_name,
+                    path
+                ))
+
+def named_type(type_ref):
+    while type_ref.get('ofType') is not None:
+        type_ref = type_ref['ofType']
+    return type_ref['name']
+
+def type_string(type_ref):
+    if type_ref['kind'] == 'NON_NULL':
+        return type_string(type_ref['ofType']) + '!'
+    if type_ref['kind'] == 'LIST':
+        return '[' + type_string(type_ref['ofType']) + ']'
+    return type_ref['name']
+
+# Introspected schemas by the URI of the server they were fetched from, so
+# that clients for different servers each resolve names from their own schema
+_introspected_schemas = dict()
+_introspected_schema_lock = threading.Lock()
+
+# Fetches the schema from the server (or from the cache file, if it was
+# written for the same URI by this version of the cache layout and is recent
+# enough), and makes honeycomb_io.schema resolve names from it for clients of
+# that server
+def enable_schema_introspection(
+    cache_path=None,
+    max_age=DEFAULT_SCHEMA_MAX_AGE,
+    refresh=False,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    uri = client_uri(client=client)
+    if cache_path is None:
+        cache_path = default_schema_cache_path(uri)
+    schema = None
+    if not refresh:
+        schema = load_schema_cache(
+            cache_path=cache_path,
+            uri=uri,
+            max_age=max_age
+        )
+    if schema is None:
+        schema = fetch_schema(client=client)
+        write_schema_cache(
+            cache_path=cache_path,
+            uri=uri,
+            schema=schema
+        )
+    introspected_schema = IntrospectedSchema(schema)
+    with _introspected_schema_lock:
+        _introspected_schemas[uri] = introspected_schema
+    return introspected_schema
+
+# Without a client or URI, disables introspection for all servers
+def disable_schema_introspection(
+    client=None,
+    uri=None
+):
+    with _introspected_schema_lock:
+        if client is None and uri is None:
+            _introspected_schemas.clear()
+        else:
+            _introspected_schemas.pop(client_uri(client=client, uri=uri), None)
+
+def introspected_schema(
+    client=None,
+    uri=None
+):
+    if len(_introspected_schemas) == 0:
+        return None
+    return _introspected_schemas.get(client_uri(client=client, uri=uri))
+
+# The URI of the client (synchronous or asynchronous) or, without a client,
+# the URI a client would be generated for
+def client_uri(
+    client=None,
+    uri=None
+):
+    if client is not None:
+        return getattr(getattr(client, 'client', client), 'uri', None)
+    if uri is None:
+        uri = os.getenv('HONEYCOMB_URI')
+    return uri
+
+def fetch_schema(client):
+    logger.info('Fetching GraphQL schema from Honeycomb')
+    result = client.client.execute(INTROSPECTION_QUERY)
+    if not isinstance(result, dict) or '__schema' not in result:
+        raise ValueError('Received unexpected result from Honeycomb introspection query: {}'.format(result))
+    return result['__schema']
+
+def default_schema_cache_path(uri):
+    cache_directory = os.getenv(
+        'HONEYCOMB_SCHEMA_CACHE_DIRECTORY',
+        os.path.join(os.path.expanduser('~'), '.cache', 'honeycomb_io')
+    )
+    uri_hash = hashlib.sha256(str(uri).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_directory, 'schema-{}.json'.format(uri_hash))
+
+def load_schema_cache(
+    cache_path,
+    uri,
+    max_age=DEFAULT_SCHEMA_MAX_AGE
+):
+    try:
+        with open(cache_path) as fp:
+            cache = json.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning('Failed to read schema cache {}. Refetching schema'.format(cache_path))
+        return None
+    if cache.get('version') != SCHEMA_CACHE_VERSION or cache.get('uri') != uri:
+        logger.info('Schema cache {} was written for a different version or URI. Refetching schema'.format(cache_path))
+        return None
+    fetched = datetime.datetime.fromisoformat(cache['fetched'])
+    if max_age is not None and datetime.datetime.now(tz=datetime.timezone.utc) - fetched > max_age:
+        logger.info('Schema cache {} is older than {}. Refetching schema'.format(cache_path, max_age))
+        return None
+    return cache['schema']
+
+def write_schema_cache(
+    cache_path,
+    uri,
+    schema
+):
+    directory = os.path.dirname(cache_path)
+    if directory != '':
+        os.makedirs(directory, exist_ok=True)
+    temporary_path = '{}.{}.tmp'.format(cache_path, threading.get_ident())
+    with open(temporary_path, 'w') as fp:
+        json.dump(
+            {
+                'version': SCHEMA_CACHE_VERSION,
+                'uri': uri,
+                'fetched': datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+                'schema_hash': hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest(),
+                'schema': schema
+            },
+            fp
+        )
+    os.replace(temporary_path, cache_path)
+
+# Does nothing unless introspection is enabled for the client's server
+def validate_return_data(
+    object_name,
+    return_data,
+    client=None,
+    uri=None
+):
+    schema = introspected_schema(client=client, uri=uri)
+    if schema is None or object_name is None or return_data is None:
+        return
+    if not schema.has_type(object_name):
+        logger.warning('Object type \'{}\' not found in Honeycomb schema. Skipping return data validation'.format(
+            object_name
+        ))
+        return
+    schema.validate_return_data(object_name, return_data)
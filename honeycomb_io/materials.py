@@ -299,7 +299,7 @@ def generate_material_dataframe(
 def fetch_material_names(
 ):
     logger.info('Fetching material assignment info to extract material names')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='materialAssignments',
@@ -332,7 +332,7 @@ def fetch_material_names(
 # honeycomb_io.uwb_data
 def fetch_material_assignments():
     logger.info('Fetching material assignment IDs')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='materialAssignments',
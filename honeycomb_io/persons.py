@@ -418,7 +418,7 @@ def fetch_person_info(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_query(
+    result = honeycomb_io.core.bulk_query(
         request_name='findAssignments',
         arguments={
             'environment': {
@@ -442,7 +442,8 @@ def fetch_person_info(
                 ]}
             ]}
         ],
-        id_field_name='assignment_id'
+        id_field_name='assignment_id',
+        client=client
     )
     data_list = list()
     for assignment in result:
@@ -40,6 +40,9 @@ def fetch_2d_pose_data(
     return_pose_model_id=True,
     return_pose_quality=False,
     chunk_size=100,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -162,6 +165,9 @@ def fetch_2d_pose_data(
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        time_window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         client=None,
         uri=None,
         token_uri=None,
@@ -218,6 +224,9 @@ def search_2d_poses(
     query_list,
     return_data,
     chunk_size=100,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -226,11 +235,14 @@ def search_2d_poses(
     client_secret=None
 ):
     logger.info('Searching for 2D poses that match the specified parameters')
-    result = honeycomb_io.core.search_objects(
+    result = honeycomb_io.core.search_objects_by_time_window(
         object_name='Pose2D',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         client=None,
         uri=None,
         token_uri=None,
@@ -570,13 +582,15 @@ def fetch_pose_model_id(
             client_id=client_id,
             client_secret=client_secret
         )
-        result = client.bulk_query(
+        result = honeycomb_io.core.cached_bulk_query(
+            object_type='PoseModel',
             request_name='findPoseModels',
             arguments=arguments,
             return_data=[
                 'pose_model_id'
             ],
-            id_field_name='pose_model_id'
+            id_field_name='pose_model_id',
+            client=client
         )
         if len(result) == 0:
             raise ValueError('No pose models match specified model name/model variant name')
@@ -799,9 +813,7 @@ def write_3d_pose_data(
             raise ValueError('Source type must either be included in data frame or specified')
     else:
         poses_3d_df_honeycomb['source_type'] = source_type
-    poses_3d_df_honeycomb['timestamp'] = poses_3d_df_honeycomb['timestamp'].apply(
-        lambda x: honeycomb_io.utils.to_honeycomb_datetime(x.to_pydatetime())
-    )
+    poses_3d_df_honeycomb['timestamp'] = honeycomb_io.utils.to_honeycomb_datetimes(poses_3d_df_honeycomb['timestamp'])
     poses_3d_df_honeycomb['keypoint_coordinates_3d'] = poses_3d_df_honeycomb['keypoint_coordinates_3d'].apply(
         lambda x: np.where(np.isnan(x), None, x)
     )
@@ -827,7 +839,7 @@ def write_3d_pose_data(
         },
         inplace=True
     )
-    poses_3d_list_honeycomb = poses_3d_df_honeycomb.to_dict(orient='records')
+    poses_3d_list_honeycomb = honeycomb_io.utils.DataFrameRecords(poses_3d_df_honeycomb)
     client = honeycomb_io.core.generate_client(
         client=client,
         uri=uri,
@@ -837,7 +849,7 @@ def write_3d_pose_data(
         client_secret=client_secret
     )
     logger.info('Writing 3D pose data')
-    result = client.bulk_mutation(
+    result = honeycomb_io.core.bulk_mutation(
         request_name='createPose3D',
         arguments={
             'pose3D': {
@@ -848,7 +860,9 @@ def write_3d_pose_data(
         return_object=[
             'pose_id'
         ],
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        object_name='Pose3D',
+        client=client
     )
     try:
         pose_3d_ids = [datum['pose_id'] for datum in result]
@@ -941,7 +955,7 @@ def delete_3d_pose_data_by_pose_ids(
         client_id=client_id,
         client_secret=client_secret
     )
-    result = client.bulk_mutation(
+    result = honeycomb_io.core.bulk_mutation(
         request_name='deletePose3D',
         arguments={
             'pose_id': {
@@ -950,7 +964,9 @@ def delete_3d_pose_data_by_pose_ids(
             }
         },
         return_object=['status'],
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        object_name='Pose3D',
+        client=client
     )
     statuses = [datum.get('status') for datum in result]
     return statuses
@@ -989,7 +1005,7 @@ def write_pose_tracks_3d(
         client_secret=client_secret
     )
     logger.info('Writing 3D pose tracks')
-    result = client.bulk_mutation(
+    result = honeycomb_io.core.bulk_mutation(
         request_name='createPoseTrack3D',
         arguments={
             'poseTrack3D': {
@@ -1000,7 +1016,9 @@ def write_pose_tracks_3d(
         return_object=[
             'pose_track_id'
         ],
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        object_name='PoseTrack3D',
+        client=client
     )
     try:
         pose_track_3d_ids = [datum['pose_track_id'] for datum in result]
@@ -1,3 +1,4 @@
+import honeycomb_io.introspection
 import inflection
 
 SCHEMA = {
@@ -32,7 +33,7 @@ SCHEMA = {
         'search_endpoint_name': 'searchPoseTracks2D',
         'id_field_name': 'pose_track_id'
     },
-    'Pose3D': {
+    'PoseTrack3D': {
         'search_endpoint_name': 'searchPoseTracks3D',
         'id_field_name': 'pose_track_id'
     },
@@ -47,62 +48,93 @@ SCHEMA = {
     }
 }
 
-def create_endpoint_name(object_name):
+# When schema introspection is enabled for the client's server, names are
+# resolved from that server's schema. The names above (explicit or guessed) are
+# used when it is disabled or has no answer, and are preferred when the schema
+# offers several endpoints
+def introspected_endpoint_name(object_name, verb, conventional_name, client=None, uri=None):
+    schema = honeycomb_io.introspection.introspected_schema(client=client, uri=uri)
+    if schema is None:
+        return conventional_name
+    name = schema.endpoint_name(object_name, verb, conventional_name)
+    if name is None:
+        return conventional_name
+    return name
+
+def introspected_input_argument(endpoint_name, conventional_value, value_index, client=None, uri=None):
+    schema = honeycomb_io.introspection.introspected_schema(client=client, uri=uri)
+    if schema is None:
+        return conventional_value
+    value = schema.input_argument(endpoint_name)[value_index]
+    if value is None:
+        return conventional_value
+    return value
+
+def introspected_id_field_name(object_name, conventional_name, client=None, uri=None):
+    schema = honeycomb_io.introspection.introspected_schema(client=client, uri=uri)
+    if schema is None:
+        return conventional_name
+    name = schema.id_field_name(object_name, conventional_name)
+    if name is None:
+        return conventional_name
+    return name
+
+def create_endpoint_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('create_endpoint_name')
     if name is None:
         name = 'create' + object_name
-    return name
+    return introspected_endpoint_name(object_name, 'create', name, client=client, uri=uri)
 
-def create_endpoint_argument_name(object_name):
+def create_endpoint_argument_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('create_endpoint_argument_name')
     if name is None:
         name = inflection.camelize(object_name, uppercase_first_letter=False)
-    return name
+    return introspected_input_argument(create_endpoint_name(object_name, client=client, uri=uri), name, 0, client=client, uri=uri)
 
-def create_endpoint_argument_type(object_name):
+def create_endpoint_argument_type(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('create_endpoint_argument_type')
     if name is None:
         name = object_name + 'Input'
-    return name
+    return introspected_input_argument(create_endpoint_name(object_name, client=client, uri=uri), name, 1, client=client, uri=uri)
 
-def update_endpoint_name(object_name):
+def update_endpoint_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('update_endpoint_name')
     if name is None:
         name = 'update' + object_name
-    return name
+    return introspected_endpoint_name(object_name, 'update', name, client=client, uri=uri)
 
-def update_endpoint_argument_name(object_name):
+def update_endpoint_argument_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('update_endpoint_argument_name')
     if name is None:
         name = inflection.camelize(object_name, uppercase_first_letter=False)
-    return name
+    return introspected_input_argument(update_endpoint_name(object_name, client=client, uri=uri), name, 0, client=client, uri=uri)
 
-def update_endpoint_argument_type(object_name):
+def update_endpoint_argument_type(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('update_endpoint_argument_type')
     if name is None:
         name = object_name + 'UpdateInput'
-    return name
+    return introspected_input_argument(update_endpoint_name(object_name, client=client, uri=uri), name, 1, client=client, uri=uri)
 
-def fetch_all_endpoint_name(object_name):
+def fetch_all_endpoint_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('fetch_all_endpoint_name')
     if name is None:
         name = inflection.camelize(object_name, uppercase_first_letter=False) + 's'
-    return name
+    return introspected_endpoint_name(object_name, 'fetch_all', name, client=client, uri=uri)
 
-def search_endpoint_name(object_name):
+def search_endpoint_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('search_endpoint_name')
     if name is None:
         name = 'search' + object_name + 's'
-    return name
+    return introspected_endpoint_name(object_name, 'search', name, client=client, uri=uri)
 
-def delete_endpoint_name(object_name):
+def delete_endpoint_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('delete_endpoint_name')
     if name is None:
         name = 'delete' + object_name
-    return name
+    return introspected_endpoint_name(object_name, 'delete', name, client=client, uri=uri)
 
-def id_field_name(object_name):
+def id_field_name(object_name, client=None, uri=None):
     name = SCHEMA.get(object_name, {}).get('id_field_name')
     if name is None:
         name =  inflection.underscore(object_name) + '_id'
-    return name
+    return introspected_id_field_name(object_name, name, client=client, uri=uri)
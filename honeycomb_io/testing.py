@@ -0,0 +1,1098 @@
+import honeycomb_io.core
+import honeycomb_io.introspection
+import honeycomb_io.schema
+import honeycomb_io.utils
+import inflection
+import collections
+import datetime
+import email.parser
+import email.policy
+import http.server
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Object types served by the stand-in server. Endpoint names and ID field names
+# follow honeycomb_io.schema, so the stand-in resolves the same requests that
+# the rest of the package sends
+OBJECT_TYPES = [
+    'Environment',
+    'CoordinateSpace',
+    'Device',
+    'Person',
+    'Tray',
+    'Material',
+    'Assignment',
+    'EntityAssignment',
+    'MaterialAssignment',
+    'PositionAssignment',
+    'Position',
+    'AccelerometerData',
+    'GyroscopeData',
+    'MagnetometerData',
+    'Datapoint',
+    'InferenceExecution',
+    'PoseModel',
+    'Pose2D',
+    'Pose3D',
+    'PoseTrack3D',
+    'MaterialInteraction',
+    'IntrinsicCalibration',
+    'ExtrinsicCalibration'
+]
+
+DEFAULT_AUDIENCE = 'honeycomb-stand-in'
+DEFAULT_CLIENT_ID = 'honeycomb-stand-in'
+DEFAULT_CLIENT_SECRET = 'honeycomb-stand-in'
+RESULT_CACHE_SIZE = 32
+
+HONEYCOMB_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z$')
+ISO_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}')
+TOKEN_RE = re.compile(r'''
+    (?P<ignored>[\s,]+|\#[^\n]*)
+    |(?P<spread>\.\.\.)
+    |(?P<punctuator>[{}()\[\]:!$=@])
+    |(?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    |(?P<name>[_A-Za-z][_0-9A-Za-z]*)
+''', re.VERBOSE)
+
+class StandInError(Exception):
+    pass
+
+# Parser for the subset of GraphQL generated by minimal_honeycomb and
+# honeycomb_io.aio: a single operation with variable definitions, aliases,
+# arguments, nested selections, inline fragments and (as in the introspection
+# query) named fragments
+def parse_document(document):
+    tokens = list()
+    position = 0
+    while position < len(document):
+        match = TOKEN_RE.match(document, position)
+        if match is None:
+            raise StandInError('Unexpected character in document at position {}: {}'.format(
+                position,
+                document[position:position + 20]
+            ))
+        position = match.end()
+        if match.lastgroup != 'ignored':
+            tokens.append((match.lastgroup, match.group()))
+    parser = DocumentParser(tokens)
+    operation = parser.parse_operation()
+    fragments = dict()
+    while parser.peek()[0] is not None:
+        parser.expect('fragment')
+        fragment_name = parser.next()[1]
+        parser.expect('on')
+        parser.next()
+        fragments[fragment_name] = parser.parse_selection_set()
+    operation['selections'] = expand_fragment_spreads(operation['selections'], fragments)
+    return operation
+
+def expand_fragment_spreads(selections, fragments):
+    if selections is None:
+        return None
+    expanded_selections = list()
+    for selection in selections:
+        if 'fragment_name' in selection:
+            if selection['fragment_name'] not in fragments:
+                raise StandInError('Fragment \'{}\' not defined'.format(selection['fragment_name']))
+            expanded_selections.extend(expand_fragment_spreads(fragments[selection['fragment_name']], fragments))
+            continue
+        expanded_selections.append({
+            **selection,
+            'selections': expand_fragment_spreads(selection['selections'], fragments)
+        })
+    return expanded_selections
+
+class DocumentParser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self):
+        if self.index >= len(self.tokens):
+            return (None, None)
+        return self.tokens[self.index]
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            raise StandInError('Unexpected end of document')
+        self.index += 1
+        return token
+
+    def expect(self, value):
+        token_type, token_value = self.next()
+        if token_value != value:
+            raise StandInError('Expected \'{}\' but found \'{}\''.format(value, token_value))
+
+    def parse_operation(self):
+        operation_type = 'query'
+        operation_name = None
+        token_type, token_value = self.peek()
+        if token_value in ['query', 'mutation']:
+            operation_type = self.next()[1]
+            if self.peek()[0] == 'name':
+                operation_name = self.next()[1]
+            if self.peek()[1] == '(':
+                self.parse_variable_definitions()
+        selections = self.parse_selection_set()
+        return {
+            'operation_type': operation_type,
+            'operation_name': operation_name,
+            'selections': selections
+        }
+
+    def parse_variable_definitions(self):
+        self.expect('(')
+        while self.peek()[1] != ')':
+            self.expect('$')
+            self.next()
+            self.expect(':')
+            self.parse_type()
+            if self.peek()[1] == '=':
+                self.next()
+                self.parse_value()
+        self.expect(')')
+
+    def parse_type(self):
+        if self.peek()[1] == '[':
+            self.next()
+            self.parse_type()
+            self.expect(']')
+        else:
+            self.next()
+        if self.peek()[1] == '!':
+            self.next()
+
+    def parse_selection_set(self):
+        self.expect('{')
+        selections = list()
+        while self.peek()[1] != '}':
+            if self.peek()[0] == 'spread':
+                self.next()
+                if self.peek()[1] != 'on':
+                    selections.append({'fragment_name': self.next()[1]})
+                    continue
+                self.expect('on')
+                type_condition = self.next()[1]
+                selections.append({
+                    'type_condition': type_condition,
+                    'selections': self.parse_selection_set()
+                })
+                continue
+            name = self.next()[1]
+            alias = name
+            if self.peek()[1] == ':':
+                self.next()
+                name = self.next()[1]
+            arguments = dict()
+            if self.peek()[1] == '(':
+                self.next()
+                while self.peek()[1] != ')':
+                    argument_name = self.next()[1]
+                    self.expect(':')
+                    arguments[argument_name] = self.parse_value()
+                self.expect(')')
+            child_selections = None
+            if self.peek()[1] == '{':
+                child_selections = self.parse_selection_set()
+            selections.append({
+                'alias': alias,
+                'name': name,
+                'arguments': arguments,
+                'selections': child_selections
+            })
+        self.expect('}')
+        return selections
+
+    def parse_value(self):
+        token_type, token_value = self.next()
+        if token_value == '$':
+            return ('variable', self.next()[1])
+        if token_type == 'string':
+            return json.loads(token_value)
+        if token_type == 'number':
+            return json.loads(token_value)
+        if token_value == '[':
+            values = list()
+            while self.peek()[1] != ']':
+                values.append(self.parse_value())
+            self.next()
+            return values
+        if token_value == '{':
+            values = dict()
+            while self.peek()[1] != '}':
+                field_name = self.next()[1]
+                self.expect(':')
+                values[field_name] = self.parse_value()
+            self.next()
+            return values
+        if token_value == 'true':
+            return True
+        if token_value == 'false':
+            return False
+        if token_value == 'null':
+            return None
+        return token_value
+
+def substitute_variables(value, variables):
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == 'variable':
+        return variables.get(value[1])
+    if isinstance(value, list):
+        return [substitute_variables(item, variables) for item in value]
+    if isinstance(value, dict):
+        return {key: substitute_variables(item, variables) for key, item in value.items()}
+    return value
+
+def canonical_value(value):
+    if isinstance(value, str) and ISO_DATETIME_RE.match(value) and not HONEYCOMB_DATETIME_RE.match(value):
+        try:
+            return honeycomb_io.utils.to_honeycomb_datetime(value)
+        except ValueError:
+            return value
+    if isinstance(value, datetime.datetime):
+        return honeycomb_io.utils.to_honeycomb_datetime(value)
+    return value
+
+def canonical_record(record):
+    return {key: canonical_value(value) for key, value in record.items()}
+
+def compile_query(query):
+    operator = query.get('operator')
+    if operator in ['AND', 'OR', 'NOT']:
+        child_predicates = [compile_query(child) for child in query.get('children', [])]
+        if operator == 'AND':
+            return lambda record: all(predicate(record) for predicate in child_predicates)
+        if operator == 'OR':
+            return lambda record: any(predicate(record) for predicate in child_predicates)
+        return lambda record: not any(predicate(record) for predicate in child_predicates)
+    field = query.get('field')
+    # Queries can filter on the ID of a referenced object (e.g., person_id for person)
+    def record_value(record):
+        if field in record:
+            return record[field]
+        if field is not None and field.endswith('_id'):
+            return record.get(field[:-len('_id')])
+        return None
+    if operator == 'ISNULL':
+        return lambda record: record_value(record) is None
+    if operator in ['IN', 'CONTAINED_BY', 'NIN']:
+        values = [canonical_value(value) for value in query.get('values') or []]
+        try:
+            values = set(values)
+        except TypeError:
+            pass
+        if operator == 'NIN':
+            return lambda record: record_value(record) not in values
+        return lambda record: record_value(record) in values
+    value = canonical_value(query.get('value'))
+    if operator == 'EQ':
+        return lambda record: record_value(record) == value
+    if operator == 'NE':
+        return lambda record: record_value(record) != value
+    comparisons = {
+        'LT': lambda left, right: left < right,
+        'LTE': lambda left, right: left <= right,
+        'GT': lambda left, right: left > right,
+        'GTE': lambda left, right: left >= right
+    }
+    if operator not in comparisons:
+        raise StandInError('Query operator \'{}\' not supported'.format(operator))
+    comparison = comparisons[operator]
+    def compare(record):
+        left = record_value(record)
+        if left is None or value is None:
+            return False
+        return comparison(left, value)
+    return compare
+
+class StandInHoneycomb:
+    def __init__(
+        self,
+        latency=0.0,
+        latency_per_row=0.0
+    ):
+        self.latency = latency
+        self.latency_per_row = latency_per_row
+        self.objects = {object_type: dict() for object_type in OBJECT_TYPES}
+        self.index = dict()
+        self.lock = threading.RLock()
+        self.result_cache = collections.OrderedDict()
+        self.endpoints = dict()
+        self.input_arguments = dict()
+        for object_type in OBJECT_TYPES:
+            search_endpoint_name = honeycomb_io.schema.search_endpoint_name(object_name=object_type)
+            self.endpoints[search_endpoint_name] = ('search', object_type)
+            self.endpoints['find' + search_endpoint_name[len('search'):]] = ('find', object_type)
+            self.endpoints[honeycomb_io.schema.fetch_all_endpoint_name(object_name=object_type)] = ('fetch_all', object_type)
+            self.endpoints['get' + object_type] = ('get', object_type)
+            self.endpoints[honeycomb_io.schema.create_endpoint_name(object_name=object_type)] = ('create', object_type)
+            self.endpoints[honeycomb_io.schema.update_endpoint_name(object_name=object_type)] = ('update', object_type)
+            self.endpoints[honeycomb_io.schema.delete_endpoint_name(object_name=object_type)] = ('delete', object_type)
+            self.input_arguments[honeycomb_io.schema.create_endpoint_name(object_name=object_type)] = (
+                honeycomb_io.schema.create_endpoint_argument_name(object_name=object_type),
+                honeycomb_io.schema.create_endpoint_argument_type(object_name=object_type)
+            )
+            self.input_arguments[honeycomb_io.schema.update_endpoint_name(object_name=object_type)] = (
+                honeycomb_io.schema.update_endpoint_argument_name(object_name=object_type),
+                honeycomb_io.schema.update_endpoint_argument_type(object_name=object_type)
+            )
+
+    def id_field_name(self, object_type):
+        return honeycomb_io.schema.id_field_name(object_name=object_type)
+
+    def insert(self, object_type, record):
+        id_field_name = self.id_field_name(object_type)
+        record = canonical_record(record)
+        if record.get(id_field_name) is None:
+            record[id_field_name] = str(uuid.uuid4())
+        record['__typename'] = object_type
+        with self.lock:
+            self.objects[object_type][record[id_field_name]] = record
+            self.index[record[id_field_name]] = record
+            self.result_cache.clear()
+        return record
+
+    def insert_many(self, object_type, records):
+        id_field_name = self.id_field_name(object_type)
+        with self.lock:
+            objects = self.objects[object_type]
+            for record in records:
+                record['__typename'] = object_type
+                objects[record[id_field_name]] = record
+                self.index[record[id_field_name]] = record
+            self.result_cache.clear()
+
+    def count(self, object_type):
+        return len(self.objects[object_type])
+
+    def execute(self, document, variables=None):
+        if variables is None:
+            variables = dict()
+        try:
+            operation = parse_document(document)
+            data = dict()
+            num_rows = 0
+            for selection in operation['selections']:
+                if 'type_condition' in selection:
+                    raise StandInError('Inline fragments are not supported at the top level')
+                arguments = substitute_variables(selection['arguments'], variables)
+                value = self.resolve_endpoint(selection['name'], arguments)
+                if isinstance(value, dict) and isinstance(value.get('data'), list):
+                    num_rows += len(value['data'])
+                else:
+                    num_rows += 1
+                data[selection['alias']] = self.project(value, selection['selections'])
+        except StandInError as error:
+            return {'errors': [{'message': str(error)}]}
+        delay = self.latency + self.latency_per_row*num_rows
+        if delay > 0:
+            time.sleep(delay)
+        return {'data': data}
+
+    def resolve_endpoint(self, endpoint_name, arguments):
+        if endpoint_name == '__schema':
+            return self.introspection_schema()
+        if endpoint_name not in self.endpoints:
+            raise StandInError('Endpoint \'{}\' not supported by stand-in server'.format(endpoint_name))
+        verb, object_type = self.endpoints[endpoint_name]
+        id_field_name = self.id_field_name(object_type)
+        page = arguments.pop('page', None)
+        if verb == 'search':
+            query = arguments.get('query')
+            return self.page_results(endpoint_name, object_type, query, page)
+        if verb == 'find':
+            query = {
+                'operator': 'AND',
+                'children': [
+                    {'field': field, 'operator': 'EQ', 'value': value}
+                    for field, value in arguments.items()
+                ]
+            }
+            return self.page_results(endpoint_name, object_type, query, page)
+        if verb == 'fetch_all':
+            return self.page_results(endpoint_name, object_type, None, page)
+        if verb == 'get':
+            return self.objects[object_type].get(arguments.get(id_field_name))
+        if verb == 'create':
+            input_values = [value for value in arguments.values() if isinstance(value, dict)]
+            if len(input_values) != 1:
+                raise StandInError('Create request must have exactly one input object')
+            return self.insert(object_type, dict(input_values[0]))
+        if verb == 'update':
+            object_id = arguments.pop(id_field_name, None)
+            with self.lock:
+                record = self.objects[object_type].get(object_id)
+                if record is None:
+                    raise StandInError('{} {} not found'.format(object_type, object_id))
+                for input_value in arguments.values():
+                    if isinstance(input_value, dict):
+                        record.update(canonical_record(input_value))
+                self.result_cache.clear()
+            return record
+        if verb == 'delete':
+            object_id = arguments.get(id_field_name)
+            with self.lock:
+                record = self.objects[object_type].pop(object_id, None)
+                self.index.pop(object_id, None)
+                self.result_cache.clear()
+            if record is None:
+                return {'status': 'error', 'error': '{} {} not found'.format(object_type, object_id)}
+            return {'status': 'ok', 'error': None}
+        raise StandInError('Verb \'{}\' not supported'.format(verb))
+
+    # Matching IDs for each query are cached so that paging through a large
+    # result set doesn't rescan the table for every page
+    def page_results(self, endpoint_name, object_type, query, page):
+        if page is None:
+            page = dict()
+        max_items = page.get('max')
+        sort = page.get('sort')
+        cursor = page.get('cursor')
+        cache_key = json.dumps([endpoint_name, query, sort], sort_keys=True, default=str)
+        with self.lock:
+            matching_ids = self.result_cache.get(cache_key)
+            if matching_ids is None:
+                predicate = compile_query(query) if query is not None else None
+                records = [
+                    record for record in self.objects[object_type].values()
+                    if predicate is None or predicate(record)
+                ]
+                records.sort(key=lambda record: record[self.id_field_name(object_type)])
+                if sort is not None:
+                    if isinstance(sort, dict):
+                        sort = [sort]
+                    for sort_item in reversed(sort):
+                        records.sort(
+                            key=lambda record: honeycomb_io.core.sort_value(record.get(sort_item.get('field'))),
+                            reverse=sort_item.get('direction', 'ASC') == 'DESC'
+                        )
+                matching_ids = [record[self.id_field_name(object_type)] for record in records]
+                self.result_cache[cache_key] = matching_ids
+                while len(self.result_cache) > RESULT_CACHE_SIZE:
+                    self.result_cache.popitem(last=False)
+            else:
+                self.result_cache.move_to_end(cache_key)
+            offset = int(cursor) if cursor is not None else 0
+            end = len(matching_ids) if max_items is None else min(offset + max_items, len(matching_ids))
+            data = [self.index[object_id] for object_id in matching_ids[offset:end] if object_id in self.index]
+        return {
+            'data': data,
+            'page_info': {
+                'count': len(data),
+                'cursor': str(end) if end < len(matching_ids) else None
+            }
+        }
+
+    def project(self, value, selections):
+        if value is None or selections is None:
+            return value
+        if isinstance(value, list):
+            return [self.project(item, selections) for item in value]
+        if isinstance(value, str):
+            value = self.index.get(value)
+            if value is None:
+                return None
+        if not isinstance(value, dict):
+            return value
+        output = dict()
+        for selection in selections:
+            if 'type_condition' in selection:
+                if value.get('__typename') == selection['type_condition']:
+                    output.update(self.project(value, selection['selections']))
+                continue
+            output[selection['alias']] = self.project(value.get(selection['name']), selection['selections'])
+        return output
+
+    # The schema has the stand-in's endpoints and, for each object type, the
+    # fields of the records it currently holds (typed from their values), so
+    # that it follows whatever the stand-in was seeded with. Input types have
+    # no fields, since any input is accepted
+    def introspection_schema(self):
+        types = {
+            scalar_name: type_info('SCALAR', scalar_name)
+            for scalar_name in ['ID', 'String', 'Int', 'Float', 'Boolean']
+        }
+        for input_type_name in ['QueryExpression', 'PaginationInput']:
+            types[input_type_name] = type_info('INPUT_OBJECT', input_type_name, input_fields=list())
+        types['PageInfo'] = type_info('OBJECT', 'PageInfo', fields=[
+            field_info('count', type_ref('SCALAR', 'Int')),
+            field_info('cursor', type_ref('SCALAR', 'String'))
+        ])
+        types['DeleteStatusResponse'] = type_info('OBJECT', 'DeleteStatusResponse', fields=[
+            field_info('status', type_ref('SCALAR', 'String')),
+            field_info('error', type_ref('SCALAR', 'String'))
+        ])
+        with self.lock:
+            for object_type in OBJECT_TYPES:
+                self.add_record_type(
+                    types=types,
+                    type_name=object_type,
+                    records=list(self.objects[object_type].values()),
+                    id_field_name=self.id_field_name(object_type)
+                )
+                types[object_type + 'List'] = type_info('OBJECT', object_type + 'List', fields=[
+                    field_info('data', type_ref('LIST', of_type=type_ref('OBJECT', object_type))),
+                    field_info('page_info', type_ref('OBJECT', 'PageInfo'))
+                ])
+        query_fields = list()
+        mutation_fields = list()
+        for endpoint_name, (verb, object_type) in self.endpoints.items():
+            id_argument = field_info(
+                self.id_field_name(object_type),
+                type_ref('NON_NULL', of_type=type_ref('SCALAR', 'ID'))
+            )
+            page_argument = field_info('page', type_ref('INPUT_OBJECT', 'PaginationInput'))
+            list_type = type_ref('OBJECT', object_type + 'List')
+            if verb == 'search':
+                query_fields.append(field_info(endpoint_name, list_type, args=[
+                    field_info('query', type_ref('NON_NULL', of_type=type_ref('INPUT_OBJECT', 'QueryExpression'))),
+                    page_argument
+                ]))
+            elif verb in ['find', 'fetch_all']:
+                query_fields.append(field_info(endpoint_name, list_type, args=[page_argument]))
+            elif verb == 'get':
+                query_fields.append(field_info(endpoint_name, type_ref('OBJECT', object_type), args=[id_argument]))
+            elif verb in ['create', 'update']:
+                argument_name, argument_type = self.input_arguments[endpoint_name]
+                input_argument = field_info(argument_name, type_ref_from_string(argument_type, 'INPUT_OBJECT'))
+                input_type_name = honeycomb_io.introspection.named_type(input_argument['type'])
+                types[input_type_name] = type_info('INPUT_OBJECT', input_type_name, input_fields=list())
+                mutation_fields.append(field_info(
+                    endpoint_name,
+                    type_ref('OBJECT', object_type),
+                    args=[input_argument] if verb == 'create' else [id_argument, input_argument]
+                ))
+            elif verb == 'delete':
+                mutation_fields.append(field_info(endpoint_name, type_ref('OBJECT', 'DeleteStatusResponse'), args=[id_argument]))
+        types['Query'] = type_info('OBJECT', 'Query', fields=query_fields)
+        types['Mutation'] = type_info('OBJECT', 'Mutation', fields=mutation_fields)
+        return {
+            'queryType': {'name': 'Query'},
+            'mutationType': {'name': 'Mutation'},
+            'types': list(types.values())
+        }
+
+    def add_record_type(self, types, type_name, records, id_field_name=None):
+        field_values = dict()
+        if id_field_name is not None:
+            field_values[id_field_name] = list()
+        for record in records:
+            for field_name, value in record.items():
+                if field_name == '__typename':
+                    continue
+                field_values.setdefault(field_name, list())
+                if value is not None:
+                    field_values[field_name].append(value)
+        fields = list()
+        for field_name, values in field_values.items():
+            if field_name == id_field_name:
+                fields.append(field_info(field_name, type_ref('NON_NULL', of_type=type_ref('SCALAR', 'ID'))))
+                continue
+            fields.append(field_info(field_name, self.values_type_ref(
+                types=types,
+                type_name=type_name + inflection.camelize(field_name),
+                values=values
+            )))
+        types[type_name] = type_info('OBJECT', type_name, fields=fields)
+
+    # Strings which are all IDs of stored objects are references to those
+    # objects (or to a union of their types). Nested records get an object type
+    # named after the field
+    def values_type_ref(self, types, type_name, values):
+        if len(values) == 0:
+            return type_ref('SCALAR', 'String')
+        if all(isinstance(value, (list, tuple)) for value in values):
+            return type_ref('LIST', of_type=self.values_type_ref(
+                types=types,
+                type_name=type_name,
+                values=[item for value in values for item in value if item is not None]
+            ))
+        if all(isinstance(value, dict) for value in values):
+            self.add_record_type(types, type_name, values)
+            return type_ref('OBJECT', type_name)
+        if all(isinstance(value, bool) for value in values):
+            return type_ref('SCALAR', 'Boolean')
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            return type_ref('SCALAR', 'Int')
+        if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            return type_ref('SCALAR', 'Float')
+        if all(isinstance(value, str) and value in self.index for value in values):
+            referenced_types = sorted({self.index[value]['__typename'] for value in values})
+            if len(referenced_types) == 1:
+                return type_ref('OBJECT', referenced_types[0])
+            types[type_name] = type_info('UNION', type_name, possible_types=referenced_types)
+            return type_ref('UNION', type_name)
+        return type_ref('SCALAR', 'String')
+
+    def seed(
+        self,
+        num_environments=1,
+        num_uwb_tags=20,
+        num_cameras=4,
+        num_persons=15,
+        num_trays=10,
+        num_materials=10,
+        num_position_rows=10000,
+        num_imu_rows=10000,
+        num_uwb_datapoints=10,
+        uwb_rows_per_datapoint=1000,
+        num_pose_2d_rows=1000,
+        num_material_interactions=100,
+        start=datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+        sample_interval=datetime.timedelta(milliseconds=100),
+        seed=0
+    ):
+        rng = random.Random(seed)
+        def new_id():
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        def timestamp(offset_index):
+            return (start + offset_index*sample_interval).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        start_string = timestamp(0)
+        seeded = dict()
+        for environment_index in range(num_environments):
+            environment = self.insert('Environment', {
+                'environment_id': new_id(),
+                'name': 'environment-{}'.format(environment_index),
+                'display_name': 'Environment {}'.format(environment_index),
+                'transparent_classroom_id': 1000 + environment_index,
+                'description': 'Synthetic environment {}'.format(environment_index),
+                'location': 'Stand-in',
+                'timezone_name': 'US/Central',
+                'timezone_abbreviation': 'CST',
+                'assignments': list()
+            })
+            environment_id = environment['environment_id']
+            coordinate_space = self.insert('CoordinateSpace', {
+                'space_id': new_id(),
+                'name': 'coordinate-space-{}'.format(environment_index),
+                'environment': environment_id,
+                'start': start_string,
+                'end': None
+            })
+            entities = dict()
+            for object_type, id_field_name, count, properties in [
+                ('Person', 'person_id', num_persons, lambda index: {
+                    'name': 'Person {}'.format(index),
+                    'short_name': 'P{}'.format(index),
+                    'anonymized_name': 'Anonymous {}'.format(index),
+                    'anonymized_short_name': 'A{}'.format(index),
+                    'person_type': 'STUDENT' if index % 5 else 'TEACHER',
+                    'transparent_classroom_id': 5000 + index
+                }),
+                ('Tray', 'tray_id', num_trays, lambda index: {
+                    'name': 'Tray {}'.format(index),
+                    'part_number': 'TRAY-{}'.format(index),
+                    'serial_number': 'T{:04d}'.format(index)
+                }),
+                ('Material', 'material_id', num_materials, lambda index: {
+                    'name': 'Material {}'.format(index),
+                    'transparent_classroom_id': 9000 + index,
+                    'transparent_classroom_type': 'Lesson'
+                })
+            ]:
+                entities[object_type] = list()
+                for index in range(count):
+                    entity = self.insert(object_type, {
+                        id_field_name: new_id(),
+                        **properties(index),
+                        'assignments': list(),
+                        'entity_assignments': list()
+                    })
+                    entity['assignments'].append(self.insert('Assignment', {
+                        'assignment_id': new_id(),
+                        'environment': environment_id,
+                        'assigned': entity[id_field_name],
+                        'assigned_type': object_type.upper(),
+                        'start': start_string,
+                        'end': None
+                    })['assignment_id'])
+                    environment['assignments'].append(entity['assignments'][-1])
+                    entities[object_type].append(entity)
+            devices = dict()
+            for device_type, count in [('UWBTAG', num_uwb_tags), ('PI3WITHCAMERA', num_cameras)]:
+                devices[device_type] = list()
+                for index in range(count):
+                    device = self.insert('Device', {
+                        'device_id': new_id(),
+                        'device_type': device_type,
+                        'part_number': '{}-PART'.format(device_type),
+                        'name': '{}-{}-{}'.format(device_type.lower(), environment_index, index),
+                        'tag_id': index if device_type == 'UWBTAG' else None,
+                        'serial_number': '{:012x}'.format(rng.getrandbits(48)),
+                        'mac_address': ':'.join(['{:02x}'.format(rng.getrandbits(8)) for _ in range(6)]),
+                        'description': None,
+                        'assignments': list(),
+                        'entity_assignments': list(),
+                        'position_assignments': list()
+                    })
+                    assignment = self.insert('Assignment', {
+                        'assignment_id': new_id(),
+                        'environment': environment_id,
+                        'assigned': device['device_id'],
+                        'assigned_type': 'DEVICE',
+                        'start': start_string,
+                        'end': None
+                    })
+                    device['assignments'].append(assignment['assignment_id'])
+                    environment['assignments'].append(assignment['assignment_id'])
+                    devices[device_type].append(device)
+            # UWB tags are worn by people or attached to trays
+            wearers = entities['Person'] + entities['Tray']
+            for index, device in enumerate(devices['UWBTAG']):
+                if len(wearers) == 0:
+                    break
+                wearer = wearers[index % len(wearers)]
+                entity_type = wearer['__typename'].upper()
+                entity_assignment = self.insert('EntityAssignment', {
+                    'entity_assignment_id': new_id(),
+                    'device': device['device_id'],
+                    'entity': wearer.get('person_id', wearer.get('tray_id')),
+                    'entity_type': entity_type,
+                    'start': start_string,
+                    'end': None
+                })
+                device['entity_assignments'].append(entity_assignment['entity_assignment_id'])
+                wearer['entity_assignments'].append(entity_assignment['entity_assignment_id'])
+            for index, material in enumerate(entities['Material']):
+                if len(entities['Tray']) == 0:
+                    break
+                self.insert('MaterialAssignment', {
+                    'material_assignment_id': new_id(),
+                    'material': material['material_id'],
+                    'tray': entities['Tray'][index % len(entities['Tray'])]['tray_id'],
+                    'start': start_string,
+                    'end': None
+                })
+            uwb_tags = devices['UWBTAG']
+            if len(uwb_tags) > 0:
+                self.insert_many('Position', [
+                    {
+                        'position_id': new_id(),
+                        'timestamp': timestamp(row_index // len(uwb_tags)),
+                        'socket_read_time': timestamp(row_index // len(uwb_tags)),
+                        'network_time': str(row_index),
+                        'coordinate_space': coordinate_space['space_id'],
+                        'object': uwb_tags[row_index % len(uwb_tags)]['device_id'],
+                        'coordinates': [rng.uniform(0, 10), rng.uniform(0, 10), rng.uniform(0, 2)],
+                        'quality': rng.randrange(100, 1000),
+                        'anchor_count': rng.randrange(3, 8),
+                        'source_type': 'MEASURED'
+                    }
+                    for row_index in range(num_position_rows)
+                ])
+                for object_type, id_field_name, scale in [
+                    ('AccelerometerData', 'accelerometer_data_id', 2.0),
+                    ('GyroscopeData', 'gyroscope_data_id', 250.0),
+                    ('MagnetometerData', 'magnetometer_data_id', 50.0)
+                ]:
+                    self.insert_many(object_type, [
+                        {
+                            id_field_name: new_id(),
+                            'timestamp': timestamp(row_index // len(uwb_tags)),
+                            'socket_read_time': timestamp(row_index // len(uwb_tags)),
+                            'network_time': str(row_index),
+                            'device': uwb_tags[row_index % len(uwb_tags)]['device_id'],
+                            'data': [rng.uniform(-scale, scale) for _ in range(3)]
+                        }
+                        for row_index in range(num_imu_rows)
+                    ])
+            # Raw UWB datapoints are JSON Lines files attached to the
+            # assignment of a network hub device
+            if num_uwb_datapoints > 0:
+                hub = self.insert('Device', {
+                    'device_id': new_id(),
+                    'device_type': 'UWBNETWORK',
+                    'part_number': 'UWBNETWORK-PART',
+                    'name': 'uwb-network-{}'.format(environment_index),
+                    'serial_number': '{:012x}'.format(rng.getrandbits(48)),
+                    'assignments': list()
+                })
+                hub_assignment = self.insert('Assignment', {
+                    'assignment_id': new_id(),
+                    'environment': environment_id,
+                    'assigned': hub['device_id'],
+                    'assigned_type': 'DEVICE',
+                    'start': start_string,
+                    'end': None
+                })
+                hub['assignments'].append(hub_assignment['assignment_id'])
+                environment['assignments'].append(hub_assignment['assignment_id'])
+                for datapoint_index in range(num_uwb_datapoints):
+                    lines = list()
+                    for row_index in range(uwb_rows_per_datapoint):
+                        tag = uwb_tags[row_index % len(uwb_tags)] if len(uwb_tags) > 0 else None
+                        offset_index = datapoint_index*uwb_rows_per_datapoint + row_index
+                        lines.append(json.dumps(synthetic_raw_uwb_row(
+                            rng=rng,
+                            row_type=['position', 'accelerometer', 'gyroscope', 'magnetometer'][row_index % 4],
+                            timestamp=timestamp(offset_index),
+                            serial_number=tag['serial_number'] if tag is not None else None,
+                            network_time=offset_index
+                        )))
+                    self.insert('Datapoint', {
+                        'data_id': new_id(),
+                        'timestamp': timestamp(datapoint_index*uwb_rows_per_datapoint),
+                        'source': hub_assignment['assignment_id'],
+                        'source_type': 'MEASURED',
+                        'format': 'application/jsonl',
+                        'tags': ['uwb'],
+                        'file': {
+                            'name': 'uwb-{}.jsonl'.format(datapoint_index),
+                            'contentType': 'application/jsonl',
+                            'data': json.dumps('\n'.join(lines))
+                        }
+                    })
+            cameras = devices['PI3WITHCAMERA']
+            if num_pose_2d_rows > 0 and len(cameras) > 0:
+                pose_model = self.insert('PoseModel', {
+                    'pose_model_id': new_id(),
+                    'model_format': 'COCO-17',
+                    'model_name': 'COCO-17',
+                    'model_variant_name': 'stand-in',
+                    'keypoint_descriptions': ['keypoint-{}'.format(index) for index in range(17)],
+                    'keypoint_connectors': [[index, index + 1] for index in range(16)]
+                })
+                inference_execution = self.insert('InferenceExecution', {
+                    'inference_id': new_id(),
+                    'name': 'Synthetic 2D poses',
+                    'notes': None,
+                    'model': 'stand-in',
+                    'version': '0',
+                    'data_sources': None,
+                    'data_results': None,
+                    'execution_start': start_string
+                })
+                self.insert_many('Pose2D', [
+                    {
+                        'pose_id': new_id(),
+                        'timestamp': timestamp(row_index // len(cameras)),
+                        'camera': cameras[row_index % len(cameras)]['device_id'],
+                        'track_label': str(row_index % 7),
+                        'pose_model': pose_model['pose_model_id'],
+                        'keypoints': [
+                            {'coordinates': [rng.uniform(0, 1296), rng.uniform(0, 972)], 'quality': rng.random()}
+                            for _ in range(17)
+                        ],
+                        'quality': rng.random(),
+                        'person': None,
+                        'source': inference_execution['inference_id']
+                    }
+                    for row_index in range(num_pose_2d_rows)
+                ])
+            if num_material_interactions > 0 and len(entities['Person']) > 0 and len(entities['Material']) > 0:
+                self.insert_many('MaterialInteraction', [
+                    {
+                        'material_interaction_id': new_id(),
+                        'start': timestamp(row_index*100),
+                        'end': timestamp(row_index*100 + 50),
+                        'source_type': 'MEASURED',
+                        'person': entities['Person'][row_index % len(entities['Person'])]['person_id'],
+                        'material': entities['Material'][row_index % len(entities['Material'])]['material_id']
+                    }
+                    for row_index in range(num_material_interactions)
+                ])
+            seeded[environment['name']] = environment_id
+        logger.info('Seeded stand-in Honeycomb with {}'.format(
+            {object_type: len(objects) for object_type, objects in self.objects.items() if len(objects) > 0}
+        ))
+        return seeded
+
+def type_ref(kind, name=None, of_type=None):
+    return {'kind': kind, 'name': name, 'ofType': of_type}
+
+# Type references for type strings like 'PositionAssignmentInput!'
+def type_ref_from_string(type_string, kind):
+    if type_string.endswith('!'):
+        return type_ref('NON_NULL', of_type=type_ref_from_string(type_string[:-1], kind))
+    if type_string.startswith('[') and type_string.endswith(']'):
+        return type_ref('LIST', of_type=type_ref_from_string(type_string[1:-1], kind))
+    return type_ref(kind, type_string)
+
+def field_info(name, field_type, args=None):
+    return {'name': name, 'args': args if args is not None else list(), 'type': field_type}
+
+def type_info(kind, name, fields=None, input_fields=None, possible_types=None):
+    return {
+        'kind': kind,
+        'name': name,
+        'fields': fields,
+        'inputFields': input_fields,
+        'possibleTypes': [{'name': possible_type} for possible_type in possible_types] if possible_types is not None else None
+    }
+
+def synthetic_raw_uwb_row(
+    rng,
+    row_type,
+    timestamp,
+    serial_number,
+    network_time
+):
+    row = {
+        'type': row_type,
+        'timestamp': timestamp,
+        'socket_read_time': timestamp,
+        'network_time': network_time,
+        'serial_number': serial_number
+    }
+    if row_type == 'position':
+        row.update({
+            'x': rng.randrange(0, 10000),
+            'y': rng.randrange(0, 10000),
+            'z': rng.randrange(0, 2000),
+            'anchor_count': rng.randrange(3, 8),
+            'quality': rng.randrange(100, 1000),
+            'smoothing': 0
+        })
+    elif row_type == 'accelerometer':
+        row.update({
+            'x': rng.randrange(-2000, 2000),
+            'y': rng.randrange(-2000, 2000),
+            'z': rng.randrange(-2000, 2000),
+            'scale': 1
+        })
+    else:
+        row.update({
+            'x': rng.randrange(-2000, 2000),
+            'y': rng.randrange(-2000, 2000),
+            'z': rng.randrange(-2000, 2000),
+            'scale': 1
+        })
+    return row
+
+class StandInHoneycombServer:
+    def __init__(
+        self,
+        honeycomb=None,
+        host='127.0.0.1',
+        port=0,
+        latency=0.0,
+        latency_per_row=0.0
+    ):
+        if honeycomb is None:
+            honeycomb = StandInHoneycomb(
+                latency=latency,
+                latency_per_row=latency_per_row
+            )
+        self.honeycomb = honeycomb
+        self.httpd = http.server.ThreadingHTTPServer((host, port), StandInRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.honeycomb = honeycomb
+        self.thread = None
+
+    @property
+    def uri(self):
+        return 'http://{}:{}/graphql'.format(*self.httpd.server_address[:2])
+
+    @property
+    def token_uri(self):
+        return 'http://{}:{}/oauth/token'.format(*self.httpd.server_address[:2])
+
+    def client_arguments(self):
+        return {
+            'uri': self.uri,
+            'token_uri': self.token_uri,
+            'audience': DEFAULT_AUDIENCE,
+            'client_id': DEFAULT_CLIENT_ID,
+            'client_secret': DEFAULT_CLIENT_SECRET
+        }
+
+    def generate_client(self):
+        return honeycomb_io.core.generate_client(**self.client_arguments())
+
+    # Some fetchers don't pass connection arguments through to every request,
+    # so they only reach the stand-in through the environment
+    def set_environment_variables(self):
+        for argument_name, value in self.client_arguments().items():
+            os.environ['HONEYCOMB_{}'.format(argument_name.upper())] = value
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self.thread.start()
+            logger.info('Stand-in Honeycomb server listening at {}'.format(self.uri))
+        return self
+
+    def stop(self):
+        if self.thread is not None:
+            self.httpd.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+class StandInRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path.startswith('/oauth/token'):
+            self.send_json({
+                'access_token': 'stand-in-token',
+                'token_type': 'Bearer',
+                'expires_in': 86400
+            })
+            return
+        content_type = self.headers.get('Content-Type', '')
+        try:
+            # The Honeycomb client labels file uploads as JSON, so multipart
+            # bodies are recognized by their leading boundary
+            if content_type.startswith('multipart/form-data') or body.startswith(b'--'):
+                payload = parse_multipart_payload(body)
+            else:
+                payload = json.loads(body)
+        except (ValueError, KeyError) as error:
+            self.send_json({'errors': [{'message': 'Malformed request: {}'.format(error)}]}, status=400)
+            return
+        response = self.server.honeycomb.execute(
+            document=payload.get('query', ''),
+            variables=payload.get('variables')
+        )
+        self.send_json(response)
+
+    def send_json(self, content, status=200):
+        response_body = json.dumps(content).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+# File uploads follow the GraphQL multipart request spec used by the
+# Honeycomb client: an operations field, a map field, and one part per file
+def parse_multipart_payload(body):
+    boundary = body.split(b'\r\n', 1)[0][2:].decode('utf-8')
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        'Content-Type: multipart/form-data; boundary="{}"\r\n\r\n'.format(boundary).encode('utf-8') + body
+    )
+    parts = dict()
+    for part in message.iter_parts():
+        parts[part.get_param('name', header='content-disposition')] = part.get_payload(decode=True)
+    payload = json.loads(parts['operations'])
+    file_map = json.loads(parts['map'])
+    for file_key, paths in file_map.items():
+        file_content = parts[file_key].decode('utf-8')
+        for path in paths:
+            target = payload
+            path_elements = path.split('.')
+            for path_element in path_elements[:-1]:
+                target = target[path_element]
+            target[path_elements[-1]] = file_content
+    return payload
@@ -1,3 +1,4 @@
+import honeycomb_io.core
 import honeycomb_io.utils
 import minimal_honeycomb
 import pandas as pd
@@ -299,7 +300,7 @@ def generate_tray_dataframe(
 # Not currently used
 def fetch_tray_ids():
     logger.info('Fetching entity assignment info to extract tray IDs')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='entityAssignments',
@@ -1,11 +1,18 @@
 import pandas as pd
+import numpy as np
 import datetime
+import hashlib
+import json
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
-def parse_data_sequence(data):
+DATAFRAME_RECORDS_BATCH_SIZE = 1000
+
+# With lazy=True, DataFrames come back as DataFrameRecords, which build record
+# dicts from the columns one slice at a time instead of all at once
+def parse_data_sequence(data, lazy=False):
     if isinstance(data, dict):
         data_list = [data]
     elif isinstance(data, list):
@@ -15,11 +22,96 @@ def parse_data_sequence(data):
     elif isinstance(data, pd.core.frame.DataFrame):
         if data.index.name is not None:
             data = data.reset_index(drop=False)
-        data_list = data.to_dict(orient='records')
+        if lazy:
+            data_list = DataFrameRecords(data)
+        else:
+            data_list = data.to_dict(orient='records')
     else:
         raise ValueError('Data must be dict, list, tuple, or Pandas DataFrame')
     return data_list
 
+# Read-only sequence of the records in a DataFrame. Records are generated on
+# demand for each index or slice, with numpy arrays and scalars converted to
+# lists and Python values and missing values converted to None, so that they
+# can be encoded as JSON directly
+class DataFrameRecords:
+    def __init__(self, df):
+        self.columns = list(df.columns)
+        self.num_records = len(df)
+        self.column_values = dict()
+        self.null_masks = dict()
+        for column in self.columns:
+            series = df[column]
+            # Datetimes and extension types are converted by pandas, everything
+            # else directly from the underlying numpy array
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind not in 'mM':
+                self.column_values[column] = series.to_numpy()
+            else:
+                self.column_values[column] = series
+            null_mask = series.isna().to_numpy()
+            if null_mask.any():
+                self.null_masks[column] = null_mask
+
+    def __len__(self):
+        return self.num_records
+
+    def __iter__(self):
+        for start in range(0, self.num_records, DATAFRAME_RECORDS_BATCH_SIZE):
+            yield from self[start:start + DATAFRAME_RECORDS_BATCH_SIZE]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.num_records)
+            if step != 1:
+                raise ValueError('Record slices must be contiguous')
+            return self.records(start, stop)
+        if index < 0:
+            index += self.num_records
+        if index < 0 or index >= self.num_records:
+            raise IndexError('Record index out of range')
+        return self.records(index, index + 1)[0]
+
+    def records(self, start, stop):
+        column_lists = [
+            self.column_list(column, start, stop)
+            for column in self.columns
+        ]
+        return [dict(zip(self.columns, values)) for values in zip(*column_lists)]
+
+    def column_list(self, column, start, stop):
+        values = self.column_values[column]
+        if isinstance(values, pd.Series):
+            values = values.iloc[start:stop].tolist()
+        elif values.dtype.kind == 'O':
+            values = [
+                value.tolist() if isinstance(value, (np.ndarray, np.generic)) else value
+                for value in values[start:stop]
+            ]
+        else:
+            values = values[start:stop].tolist()
+        null_mask = self.null_masks.get(column)
+        if null_mask is not None:
+            for offset in np.flatnonzero(null_mask[start:stop]):
+                values[offset] = None
+        return values
+
+    def pop(self, column):
+        values = self.column_list(column, 0, self.num_records)
+        self.columns.remove(column)
+        del self.column_values[column]
+        self.null_masks.pop(column, None)
+        return values
+
+    def sha256(self):
+        records_hash = hashlib.sha256()
+        for start in range(0, self.num_records, DATAFRAME_RECORDS_BATCH_SIZE):
+            records_hash.update(json.dumps(
+                self[start:start + DATAFRAME_RECORDS_BATCH_SIZE],
+                sort_keys=True,
+                default=str
+            ).encode('utf-8'))
+        return records_hash.hexdigest()
+
 def parse_data_id_sequence(ids):
     if isinstance(ids, str):
         data_id_list = [ids]
@@ -45,6 +137,76 @@ def to_honeycomb_datetime(input_datetime):
         return None
     return pd.to_datetime(input_datetime, utc=True).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
 
+HONEYCOMB_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+HONEYCOMB_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z')
+
+# Vectorized versions of the functions above. Lists and arrays come back as
+# lists (of strings) or DatetimeIndexes (of UTC datetimes). Series come back
+# as Series with the same index
+def to_honeycomb_datetimes(input_datetimes):
+    if isinstance(input_datetimes, pd.Series):
+        return pd.Series(
+            to_honeycomb_datetimes(input_datetimes.tolist()),
+            index=input_datetimes.index,
+            name=input_datetimes.name,
+            dtype='object'
+        )
+    if isinstance(input_datetimes, np.ndarray):
+        input_datetimes = input_datetimes.tolist()
+    else:
+        input_datetimes = list(input_datetimes)
+    # Strings already in Honeycomb format are passed through unchanged (only
+    # distinct values are checked, since timestamps repeat across devices)
+    try:
+        distinct_datetimes = set(input_datetimes)
+    except TypeError:
+        distinct_datetimes = input_datetimes
+    if all(
+        input_datetime is None or
+        (isinstance(input_datetime, str) and HONEYCOMB_DATETIME_RE.fullmatch(input_datetime))
+        for input_datetime in distinct_datetimes
+    ):
+        return input_datetimes
+    try:
+        datetimes = pd.DatetimeIndex(pd.to_datetime(input_datetimes, utc=True)).floor('us')
+    except (ValueError, TypeError):
+        return [to_honeycomb_datetime(input_datetime) for input_datetime in input_datetimes]
+    honeycomb_datetimes = np.char.add(
+        np.datetime_as_string(datetimes.tz_localize(None).values, unit='us'),
+        'Z'
+    ).tolist()
+    return [
+        None if is_null else honeycomb_datetime
+        for honeycomb_datetime, is_null in zip(honeycomb_datetimes, datetimes.isna())
+    ]
+
+def from_honeycomb_datetimes(honeycomb_datetimes):
+    if isinstance(honeycomb_datetimes, pd.Series):
+        return pd.Series(
+            from_honeycomb_datetimes(honeycomb_datetimes.tolist()),
+            index=honeycomb_datetimes.index,
+            name=honeycomb_datetimes.name
+        )
+    if isinstance(honeycomb_datetimes, np.ndarray):
+        honeycomb_datetimes = honeycomb_datetimes.tolist()
+    else:
+        honeycomb_datetimes = list(honeycomb_datetimes)
+    try:
+        return pd.DatetimeIndex(pd.to_datetime(
+            honeycomb_datetimes,
+            format=HONEYCOMB_DATETIME_FORMAT,
+            utc=True
+        ))
+    except (ValueError, TypeError):
+        pass
+    try:
+        return pd.DatetimeIndex(pd.to_datetime(honeycomb_datetimes, utc=True))
+    except (ValueError, TypeError):
+        return pd.DatetimeIndex([
+            pd.to_datetime(honeycomb_datetime, utc=True)
+            for honeycomb_datetime in honeycomb_datetimes
+        ])
+
 # Used by:
 # camera_calibration.colmap (wf-camera-calibration)
 def extract_honeycomb_id(string):
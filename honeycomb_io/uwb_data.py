@@ -1,4 +1,5 @@
 import honeycomb_io.core
+import honeycomb_io.cache
 import honeycomb_io.utils
 import honeycomb_io.environments
 import honeycomb_io.devices
@@ -8,8 +9,8 @@ import honeycomb_io.exceptions
 import minimal_honeycomb
 import pandas as pd
 import numpy as np
-import boto3
-from botocore.exceptions import ClientError
+import collections
+import concurrent.futures
 import datetime
 import dateutil
 import json
@@ -19,6 +20,11 @@ import gzip
 import threading
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # from process_cuwb_data.utils.log import logger
 
 logger = logging.getLogger(__name__)
@@ -35,6 +41,7 @@ CUWB_DATA_MAX_INT = {
 }
 
 SUPPORTED_CUWB_DATA_TYPES = ['position', 'accelerometer', 'gyroscope', 'magnetometer']
+BULK_IMPORT_FILE_FORMATS = ['json', 'parquet', 'arrow']
 
 OBJECT_NAMES = {
     'position': 'Position',
@@ -52,6 +59,8 @@ def fetch_cuwb_data_datapoints(
     device_types=['UWBTAG'],
     coordinate_space_id=None,
     chunk_size=1000,
+    max_workers=None,
+    parse_workers=1,
     client=None,
     uri=None,
     token_uri=None,
@@ -146,23 +155,21 @@ def fetch_cuwb_data_datapoints(
     ))
     df_lists = dict()
     logger.info('Fetching data from each datapoint')
-    for data_id in data_ids:
-        logger.info('Fetching data from datapoint {}'.format(
-            data_id
-        ))
-        dataframes_datapoint = fetch_cuwb_data_datapoint(
-            data_id=data_id,
-            device_types=device_types,
-            coordinate_space_id=coordinate_space_id,
-            device_id_lookup=device_id_lookup,
-            chunk_size=chunk_size,
-            client=client,
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
+    dataframes_datapoints = iter_cuwb_data_datapoints(
+        data_ids=data_ids,
+        device_types=device_types,
+        coordinate_space_id=coordinate_space_id,
+        device_id_lookup=device_id_lookup,
+        max_workers=max_workers,
+        parse_workers=parse_workers,
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    for dataframes_datapoint in dataframes_datapoints:
         for data_type, df in dataframes_datapoint.items():
             if data_type not in df_lists.keys():
                 df_lists[data_type] = list()
@@ -172,6 +179,73 @@ def fetch_cuwb_data_datapoints(
         dfs[data_type] = pd.concat(df_lists[data_type], ignore_index=True)
     return dfs
 
+# Datapoints are downloaded one at a time unless max_workers is 2 or more, in
+# which case they are downloaded by a pool of max_workers threads while earlier
+# ones are parsed on a separate pool of parse_workers threads. At most
+# max_workers + parse_workers datapoints are held in memory at once, and the
+# dataframes are yielded in the order of the data IDs
+def iter_cuwb_data_datapoints(
+    data_ids,
+    device_types=['UWBTAG'],
+    coordinate_space_id=None,
+    device_id_lookup=None,
+    max_workers=None,
+    parse_workers=1,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    def fetch_datapoint(data_id):
+        logger.info('Fetching data from Datapoint with data ID {}'.format(data_id))
+        return fetch_data_lists_data_id(
+            data_id,
+            client=client
+        )
+    def parse_datapoint(data_id, data_lists_data_id):
+        raw_data_lists, environment_name, timestamp = data_lists_data_id
+        return parse_cuwb_data_datapoint(
+            raw_data_lists=raw_data_lists,
+            data_id=data_id,
+            timestamp=timestamp,
+            device_types=device_types,
+            coordinate_space_id=coordinate_space_id,
+            device_id_lookup=device_id_lookup
+        )
+    if max_workers is None or max_workers < 2:
+        for data_id in data_ids:
+            yield parse_datapoint(data_id, fetch_datapoint(data_id))
+        return
+    fetch_futures = collections.deque()
+    parse_futures = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as fetch_executor, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=parse_workers) as parse_executor:
+        def start_parse():
+            fetched_data_id, fetch_future = fetch_futures.popleft()
+            parse_futures.append(parse_executor.submit(parse_datapoint, fetched_data_id, fetch_future.result()))
+        for data_id in data_ids:
+            fetch_futures.append((data_id, fetch_executor.submit(fetch_datapoint, data_id)))
+            if len(fetch_futures) >= max_workers:
+                start_parse()
+            while len(parse_futures) > parse_workers:
+                yield parse_futures.popleft().result()
+        while len(fetch_futures) > 0:
+            start_parse()
+            while len(parse_futures) > parse_workers:
+                yield parse_futures.popleft().result()
+        while len(parse_futures) > 0:
+            yield parse_futures.popleft().result()
+
 def fetch_cuwb_data_datapoint(
     data_id,
     device_types=['UWBTAG'],
@@ -195,6 +269,23 @@ def fetch_cuwb_data_datapoint(
         client_id=client_id,
         client_secret=client_secret
     )
+    return parse_cuwb_data_datapoint(
+        raw_data_lists=raw_data_lists,
+        data_id=data_id,
+        timestamp=timestamp,
+        device_types=device_types,
+        coordinate_space_id=coordinate_space_id,
+        device_id_lookup=device_id_lookup
+    )
+
+def parse_cuwb_data_datapoint(
+    raw_data_lists,
+    data_id,
+    timestamp,
+    device_types=['UWBTAG'],
+    coordinate_space_id=None,
+    device_id_lookup=None
+):
     parsed_data_lists = honeycomb_io.raw_cuwb_data_lists_to_parsed(
         raw_data_lists=raw_data_lists,
         device_types=device_types,
@@ -398,6 +489,7 @@ def raw_cuwb_data_lists_to_parsed(
     device_types=['UWBTAG'],
     coordinate_space_id=None,
     device_id_lookup=None,
+    output_format='list',
     chunk_size=1000,
     client=None,
     uri=None,
@@ -419,6 +511,7 @@ def raw_cuwb_data_lists_to_parsed(
                 device_types=device_types,
                 coordinate_space_id=coordinate_space_id,
                 device_id_lookup=device_id_lookup,
+                output_format=output_format,
                 chunk_size=chunk_size,
                 client=client,
                 uri=uri,
@@ -435,6 +528,7 @@ def raw_cuwb_data_to_parsed(
         device_types=['UWBTAG'],
         coordinate_space_id=None,
         device_id_lookup=None,
+        output_format='list',
         chunk_size=1000,
         client=None,
         uri=None,
@@ -490,6 +584,7 @@ def raw_cuwb_data_to_parsed(
         data_type=data_type,
         device_id_lookup=device_id_lookup,
         coordinate_space_id=coordinate_space_id,
+        output_format=output_format,
         chunk_size=chunk_size,
         client=client,
         uri=uri,
@@ -498,7 +593,7 @@ def raw_cuwb_data_to_parsed(
         client_id=client_id,
         client_secret=client_secret
     )
-    num_parsed_observations = len(parsed_data)
+    num_parsed_observations = len(parsed_data['timestamp']) if output_format == 'columns' else len(parsed_data)
     if num_parsed_observations == 0:
         logger.warn('Raw CUWB observations appear to contain no data for target device types ({})'.format(
             device_types
@@ -511,6 +606,7 @@ def write_raw_cuwb_data_lists(
     device_types=['UWBTAG'],
     coordinate_space_id=None,
     chunk_size=1000,
+    checkpoint_directory=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -519,8 +615,13 @@ def write_raw_cuwb_data_lists(
     client_secret=None
 ):
     data_id_lists = dict()
+    if checkpoint_directory is not None:
+        os.makedirs(checkpoint_directory, exist_ok=True)
     for data_type in SUPPORTED_CUWB_DATA_TYPES:
         if data_type in raw_data_lists.keys():
+            checkpoint_path = None
+            if checkpoint_directory is not None:
+                checkpoint_path = os.path.join(checkpoint_directory, '{}.jsonl'.format(data_type))
             try:
                 data_ids = write_raw_cuwb_data(
                     raw_data=raw_data_lists[data_type],
@@ -528,6 +629,7 @@ def write_raw_cuwb_data_lists(
                     device_types=device_types,
                     coordinate_space_id=coordinate_space_id,
                     chunk_size=chunk_size,
+                    checkpoint_path=checkpoint_path,
                     client=client,
                     uri=uri,
                     token_uri=token_uri,
@@ -536,6 +638,11 @@ def write_raw_cuwb_data_lists(
                     client_secret=client_secret
                 )
             except(honeycomb_io.exceptions.HoneycombWriteError):
+                if checkpoint_directory is not None:
+                    logger.warn('Error occurred during write. Rerun with checkpoint directory {} to resume'.format(
+                        checkpoint_directory
+                    ))
+                    raise
                 logger.warn('Error occurred during write. Attempting to roll back changes')
                 if len(data_id_lists) > 0:
                     try:
@@ -563,6 +670,7 @@ def write_raw_cuwb_data(
     device_types=['UWBTAG'],
     coordinate_space_id=None,
     chunk_size=1000,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -587,6 +695,7 @@ def write_raw_cuwb_data(
         parsed_data=parsed_data,
         data_type=data_type,
         chunk_size=chunk_size,
+        checkpoint_path=checkpoint_path,
         client=client,
         uri=uri,
         token_uri=token_uri,
@@ -609,6 +718,7 @@ def write_cuwb_data(
     parsed_data,
     data_type,
     chunk_size=1000,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -620,6 +730,7 @@ def write_cuwb_data(
         data_ids = write_cuwb_position_data(
             position_data=parsed_data,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -632,6 +743,7 @@ def write_cuwb_data(
         data_ids = write_cuwb_accelerometer_data(
             accelerometer_data=parsed_data,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -644,6 +756,7 @@ def write_cuwb_data(
         data_ids = write_cuwb_gyroscope_data(
             gyroscope_data=parsed_data,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -656,6 +769,7 @@ def write_cuwb_data(
         data_ids = write_cuwb_magnetometer_data(
             magnetometer_data=parsed_data,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -672,6 +786,7 @@ def write_cuwb_data(
 def write_cuwb_position_data(
     position_data,
     chunk_size=1000,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -695,6 +810,7 @@ def write_cuwb_position_data(
             argument_type=None,
             id_field_name=None,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -702,6 +818,8 @@ def write_cuwb_position_data(
             client_id=client_id,
             client_secret=client_secret
         )
+    except honeycomb_io.exceptions.HoneycombPartialWriteError:
+        raise
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Encountered problem when attempting to write assignment data'
@@ -714,6 +832,7 @@ def write_cuwb_position_data(
 def write_cuwb_accelerometer_data(
     accelerometer_data,
     chunk_size=1000,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -737,6 +856,7 @@ def write_cuwb_accelerometer_data(
             argument_type=None,
             id_field_name=None,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -744,6 +864,8 @@ def write_cuwb_accelerometer_data(
             client_id=client_id,
             client_secret=client_secret
         )
+    except honeycomb_io.exceptions.HoneycombPartialWriteError:
+        raise
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Encountered problem when attempting to write accelerometer data'
@@ -756,6 +878,7 @@ def write_cuwb_accelerometer_data(
 def write_cuwb_gyroscope_data(
     gyroscope_data,
     chunk_size=1000,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -779,6 +902,7 @@ def write_cuwb_gyroscope_data(
             argument_type=None,
             id_field_name=None,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -786,6 +910,8 @@ def write_cuwb_gyroscope_data(
             client_id=client_id,
             client_secret=client_secret
         )
+    except honeycomb_io.exceptions.HoneycombPartialWriteError:
+        raise
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Encountered problem when attempting to write gyroscope data'
@@ -798,6 +924,7 @@ def write_cuwb_gyroscope_data(
 def write_cuwb_magnetometer_data(
     magnetometer_data,
     chunk_size=1000,
+    checkpoint_path=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -821,6 +948,7 @@ def write_cuwb_magnetometer_data(
             argument_type=None,
             id_field_name=None,
             chunk_size=chunk_size,
+            checkpoint_path=checkpoint_path,
             client=client,
             uri=uri,
             token_uri=token_uri,
@@ -828,6 +956,8 @@ def write_cuwb_magnetometer_data(
             client_id=client_id,
             client_secret=client_secret
         )
+    except honeycomb_io.exceptions.HoneycombPartialWriteError:
+        raise
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Encountered problem when attempting to write magnetometer data'
@@ -892,6 +1022,7 @@ def parse_raw_cuwb_data(
     data_type,
     device_id_lookup,
     coordinate_space_id=None,
+    output_format='list',
     chunk_size=100,
     client=None,
     uri=None,
@@ -905,6 +1036,7 @@ def parse_raw_cuwb_data(
             raw_position_data=raw_data,
             device_id_lookup=device_id_lookup,
             coordinate_space_id=coordinate_space_id,
+            output_format=output_format,
             chunk_size=chunk_size,
             client=client,
             uri=uri,
@@ -917,19 +1049,22 @@ def parse_raw_cuwb_data(
     elif data_type=='accelerometer':
         parsed_data = parse_raw_accelerometer_data(
             raw_accelerometer_data=raw_data,
-            device_id_lookup=device_id_lookup
+            device_id_lookup=device_id_lookup,
+            output_format=output_format
         )
         return parsed_data
     elif data_type=='gyroscope':
         parsed_data = parse_raw_gyroscope_data(
             raw_gyroscope_data=raw_data,
-            device_id_lookup=device_id_lookup
+            device_id_lookup=device_id_lookup,
+            output_format=output_format
         )
         return parsed_data
     elif data_type=='magnetometer':
         parsed_data = parse_raw_magnetometer_data(
             raw_magnetometer_data=raw_data,
-            device_id_lookup=device_id_lookup
+            device_id_lookup=device_id_lookup,
+            output_format=output_format
         )
         return parsed_data
     else:
@@ -941,6 +1076,7 @@ def parse_raw_position_data(
     raw_position_data,
     device_id_lookup,
     coordinate_space_id=None,
+    output_format='list',
     chunk_size=100,
     client=None,
     uri=None,
@@ -961,11 +1097,11 @@ def parse_raw_position_data(
         return []
     if coordinate_space_id is None:
         try:
-            timestamps = pd.to_datetime([datum.get('timestamp') for datum in raw_position_data])
+            timestamps = pd.to_datetime(raw_cuwb_data_column(raw_position_data, 'timestamp'))
             device_ids = list(set([
-                device_id_lookup[datum.get('serial_number')]
-                for datum in raw_position_data
-                if datum.get('serial_number') in device_id_lookup.keys()
+                device_id_lookup[serial_number]
+                for serial_number in raw_cuwb_data_column(raw_position_data, 'serial_number')
+                if serial_number in device_id_lookup.keys()
             ]))
         except:
             raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
@@ -983,30 +1119,19 @@ def parse_raw_position_data(
             client_id=client_id,
             client_secret=client_secret
         )
-    position_data = list()
     try:
-        for datum in raw_position_data:
-            if datum['serial_number'] in device_id_lookup.keys():
-                position_data.append({
-                    'timestamp': honeycomb_io.utils.to_honeycomb_datetime(datum['timestamp']),
-                    'socket_read_time': honeycomb_io.utils.to_honeycomb_datetime(datum.get('socket_read_time')),
-                    'network_time': str(datum.get('network_time')) if datum.get('network_time') is not None else None,
-                    'coordinate_space': coordinate_space_id,
-                    'object': device_id_lookup[datum['serial_number']],
-                    'coordinates': [
-                        datum['x']/POSITION_SCALE_FACTOR,
-                        datum['y']/POSITION_SCALE_FACTOR,
-                        datum['z']/POSITION_SCALE_FACTOR
-                    ],
-                    'quality': datum.get('quality'),
-                    'anchor_count': datum.get('anchor_count'),
-                    'source_type': 'MEASURED'
-                })
+        position_data = parse_raw_cuwb_data_columns(
+            raw_data=raw_position_data,
+            data_type='position',
+            device_id_lookup=device_id_lookup,
+            coordinate_space_id=coordinate_space_id,
+            output_format=output_format
+        )
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Failed to parse position data'
         )
-    num_parsed_observations = len(position_data)
+    num_parsed_observations = len(position_data['timestamp']) if output_format == 'columns' else len(position_data)
     logger.info('Data yielded {} CUWB position observations for target serial numbers ({})'.format(
         num_parsed_observations,
         list(device_id_lookup.keys())
@@ -1015,7 +1140,8 @@ def parse_raw_position_data(
 
 def parse_raw_accelerometer_data(
     raw_accelerometer_data,
-    device_id_lookup
+    device_id_lookup,
+    output_format='list'
 ):
     num_raw_observations = len(raw_accelerometer_data)
     num_tag_ids = len(device_id_lookup)
@@ -1027,26 +1153,18 @@ def parse_raw_accelerometer_data(
     if num_raw_observations == 0:
         logger.warn('List of raw CUWB accelerometer observations is empty')
         return []
-    accelerometer_data = list()
     try:
-        for datum in raw_accelerometer_data:
-            if datum['serial_number'] in device_id_lookup.keys():
-                accelerometer_data.append({
-                    'timestamp': honeycomb_io.utils.to_honeycomb_datetime(datum['timestamp']),
-                    'socket_read_time': honeycomb_io.utils.to_honeycomb_datetime(datum.get('socket_read_time')),
-                    'network_time': str(datum.get('network_time')) if datum.get('network_time') is not None else None,
-                    'device': device_id_lookup[datum['serial_number']],
-                    'data': [
-                        datum['x']*datum['scale']/CUWB_DATA_MAX_INT[ACCELEROMETER_BYTE_SIZE],
-                        datum['y']*datum['scale']/CUWB_DATA_MAX_INT[ACCELEROMETER_BYTE_SIZE],
-                        datum['z']*datum['scale']/CUWB_DATA_MAX_INT[ACCELEROMETER_BYTE_SIZE]
-                    ]
-                })
+        accelerometer_data = parse_raw_cuwb_data_columns(
+            raw_data=raw_accelerometer_data,
+            data_type='accelerometer',
+            device_id_lookup=device_id_lookup,
+            output_format=output_format
+        )
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Failed to parse accelerometer data'
         )
-    num_parsed_observations = len(accelerometer_data)
+    num_parsed_observations = len(accelerometer_data['timestamp']) if output_format == 'columns' else len(accelerometer_data)
     logger.info('Data yielded {} CUWB accelerometer observations for target serial numbers ({})'.format(
         num_parsed_observations,
         list(device_id_lookup.keys())
@@ -1055,7 +1173,8 @@ def parse_raw_accelerometer_data(
 
 def parse_raw_gyroscope_data(
     raw_gyroscope_data,
-    device_id_lookup
+    device_id_lookup,
+    output_format='list'
 ):
     num_raw_observations = len(raw_gyroscope_data)
     num_tag_ids = len(device_id_lookup)
@@ -1067,26 +1186,18 @@ def parse_raw_gyroscope_data(
     if num_raw_observations == 0:
         logger.warn('List of raw CUWB gyroscope observations is empty')
         return []
-    gyroscope_data = list()
     try:
-        for datum in raw_gyroscope_data:
-            if datum['serial_number'] in device_id_lookup.keys():
-                gyroscope_data.append({
-                    'timestamp': honeycomb_io.utils.to_honeycomb_datetime(datum['timestamp']),
-                    'socket_read_time': honeycomb_io.utils.to_honeycomb_datetime(datum.get('socket_read_time')),
-                    'network_time': str(datum.get('network_time')) if datum.get('network_time') is not None else None,
-                    'device': device_id_lookup[datum['serial_number']],
-                    'data': [
-                        datum['x']*datum['scale']/CUWB_DATA_MAX_INT[GYROSCOPE_BYTE_SIZE],
-                        datum['y']*datum['scale']/CUWB_DATA_MAX_INT[GYROSCOPE_BYTE_SIZE],
-                        datum['z']*datum['scale']/CUWB_DATA_MAX_INT[GYROSCOPE_BYTE_SIZE]
-                    ]
-                })
+        gyroscope_data = parse_raw_cuwb_data_columns(
+            raw_data=raw_gyroscope_data,
+            data_type='gyroscope',
+            device_id_lookup=device_id_lookup,
+            output_format=output_format
+        )
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Failed to parse gyroscope data'
         )
-    num_parsed_observations = len(gyroscope_data)
+    num_parsed_observations = len(gyroscope_data['timestamp']) if output_format == 'columns' else len(gyroscope_data)
     logger.info('Data yielded {} CUWB gyroscope observations for target serial numbers ({})'.format(
         num_parsed_observations,
         list(device_id_lookup.keys())
@@ -1095,7 +1206,8 @@ def parse_raw_gyroscope_data(
 
 def parse_raw_magnetometer_data(
     raw_magnetometer_data,
-    device_id_lookup
+    device_id_lookup,
+    output_format='list'
 ):
     num_raw_observations = len(raw_magnetometer_data)
     num_tag_ids = len(device_id_lookup)
@@ -1107,32 +1219,147 @@ def parse_raw_magnetometer_data(
     if num_raw_observations == 0:
         logger.warn('List of raw CUWB magnetometer observations is empty')
         return []
-    magnetometer_data = list()
     try:
-        for datum in raw_magnetometer_data:
-            if datum['serial_number'] in device_id_lookup.keys():
-                magnetometer_data.append({
-                    'timestamp': honeycomb_io.utils.to_honeycomb_datetime(datum['timestamp']),
-                    'socket_read_time': honeycomb_io.utils.to_honeycomb_datetime(datum.get('socket_read_time')),
-                    'network_time': str(datum.get('network_time')) if datum.get('network_time') is not None else None,
-                    'device': device_id_lookup[datum['serial_number']],
-                    'data': [
-                        datum['x']*datum['scale']/CUWB_DATA_MAX_INT[MAGNETOMETER_BYTE_SIZE],
-                        datum['y']*datum['scale']/CUWB_DATA_MAX_INT[MAGNETOMETER_BYTE_SIZE],
-                        datum['z']*datum['scale']/CUWB_DATA_MAX_INT[MAGNETOMETER_BYTE_SIZE]
-                    ]
-                })
+        magnetometer_data = parse_raw_cuwb_data_columns(
+            raw_data=raw_magnetometer_data,
+            data_type='magnetometer',
+            device_id_lookup=device_id_lookup,
+            output_format=output_format
+        )
     except:
         raise honeycomb_io.exceptions.HoneycombWriteErrorRetry(
             'Failed to parse magnetometer data'
         )
-    num_parsed_observations = len(magnetometer_data)
+    num_parsed_observations = len(magnetometer_data['timestamp']) if output_format == 'columns' else len(magnetometer_data)
     logger.info('Data yielded {} CUWB magnetometer observations for target serial numbers ({})'.format(
         num_parsed_observations,
         list(device_id_lookup.keys())
     ))
     return magnetometer_data
 
+# Parses raw CUWB observations (a list of dicts or a dataframe with the same
+# fields) a column at a time. Returns either a list of dicts, one per
+# observation for the target serial numbers, or a dict of columns with the
+# same keys (with the coordinates/data as an N x 3 array)
+def parse_raw_cuwb_data_columns(
+    raw_data,
+    data_type,
+    device_id_lookup,
+    coordinate_space_id=None,
+    output_format='list'
+):
+    if data_type not in SUPPORTED_CUWB_DATA_TYPES:
+        raise ValueError('Data type must be one of {}'.format(
+            SUPPORTED_CUWB_DATA_TYPES
+        ))
+    if output_format not in ['list', 'columns']:
+        raise ValueError('Output format {} not recognized'.format(output_format))
+    serial_numbers = np.asarray(raw_cuwb_data_column(raw_data, 'serial_number', required=True), dtype='object')
+    target = pd.Series(serial_numbers, dtype='object').isin(list(device_id_lookup.keys())).to_numpy()
+    def target_column(field, required=False):
+        values = np.empty(len(serial_numbers), dtype='object')
+        values[:] = raw_cuwb_data_column(raw_data, field, required=required)
+        return values[target]
+    xyz = np.column_stack([
+        np.asarray(target_column(axis, required=True), dtype='float')
+        for axis in ['x', 'y', 'z']
+    ]) if target.any() else np.empty((0, 3))
+    num_observations = len(xyz)
+    columns = {
+        'timestamp': honeycomb_io.utils.to_honeycomb_datetimes(list(target_column('timestamp', required=True))),
+        'socket_read_time': honeycomb_io.utils.to_honeycomb_datetimes(list(target_column('socket_read_time'))),
+        'network_time': [
+            str(network_time) if network_time is not None else None
+            for network_time in target_column('network_time')
+        ]
+    }
+    device_ids = [device_id_lookup[serial_number] for serial_number in serial_numbers[target]]
+    if data_type == 'position':
+        columns.update({
+            'coordinate_space': [coordinate_space_id]*num_observations,
+            'object': device_ids,
+            'coordinates': xyz/POSITION_SCALE_FACTOR,
+            'quality': list(target_column('quality')),
+            'anchor_count': list(target_column('anchor_count')),
+            'source_type': ['MEASURED']*num_observations
+        })
+    else:
+        byte_size = {
+            'accelerometer': ACCELEROMETER_BYTE_SIZE,
+            'gyroscope': GYROSCOPE_BYTE_SIZE,
+            'magnetometer': MAGNETOMETER_BYTE_SIZE
+        }[data_type]
+        scale = np.asarray(target_column('scale', required=True), dtype='float')
+        columns.update({
+            'device': device_ids,
+            'data': xyz*scale[:, np.newaxis]/CUWB_DATA_MAX_INT[byte_size]
+        })
+    if output_format == 'columns':
+        return columns
+    return parsed_columns_to_records(columns)
+
+def raw_cuwb_data_column(
+    raw_data,
+    field,
+    required=False
+):
+    if isinstance(raw_data, pd.DataFrame):
+        if field not in raw_data.columns:
+            if required:
+                raise ValueError('Raw CUWB data has no field \'{}\''.format(field))
+            return [None]*len(raw_data)
+        values = raw_data[field]
+        # Integer fields with missing values are read as floats
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            values = values.astype('Int64')
+        return values.astype('object').where(values.notna(), None).tolist()
+    if required:
+        return [datum[field] for datum in raw_data]
+    return [datum.get(field) for datum in raw_data]
+
+def parsed_columns_to_records(columns):
+    if 'coordinates' in columns:
+        return [
+            {
+                'timestamp': timestamp,
+                'socket_read_time': socket_read_time,
+                'network_time': network_time,
+                'coordinate_space': coordinate_space,
+                'object': object_id,
+                'coordinates': coordinates,
+                'quality': quality,
+                'anchor_count': anchor_count,
+                'source_type': source_type
+            }
+            for timestamp, socket_read_time, network_time, coordinate_space, object_id, coordinates, quality, anchor_count, source_type in zip(
+                columns['timestamp'],
+                columns['socket_read_time'],
+                columns['network_time'],
+                columns['coordinate_space'],
+                columns['object'],
+                columns['coordinates'].tolist(),
+                columns['quality'],
+                columns['anchor_count'],
+                columns['source_type']
+            )
+        ]
+    return [
+        {
+            'timestamp': timestamp,
+            'socket_read_time': socket_read_time,
+            'network_time': network_time,
+            'device': device_id,
+            'data': data
+        }
+        for timestamp, socket_read_time, network_time, device_id, data in zip(
+            columns['timestamp'],
+            columns['socket_read_time'],
+            columns['network_time'],
+            columns['device'],
+            columns['data'].tolist()
+        )
+    ]
+
 def extract_serial_numbers(
     raw_data
 ):
@@ -1352,6 +1579,9 @@ def fetch_cuwb_position_data(
     output_format='list',
     sort_arguments=None,
     chunk_size=1000,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -1415,11 +1645,14 @@ def fetch_cuwb_position_data(
             start.isoformat(),
             end.isoformat()
         ))
-    data = honeycomb_io.core.search_objects(
+    data = honeycomb_io.core.search_objects_by_time_window(
         object_name='Position',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         sort_arguments=sort_arguments,
         client=client,
         uri=uri,
@@ -1498,6 +1731,9 @@ def fetch_cuwb_accelerometer_data(
     output_format='list',
     sort_arguments=None,
     chunk_size=1000,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -1554,11 +1790,14 @@ def fetch_cuwb_accelerometer_data(
             start.isoformat(),
             end.isoformat()
         ))
-    data = honeycomb_io.core.search_objects(
+    data = honeycomb_io.core.search_objects_by_time_window(
         object_name='AccelerometerData',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         sort_arguments=sort_arguments,
         client=client,
         uri=uri,
@@ -1631,6 +1870,9 @@ def fetch_cuwb_gyroscope_data(
     output_format='list',
     sort_arguments=None,
     chunk_size=1000,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -1687,11 +1929,14 @@ def fetch_cuwb_gyroscope_data(
             start.isoformat(),
             end.isoformat()
         ))
-    data = honeycomb_io.core.search_objects(
+    data = honeycomb_io.core.search_objects_by_time_window(
         object_name='GyroscopeData',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         sort_arguments=sort_arguments,
         client=client,
         uri=uri,
@@ -1764,6 +2009,9 @@ def fetch_cuwb_magnetometer_data(
     device_types=['UWBTAG'],
     sort_arguments=None,
     chunk_size=1000,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     output_format='list',
     client=None,
     uri=None,
@@ -1821,11 +2069,14 @@ def fetch_cuwb_magnetometer_data(
             start.isoformat(),
             end.isoformat()
         ))
-    data = honeycomb_io.core.search_objects(
+    data = honeycomb_io.core.search_objects_by_time_window(
         object_name='MagnetometerData',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         sort_arguments=sort_arguments,
         client=client,
         uri=uri,
@@ -2066,28 +2317,21 @@ def fetch_latest_cuwb_position_data(
         'quality',
         'anchor_count'
     ]
-    data = list()
-    for device_id in device_ids:
-        query_list=[
-            {'field': 'object', 'operator': 'EQ', 'value': device_id}
-        ]
-        datum=honeycomb_io.core.fetch_latest_object(
-            object_name='Position',
-            query_list=query_list,
-            return_data=return_data,
-            request_name=None,
-            id_field_name=None,
-            timestamp_field='timestamp',
-            chunk_size=chunk_size,
-            client=client,
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        if datum is not None:
-            data.append(datum)
+    latest_data = honeycomb_io.core.fetch_latest_objects(
+        group_field='object',
+        group_values=device_ids,
+        object_name='Position',
+        return_data=return_data,
+        request_name=None,
+        timestamp_field='timestamp',
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    data = [datum for datum in latest_data.values() if datum is not None]
     if output_format=='list':
         return data
     elif output_format == 'dataframe':
@@ -2143,28 +2387,21 @@ def fetch_latest_cuwb_accelerometer_data(
         ]},
         'data'
     ]
-    data = list()
-    for device_id in device_ids:
-        query_list=[
-            {'field': 'device', 'operator': 'EQ', 'value': device_id}
-        ]
-        datum=honeycomb_io.core.fetch_latest_object(
-            object_name='AccelerometerData',
-            query_list=query_list,
-            return_data=return_data,
-            request_name=None,
-            id_field_name=None,
-            timestamp_field='timestamp',
-            chunk_size=chunk_size,
-            client=client,
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        if datum is not None:
-            data.append(datum)
+    latest_data = honeycomb_io.core.fetch_latest_objects(
+        group_field='device',
+        group_values=device_ids,
+        object_name='AccelerometerData',
+        return_data=return_data,
+        request_name=None,
+        timestamp_field='timestamp',
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    data = [datum for datum in latest_data.values() if datum is not None]
     if output_format=='list':
         return data
     elif output_format == 'dataframe':
@@ -2220,28 +2457,21 @@ def fetch_latest_cuwb_gyroscope_data(
         ]},
         'data'
     ]
-    data = list()
-    for device_id in device_ids:
-        query_list=[
-            {'field': 'device', 'operator': 'EQ', 'value': device_id}
-        ]
-        datum=honeycomb_io.core.fetch_latest_object(
-            object_name='GyroscopeData',
-            query_list=query_list,
-            return_data=return_data,
-            request_name=None,
-            id_field_name=None,
-            timestamp_field='timestamp',
-            chunk_size=chunk_size,
-            client=client,
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        if datum is not None:
-            data.append(datum)
+    latest_data = honeycomb_io.core.fetch_latest_objects(
+        group_field='device',
+        group_values=device_ids,
+        object_name='GyroscopeData',
+        return_data=return_data,
+        request_name=None,
+        timestamp_field='timestamp',
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    data = [datum for datum in latest_data.values() if datum is not None]
     if output_format=='list':
         return data
     elif output_format == 'dataframe':
@@ -2297,28 +2527,21 @@ def fetch_latest_cuwb_magnetometer_data(
         ]},
         'data'
     ]
-    data = list()
-    for device_id in device_ids:
-        query_list=[
-            {'field': 'device', 'operator': 'EQ', 'value': device_id}
-        ]
-        datum=honeycomb_io.core.fetch_latest_object(
-            object_name='MagnetometerData',
-            query_list=query_list,
-            return_data=return_data,
-            request_name=None,
-            id_field_name=None,
-            timestamp_field='timestamp',
-            chunk_size=chunk_size,
-            client=client,
-            uri=uri,
-            token_uri=token_uri,
-            audience=audience,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        if datum is not None:
-            data.append(datum)
+    latest_data = honeycomb_io.core.fetch_latest_objects(
+        group_field='device',
+        group_values=device_ids,
+        object_name='MagnetometerData',
+        return_data=return_data,
+        request_name=None,
+        timestamp_field='timestamp',
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    data = [datum for datum in latest_data.values() if datum is not None]
     if output_format=='list':
         return data
     elif output_format == 'dataframe':
@@ -2644,7 +2867,7 @@ def fetch_cuwb_tag_device_data(
         device_type='UWBTAG'
 ):
     logger.info('Fetching CUWB tag device data')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='findDevices',
@@ -2689,7 +2912,7 @@ def fetch_cuwb_tag_assignments(
 ):
     logger.info('Fetching CUWB tag assignment IDs for {}'.format(
         assignment_field_name))
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='findDevices',
@@ -2840,7 +3063,7 @@ def fetch_material_tray_devices_assignments(environment_id, start_time, end_time
     hc_end_time = honeycomb_io.utils.to_honeycomb_datetime(end_time)
 
     logger.info('Fetching CUWB tag device data')
-    client = minimal_honeycomb.MinimalHoneycombClient()
+    client = honeycomb_io.core.generate_client()
     result = client.request(
         request_type="query",
         request_name='searchAssignments',
@@ -3082,6 +3305,7 @@ def create_bulk_import_files_day(
     device_types=['UWBTAG'],
     coordinate_space_id=None,
     compress_file=True,
+    output_format='json',
     output_destination='local',
     local_base_directory=None,
     s3_bucket=None,
@@ -3126,6 +3350,7 @@ def create_bulk_import_files_day(
         device_types=device_types,
         coordinate_space_id=coordinate_space_id,
         compress_file=compress_file,
+        output_format=output_format,
         output_destination=output_destination,
         local_base_directory=local_base_directory,
         s3_bucket=s3_bucket,
@@ -3148,6 +3373,7 @@ def create_bulk_import_files(
     device_types=['UWBTAG'],
     coordinate_space_id=None,
     compress_file=True,
+    output_format='json',
     output_destination='local',
     local_base_directory=None,
     s3_bucket=None,
@@ -3256,6 +3482,7 @@ def create_bulk_import_files(
             coordinate_space_id=coordinate_space_id,
             device_id_lookup=device_id_lookup,
             compress_file=compress_file,
+            output_format=output_format,
             output_destination=output_destination,
             local_base_directory=local_base_directory,
             s3_bucket=s3_bucket,
@@ -3267,7 +3494,11 @@ def create_bulk_import_files(
             client_id=client_id,
             client_secret=client_secret
         )
-        if path is not None:
+        if path is None:
+            continue
+        if isinstance(path, list):
+            paths.extend(path)
+        else:
             paths.append(path)
     return paths
 
@@ -3277,6 +3508,7 @@ def create_bulk_import_file_data_id(
     coordinate_space_id=None,
     device_id_lookup=None,
     compress_file=True,
+    output_format='json',
     output_destination='local',
     local_base_directory=None,
     s3_bucket=None,
@@ -3288,6 +3520,10 @@ def create_bulk_import_file_data_id(
     client_id=None,
     client_secret=None
 ):
+    if output_format not in BULK_IMPORT_FILE_FORMATS:
+        raise ValueError('Output format must be one of {}'.format(
+            BULK_IMPORT_FILE_FORMATS
+        ))
     raw_data_lists, environment_name, timestamp = fetch_data_lists_data_id(
         data_id=data_id,
         client=client,
@@ -3302,6 +3538,7 @@ def create_bulk_import_file_data_id(
         device_types=device_types,
         coordinate_space_id=coordinate_space_id,
         device_id_lookup=device_id_lookup,
+        output_format='list' if output_format == 'json' else 'columns',
         chunk_size=chunk_size,
         client=client,
         uri=uri,
@@ -3319,6 +3556,34 @@ def create_bulk_import_file_data_id(
         timestamp.strftime('%m'),
         timestamp.strftime('%d'),
     )
+    # Columnar formats are written as one file per data type
+    if output_format != 'json':
+        paths = list()
+        for data_type, parsed_data in parsed_data_lists.items():
+            if len(parsed_data) == 0:
+                continue
+            filename = 'datapoint_{}_{}_{}.{}'.format(
+                timestamp.strftime('%Y%m%d_%H%M%S'),
+                data_id,
+                data_type,
+                output_format
+            )
+            paths.append(write_bulk_import_file_bytes(
+                file_bytes=cuwb_columns_to_bytes(
+                    columns=parsed_data,
+                    file_format=output_format,
+                    compress_file=compress_file
+                ),
+                directory_path=directory_path,
+                filename=filename,
+                output_destination=output_destination,
+                local_base_directory=local_base_directory,
+                s3_bucket=s3_bucket
+            ))
+        if len(paths) == 0:
+            logger.warning('No data of supported types found in datapoint')
+            return None
+        return paths
     if compress_file:
         filename = 'datapoint_{}_{}.json.gz'.format(
             timestamp.strftime('%Y%m%d_%H%M%S'),
@@ -3364,6 +3629,9 @@ def create_bulk_import_file_data_id(
                 s3_key
             )
         )
+        # boto3 is slow to import and only needed for S3 output
+        import boto3
+        import boto3.s3.transfer
         s3 = boto3.client('s3')
         with io.BytesIO(bytes(json.dumps(parsed_data_lists).encode('UTF-8'))) as file_stream:
             if compress_file:
@@ -3401,7 +3669,123 @@ def create_bulk_import_file_data_id(
             output_destination
         ))
 
-def fetch_data_lists_data_id(
+# Converts parsed CUWB data columns (see parse_raw_cuwb_data_columns) to a
+# Parquet or Arrow IPC file with typed columns: timestamps as UTC nanosecond
+# timestamps, network time as an integer, IDs as dictionary-encoded strings
+# and coordinates/data as fixed-size lists of three floats
+def cuwb_columns_to_bytes(
+    columns,
+    file_format,
+    compress_file=True
+):
+    # pyarrow is only needed for columnar bulk import files
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+    if file_format not in ['parquet', 'arrow']:
+        raise ValueError('File format must be \'parquet\' or \'arrow\'')
+    arrays = dict()
+    for field_name, column in columns.items():
+        if field_name in ['timestamp', 'socket_read_time']:
+            arrays[field_name] = pyarrow.array(
+                honeycomb_io.utils.from_honeycomb_datetimes(column),
+                type=pyarrow.timestamp('ns', tz='UTC')
+            )
+        elif field_name == 'network_time':
+            arrays[field_name] = pyarrow.array(
+                [int(network_time) if network_time is not None else None for network_time in column],
+                type=pyarrow.int64()
+            )
+        elif field_name in ['coordinate_space', 'object', 'device', 'source_type']:
+            arrays[field_name] = pyarrow.array(column, type=pyarrow.string()).dictionary_encode()
+        elif field_name in ['coordinates', 'data']:
+            arrays[field_name] = pyarrow.FixedSizeListArray.from_arrays(
+                pyarrow.array(np.asarray(column, dtype='float64').reshape(-1)),
+                3
+            )
+        else:
+            arrays[field_name] = pyarrow.array(column, type=pyarrow.int64())
+    table = pyarrow.table(arrays)
+    sink = pyarrow.BufferOutputStream()
+    if file_format == 'parquet':
+        pyarrow.parquet.write_table(
+            table,
+            sink,
+            compression='zstd' if compress_file else 'none'
+        )
+    else:
+        with pyarrow.ipc.new_file(
+            sink,
+            table.schema,
+            options=pyarrow.ipc.IpcWriteOptions(compression='zstd' if compress_file else None)
+        ) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def write_bulk_import_file_bytes(
+    file_bytes,
+    directory_path,
+    filename,
+    output_destination='local',
+    local_base_directory=None,
+    s3_bucket=None
+):
+    if output_destination == 'local':
+        if local_base_directory is None:
+            raise ValueError('Must specify local base directory for local output')
+        output_directory = os.path.join(
+            local_base_directory,
+            directory_path
+        )
+        output_path = os.path.join(
+            output_directory,
+            filename
+        )
+        os.makedirs(output_directory, exist_ok=True)
+        logger.info('Creating local file {}'.format(
+            output_path
+        ))
+        with open(output_path, 'wb') as fp:
+            fp.write(file_bytes)
+        return output_path
+    elif output_destination == 's3':
+        if s3_bucket is None:
+            raise ValueError('Must specify S3 bucket for S3 output')
+        s3_key = os.path.join(
+            directory_path,
+            filename
+        )
+        s3_url = 's3://{}'.format(
+            os.path.join(
+                s3_bucket,
+                s3_key
+            )
+        )
+        # boto3 is slow to import and only needed for S3 output
+        import boto3
+        import boto3.s3.transfer
+        s3 = boto3.client('s3')
+        logger.info('Sending stream to S3 with bucket \'{}\' and key \'{}\''.format(
+            s3_bucket,
+            s3_key
+        ))
+        with io.BytesIO(file_bytes) as file_stream:
+            s3.upload_fileobj(
+                file_stream,
+                s3_bucket,
+                s3_key,
+                Config=boto3.s3.transfer.TransferConfig(use_threads=True)
+            )
+        return s3_url
+    else:
+        raise ValueError('Output destination \'{}\' not recognized'.format(
+            output_destination
+        ))
+
+# Fetches the timestamp, source assignment and file data of a datapoint. If
+# the datapoint cache is enabled (see honeycomb_io.cache), the result is
+# read from and written to the local cache
+def fetch_datapoint_file_data(
     data_id,
     client=None,
     uri=None,
@@ -3418,7 +3802,15 @@ def fetch_data_lists_data_id(
         client_id=client_id,
         client_secret=client_secret
     )
-    result=client.request(
+    cache_key = honeycomb_io.cache.datapoint_cache_key(
+        data_id=data_id,
+        client=client
+    )
+    result = honeycomb_io.cache.fetch_cached_datapoint(cache_key)
+    if result is not None:
+        logger.info('Read datapoint {} from cache'.format(data_id))
+        return result
+    result = honeycomb_io.core.template_request(
         request_type='query',
         request_name='getDatapoint',
         arguments={
@@ -3441,40 +3833,106 @@ def fetch_data_lists_data_id(
             {'file': [
                 'data'
             ]}
-        ]
+        ],
+        client=client
     )
-    environment_name = result.get('source', {}).get('environment', {}).get('name')
-    if environment_name is None:
-        raise ValueError('Environment name not found in Datapoint')
-    timestamp = pd.to_datetime(result.get('timestamp'), utc=True).to_pydatetime()
-    if environment_name is None:
-        raise ValueError('Environment name not found in Datapoint')
-    data_jsonl_json = result.get('file', {}).get('data')
-    if data_jsonl_json is None:
-        logger.warn('No UWB data returned')
-        return []
+    if (result.get('file') or {}).get('data') is not None:
+        honeycomb_io.cache.store_cached_datapoint(cache_key, result)
+    return result
+
+# Decodes datapoint file data (JSONL wrapped as a JSON string) into a list of
+# values, one per line. All lines are decoded in a single call (with orjson,
+# if installed) by turning the JSONL into a JSON array. If that fails, the
+# lines are decoded one at a time and malformed lines (and, if dicts_only is
+# set, lines which are not JSON objects) are omitted with a warning
+def decode_wrapped_jsonl(
+    data_jsonl_json,
+    dicts_only=False
+):
+    loads = orjson.loads if orjson is not None else json.loads
     try:
-        data_jsonl = json.loads(data_jsonl_json)
+        data_jsonl = loads(data_jsonl_json)
     except:
-        raise ValueError('Expected JSONL wrapped as JSON, but JSON deserialization failed')
+        try:
+            data_jsonl = json.loads(data_jsonl_json)
+        except:
+            raise ValueError('Expected JSONL wrapped as JSON, but JSON deserialization failed')
     if not isinstance(data_jsonl, str):
         raise ValueError('Expected JSONL but got type \'{}\''.format(type(data_jsonl)))
-    data_lists = dict()
+    data_jsonl = data_jsonl.strip('\n')
+    if '\n\n' in data_jsonl:
+        data_jsonl = '\n'.join([
+            data_jsonl_line
+            for data_jsonl_line in data_jsonl.split('\n')
+            if len(data_jsonl_line) > 0
+        ])
+    num_lines = data_jsonl.count('\n') + 1 if len(data_jsonl) > 0 else 0
+    try:
+        data = loads('[' + data_jsonl.replace('\n', ',') + ']')
+    except:
+        data = None
+    # A line holding several comma-separated values would decode without error
+    # but add extra elements
+    if (
+        data is not None and
+        len(data) == num_lines and
+        (not dicts_only or all(isinstance(datum, dict) for datum in data))
+    ):
+        return data
+    data = list()
     for data_jsonl_line in data_jsonl.split('\n'):
         if len(data_jsonl_line) == 0:
             continue
         try:
             datum = json.loads(data_jsonl_line)
-            data_type = datum.get('type')
-            if data_type in SUPPORTED_CUWB_DATA_TYPES:
-                if data_type not in data_lists.keys():
-                    data_lists[data_type] = list()
-                data_lists[data_type].append(datum)
+            if dicts_only and not isinstance(datum, dict):
+                raise ValueError('Expected JSON object')
         except:
             logger.warn('Encountered malformed JSONL line. Omitting: {}'.format(
                 data_jsonl_line
             ))
             continue
+        data.append(datum)
+    return data
+
+def fetch_data_lists_data_id(
+    data_id,
+    client=None,
+    uri=None,
+    token_uri=None,
+    audience=None,
+    client_id=None,
+    client_secret=None
+):
+    client = honeycomb_io.core.generate_client(
+        client=client,
+        uri=uri,
+        token_uri=token_uri,
+        audience=audience,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+    result = fetch_datapoint_file_data(
+        data_id=data_id,
+        client=client
+    )
+    environment_name = result.get('source', {}).get('environment', {}).get('name')
+    if environment_name is None:
+        raise ValueError('Environment name not found in Datapoint')
+    timestamp = pd.to_datetime(result.get('timestamp'), utc=True).to_pydatetime()
+    if environment_name is None:
+        raise ValueError('Environment name not found in Datapoint')
+    data_jsonl_json = result.get('file', {}).get('data')
+    if data_jsonl_json is None:
+        logger.warn('No UWB data returned')
+        return []
+    data_lists = dict()
+    for datum in decode_wrapped_jsonl(data_jsonl_json, dicts_only=True):
+        data_type = datum.get('type')
+        if data_type in SUPPORTED_CUWB_DATA_TYPES:
+            if data_type not in data_lists.keys():
+                data_lists[data_type] = list()
+            data_lists[data_type].append(datum)
     return data_lists, environment_name, timestamp
 
 # Used by:
@@ -3496,26 +3954,9 @@ def fetch_uwb_data_data_id(
         client_id=client_id,
         client_secret=client_secret
     )
-    result=client.request(
-        request_type='query',
-        request_name='getDatapoint',
-        arguments={
-            'data_id': {
-                'type': 'ID!',
-                'value': data_id
-            }
-        },
-        return_object = [
-            'timestamp',
-            {'source': [
-                {'... on Assignment': [
-                    'assignment_id'
-                ]}
-            ]},
-            {'file': [
-                'data'
-            ]}
-        ]
+    result = fetch_datapoint_file_data(
+        data_id=data_id,
+        client=client
     )
     datapoint_timestamp=honeycomb_io.utils.from_honeycomb_datetime(result.get('timestamp'))
     assignment_id=result.get('source', {}).get('assignment_id')
@@ -3523,23 +3964,7 @@ def fetch_uwb_data_data_id(
     if data_jsonl_json is None:
         logger.warn('No UWB data returned')
         return pd.DataFrame()
-    try:
-        data_jsonl = json.loads(data_jsonl_json)
-    except:
-        raise ValueError('Expected JSONL wrapped as JSON, but JSON deserialization failed')
-    if not isinstance(data_jsonl, str):
-        raise ValueError('Expected JSONL but got type \'{}\''.format(type(data_jsonl)))
-    data_dict_list = list()
-    for data_jsonl_line in data_jsonl.split('\n'):
-        if len(data_jsonl_line) == 0:
-            continue
-        try:
-            data_dict_list.append(json.loads(data_jsonl_line))
-        except:
-            logger.warn('Encountered malformed JSONL line. Omitting: {}'.format(
-                data_jsonl_line
-            ))
-            continue
+    data_dict_list = decode_wrapped_jsonl(data_jsonl_json)
     df = pd.DataFrame(data_dict_list)
     original_columns = df.columns.tolist()
     df['assignment_id'] = assignment_id
@@ -3596,6 +4021,9 @@ def fetch_uwb_data_ids(
     datapoint_timestamp_max,
     assignment_ids,
     chunk_size=100,
+    time_window_size=None,
+    target_rows_per_window=None,
+    max_workers=None,
     client=None,
     uri=None,
     token_uri=None,
@@ -3611,11 +4039,14 @@ def fetch_uwb_data_ids(
     return_data = [
         'data_id'
     ]
-    result = honeycomb_io.core.search_objects(
+    result = honeycomb_io.core.search_objects_by_time_window(
         object_name='Datapoint',
         query_list=query_list,
         return_data=return_data,
         chunk_size=chunk_size,
+        window_size=time_window_size,
+        target_rows_per_window=target_rows_per_window,
+        max_workers=max_workers,
         client=client,
         uri=uri,
         token_uri=token_uri,
@@ -19,6 +19,19 @@ BASE_DEPENDENCIES = [
     'inflection>=0.5.1'
 ]
 
+# Optional dependencies (install with 'pip install wf-honeycomb-io[EXTRA_NAME]')
+EXTRA_DEPENDENCIES = {
+    'aio': [
+        'aiohttp>=3.8'
+    ],
+    'orjson': [
+        'orjson>=3.6'
+    ],
+    'arrow': [
+        'pyarrow>=8.0'
+    ]
+}
+
 # TEST_DEPENDENCIES = [
 # ]
 
@@ -43,6 +56,7 @@ setup(
     author='Theodore Quinn',
     author_email='ted.quinn@wildflowerschools.org',
     install_requires=BASE_DEPENDENCIES,
+    extras_require=EXTRA_DEPENDENCIES,
     # tests_require=TEST_DEPENDENCIES,
     # extras_require = {
     #     'test': TEST_DEPENDENCIES,
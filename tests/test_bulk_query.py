@@ -0,0 +1,77 @@
+import honeycomb_io.core
+import honeycomb_io.testing
+import os
+import pytest
+
+NUM_DEVICES = 50
+
+@pytest.fixture
+def server():
+    with honeycomb_io.testing.StandInHoneycombServer() as server:
+        server.honeycomb.insert_many('Device', [
+            {'device_id': 'device-{:02}'.format(device_index), 'name': 'Device {}'.format(device_index)}
+            for device_index in range(NUM_DEVICES)
+        ])
+        yield server
+
+def fail_on_request(server, failing_request_index):
+    resolve_endpoint = server.honeycomb.resolve_endpoint
+    request_indices = iter(range(1000))
+    def failing_resolve_endpoint(endpoint_name, arguments):
+        if next(request_indices) == failing_request_index:
+            raise honeycomb_io.testing.StandInError('Simulated failure')
+        return resolve_endpoint(endpoint_name, arguments)
+    server.honeycomb.resolve_endpoint = failing_resolve_endpoint
+    return resolve_endpoint
+
+def fetch_devices(client, checkpoint_path=None):
+    return honeycomb_io.core.bulk_query(
+        request_name='devices',
+        return_data=['device_id', 'name'],
+        id_field_name='device_id',
+        chunk_size=10,
+        checkpoint_path=checkpoint_path,
+        client=client
+    )
+
+def test_bulk_query_resumes_with_full_result(server, tmp_path):
+    client = server.generate_client()
+    checkpoint_path = str(tmp_path / 'devices.jsonl')
+    uninterrupted_result = fetch_devices(client)
+    assert len(uninterrupted_result) == NUM_DEVICES
+    resolve_endpoint = fail_on_request(server, 3)
+    with pytest.raises(Exception):
+        fetch_devices(client, checkpoint_path=checkpoint_path)
+    assert os.path.exists(checkpoint_path)
+    server.honeycomb.resolve_endpoint = resolve_endpoint
+    assert fetch_devices(client, checkpoint_path=checkpoint_path) == uninterrupted_result
+    assert not os.path.exists(checkpoint_path)
+
+def test_iter_bulk_query_resumes_after_consumed_pages(server, tmp_path):
+    client = server.generate_client()
+    checkpoint_path = str(tmp_path / 'devices.jsonl')
+    uninterrupted_result = fetch_devices(client)
+    resolve_endpoint = fail_on_request(server, 3)
+    consumed = list()
+    with pytest.raises(Exception):
+        for datum in honeycomb_io.core.iter_bulk_query(
+            request_name='devices',
+            return_data=['device_id', 'name'],
+            id_field_name='device_id',
+            chunk_size=10,
+            checkpoint_path=checkpoint_path,
+            client=client
+        ):
+            consumed.append(datum)
+    assert len(consumed) == 30
+    server.honeycomb.resolve_endpoint = resolve_endpoint
+    consumed.extend(honeycomb_io.core.iter_bulk_query(
+        request_name='devices',
+        return_data=['device_id', 'name'],
+        id_field_name='device_id',
+        chunk_size=10,
+        checkpoint_path=checkpoint_path,
+        client=client
+    ))
+    assert consumed == uninterrupted_result
+    assert not os.path.exists(checkpoint_path)
@@ -0,0 +1,45 @@
+import asyncio
+import honeycomb_io.aio
+import honeycomb_io.cache
+import honeycomb_io.core
+import honeycomb_io.testing
+import pytest
+
+@pytest.fixture
+def server():
+    with honeycomb_io.testing.StandInHoneycombServer() as server:
+        server.set_environment_variables()
+        server.honeycomb.insert_many('Device', [{'device_id': 'device-00', 'name': 'Device 0'}])
+        honeycomb_io.cache.enable_cache()
+        yield server
+    honeycomb_io.cache.disable_cache()
+
+def fetch_device_names(client):
+    return sorted(device['name'] for device in honeycomb_io.core.search_objects(
+        object_name='Device',
+        query_list=list(),
+        return_data=['device_id', 'name'],
+        client=client
+    ))
+
+def test_bulk_mutation_invalidates_cache(server):
+    client = server.generate_client()
+    assert fetch_device_names(client) == ['Device 0']
+    assert fetch_device_names(client) == ['Device 0']
+    honeycomb_io.core.bulk_mutation(
+        request_name='createDevice',
+        arguments={'device': {'type': 'DeviceInput', 'value': [{'name': 'Device 1'}]}},
+        return_object=['device_id'],
+        object_name='Device',
+        client=client
+    )
+    assert fetch_device_names(client) == ['Device 0', 'Device 1']
+
+def test_async_create_objects_invalidates_cache(server):
+    client = server.generate_client()
+    assert fetch_device_names(client) == ['Device 0']
+    asyncio.run(honeycomb_io.aio.create_objects(
+        object_name='Device',
+        data=[{'name': 'Device 1'}]
+    ))
+    assert fetch_device_names(client) == ['Device 0', 'Device 1']
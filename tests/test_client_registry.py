@@ -0,0 +1,18 @@
+import honeycomb_io.core
+import honeycomb_io.testing
+import pytest
+
+@pytest.fixture
+def server():
+    with honeycomb_io.testing.StandInHoneycombServer() as server:
+        server.set_environment_variables()
+        honeycomb_io.core.clear_client_registry()
+        yield server
+    honeycomb_io.core.clear_client_registry()
+
+def test_registry_keys_on_all_credentials(server):
+    client = honeycomb_io.core.fetch_registered_client()
+    assert honeycomb_io.core.fetch_registered_client() is client
+    assert honeycomb_io.core.fetch_registered_client(client_secret='other-secret') is not client
+    assert honeycomb_io.core.fetch_registered_client(token_uri='https://other.example.com/oauth/token') is not client
+    assert honeycomb_io.core.client_registry_stats() == {'clients': 3, 'hits': 1, 'misses': 3}
@@ -0,0 +1,64 @@
+import honeycomb_io.core
+import honeycomb_io.introspection
+import honeycomb_io.schema
+import honeycomb_io.testing
+import pytest
+
+@pytest.fixture
+def servers():
+    with honeycomb_io.testing.StandInHoneycombServer() as server, honeycomb_io.testing.StandInHoneycombServer() as other_server:
+        server.honeycomb.seed(
+            num_uwb_tags=2,
+            num_position_rows=10,
+            num_imu_rows=0,
+            num_uwb_datapoints=1,
+            uwb_rows_per_datapoint=10,
+            num_pose_2d_rows=0,
+            num_material_interactions=0
+        )
+        yield server, other_server
+    honeycomb_io.introspection.disable_schema_introspection()
+
+def test_schema_is_introspected_from_stand_in(servers, tmp_path):
+    server, other_server = servers
+    client = server.generate_client()
+    schema = honeycomb_io.introspection.enable_schema_introspection(
+        cache_path=str(tmp_path / 'schema.json'),
+        client=client
+    )
+    assert schema.endpoint_name('Pose2D', 'search') == 'searchPoses2D'
+    assert schema.input_argument('assignToPosition') == ('positionAssignment', 'PositionAssignmentInput!')
+    assert schema.id_field_name('Datapoint') == 'data_id'
+    schema.validate_return_data('Assignment', [
+        'assignment_id',
+        {'assigned': [
+            {'... on Device': ['device_id']},
+            {'... on Person': ['person_id']}
+        ]}
+    ])
+    with pytest.raises(ValueError):
+        honeycomb_io.core.search_objects(
+            object_name='Device',
+            query_list=list(),
+            return_data=['no_such_field'],
+            client=client
+        )
+
+def test_schema_is_only_used_for_its_server(servers, tmp_path):
+    server, other_server = servers
+    client = server.generate_client()
+    other_client = other_server.generate_client()
+    schema = honeycomb_io.introspection.enable_schema_introspection(
+        cache_path=str(tmp_path / 'schema.json'),
+        client=client
+    )
+    assert honeycomb_io.introspection.introspected_schema(client=client) is schema
+    assert honeycomb_io.introspection.introspected_schema(client=other_client) is None
+    assert honeycomb_io.core.search_objects(
+        object_name='Device',
+        query_list=list(),
+        return_data=['no_such_field'],
+        client=other_client
+    ) == list()
+    honeycomb_io.introspection.disable_schema_introspection(client=client)
+    assert honeycomb_io.introspection.introspected_schema(client=client) is None
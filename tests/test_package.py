@@ -0,0 +1,46 @@
+import honeycomb_io
+import honeycomb_io._generate_attribute_index
+import importlib
+import subprocess
+import sys
+import pytest
+
+def run_in_fresh_interpreter(code):
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.split()
+
+def test_import_loads_no_submodules_or_boto3():
+    loaded_modules = run_in_fresh_interpreter(
+        'import sys, honeycomb_io; print(*[name for name in sys.modules if name == "boto3" or name.startswith("honeycomb_io.")])'
+    )
+    assert loaded_modules == ['honeycomb_io._attribute_index']
+
+def test_function_import_loads_only_its_submodule():
+    loaded_modules = run_in_fresh_interpreter(
+        'import sys; from honeycomb_io import fetch_environment_id; print(*[name for name in sys.modules if name == "boto3" or name.startswith("honeycomb_io.")])'
+    )
+    assert 'boto3' not in loaded_modules
+    assert 'honeycomb_io.environments' in loaded_modules
+    assert 'honeycomb_io.uwb_data' not in loaded_modules
+
+def test_unknown_attribute_loads_no_submodules():
+    loaded_modules = run_in_fresh_interpreter(
+        'import sys, honeycomb_io; print(hasattr(honeycomb_io, "no_such_function")); print(*[name for name in sys.modules if name.startswith("honeycomb_io.")])'
+    )
+    assert loaded_modules == ['False', 'honeycomb_io._attribute_index']
+
+def test_attribute_index_is_up_to_date():
+    with open(honeycomb_io._generate_attribute_index.ATTRIBUTE_INDEX_PATH) as fp:
+        assert fp.read() == honeycomb_io._generate_attribute_index.attribute_index_source()
+
+@pytest.mark.parametrize('submodule_name', honeycomb_io._SUBMODULES)
+def test_indexed_names_resolve(submodule_name):
+    submodule = importlib.import_module('honeycomb_io.{}'.format(submodule_name))
+    for name in honeycomb_io._SUBMODULE_ATTRIBUTES[submodule_name]:
+        assert hasattr(submodule, name)
+        if honeycomb_io._ATTRIBUTE_SUBMODULES[name] == submodule_name:
+            assert getattr(honeycomb_io, name) is getattr(submodule, name)
@@ -0,0 +1,40 @@
+import honeycomb_io.core
+import honeycomb_io.testing
+import minimal_honeycomb
+import pytest
+
+@pytest.fixture
+def server():
+    with honeycomb_io.testing.StandInHoneycombServer() as server:
+        server.honeycomb.insert_many('Device', [{'device_id': 'device-00', 'name': 'Device 0'}])
+        yield server
+    honeycomb_io.core.clear_request_hooks()
+
+def fetch_devices(client):
+    return honeycomb_io.core.search_objects(
+        object_name='Device',
+        query_list=list(),
+        return_data=['device_id', 'name'],
+        client=client
+    )
+
+def test_caller_client_is_not_modified(server):
+    client = minimal_honeycomb.MinimalHoneycombClient(**server.client_arguments())
+    graphql_client = client.client
+    events = list()
+    honeycomb_io.core.register_request_hook(events.append)
+    assert len(fetch_devices(client)) == 1
+    assert client.client is graphql_client
+    assert 'execute' not in vars(graphql_client)
+    assert len(events) > 0
+    assert all(event['retries'] == 0 for event in events)
+
+def test_client_without_tenacity_retry_is_called_directly(server):
+    client = minimal_honeycomb.MinimalHoneycombClient(**server.client_arguments())
+    execute = client.client.execute
+    client.client.execute = lambda *args, **kwargs: execute(*args, **kwargs)
+    events = list()
+    honeycomb_io.core.register_request_hook(events.append)
+    assert len(fetch_devices(client)) == 1
+    assert len(events) > 0
+    assert all(event['retries'] is None and event['error'] is None for event in events)